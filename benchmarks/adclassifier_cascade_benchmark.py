@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the AdClassifier rule-only cascade.
+
+Classifies a labelled sample twice with the same model: with every item going
+through the model, and with cascade=True, where items with decisive rule
+evidence or too short to classify are decided without a forward pass. The
+script reports the model inputs (chunks) avoided, the agreement of the cascade
+with the full model and, when labels are given, the accuracy of both.
+
+Items are read from JSONL files with a "ft" (full text) field, an optional
+"lg" (language) field and an optional label field ("ad"/"non-ad", or a
+boolean). Without input files, a small built-in labelled sample is used.
+
+Usage:
+    python benchmarks/adclassifier_cascade_benchmark.py [ITEMS ...] [--label-field F]
+
+Example:
+    python benchmarks/adclassifier_cascade_benchmark.py ads-sample.jsonl --label-field is_ad
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from impresso_pipelines.adclassifier import AdClassifierPipeline
+
+SAMPLE_ITEMS: List[Dict[str, Any]] = [
+    {"ft": "À vendre: Belle villa 5 pièces, 150m², CHF 850'000.-. Tél. 021 123 45 67", "lg": "fr", "type": "ad"},
+    {"ft": "Zu verkaufen: Klavier, gut erhalten, Preis Fr. 450.-. Tel. 044 211 22 33", "lg": "de", "type": "ad"},
+    {"ft": "A louer appartement de 3 pièces, loyer Fr. 80.- par mois. S'adresser Rue du Marché 4, 1204 Genève.", "lg": "fr", "type": "ad"},
+    {"ft": "Zimmer zu vermieten. Offerten unter Chiffre Z 567 an die Expedition.", "lg": "de", "type": "ad"},
+    {"ft": "Perdu une montre en or. La rapporter contre récompense au bureau du journal.", "lg": "fr", "type": "ad"},
+    {"ft": "Le Conseil fédéral a décidé, dans sa séance d'hier, de soumettre à l'Assemblée fédérale un projet d'arrêté concernant l'achat du chemin de fer.", "lg": "fr", "type": "non-ad"},
+    {"ft": "Die Bundesversammlung hat gestern die Vorlage über den Rückkauf der Eisenbahnen mit 98 gegen 31 Stimmen angenommen.", "lg": "de", "type": "non-ad"},
+    {"ft": "D'Regierung huet haut de Moien annoncéiert, datt d'Stroossen am Norden vum Land nees op sinn.", "lg": "lb", "type": "non-ad"},
+    {"ft": "", "lg": "fr", "type": "non-ad"},
+    {"ft": "— 12 —", "lg": "fr", "type": "non-ad"},
+]
+
+
+def read_items(paths: List[str]) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            items.extend(json.loads(line) for line in f if line.strip())
+    return items
+
+
+def is_ad_label(value: Any) -> Optional[bool]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.lower() in ("ad", "ads", "1", "true", "promotion")
+    return bool(value)
+
+
+def classify(pipeline: AdClassifierPipeline, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    pipeline.cascade_stats = dict.fromkeys(pipeline.cascade_stats, 0)
+    start = time.perf_counter()
+    results = pipeline(items)
+    return {
+        "predictions": [result["type"] == "ad" for result in results],
+        "seconds": time.perf_counter() - start,
+        "stats": dict(pipeline.cascade_stats),
+    }
+
+
+def main(args: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("items", nargs="*", help="JSONL files with items")
+    parser.add_argument("--label-field", default="type", help="Field holding the label (default: %(default)s)")
+    parser.add_argument("--batch-size", type=int, default=16, help="Model batch size")
+    parser.add_argument("--rule-score", type=float, default=5.5, help="cascade_rule_score")
+    parser.add_argument("--max-words", type=int, default=100, help="cascade_max_words")
+    parser.add_argument("--min-words", type=int, default=3, help="cascade_min_words")
+    options = parser.parse_args(args)
+
+    items = read_items(options.items) if options.items else SAMPLE_ITEMS
+    labels = [is_ad_label(item.get(options.label_field)) for item in items]
+    pipeline = AdClassifierPipeline(
+        batch_size=options.batch_size,
+        cascade_rule_score=options.rule_score,
+        cascade_max_words=options.max_words,
+        cascade_min_words=options.min_words,
+    )
+
+    pipeline.cascade = False
+    full = classify(pipeline, items)
+    pipeline.cascade = True
+    cascade = classify(pipeline, items)
+
+    stats = cascade["stats"]
+    chunks = len([ids for prepared in pipeline._prepare_items(items) for ids in prepared.input_ids])
+    agreement = sum(a == b for a, b in zip(full["predictions"], cascade["predictions"]))
+    print(f"items: {len(items)}, chunks: {chunks}")
+    print(
+        f"decided without model: {stats['rule_ads']} rule ads,"
+        f" {stats['short_non_ads']} short non-ads"
+        f" | model inputs (chunks) avoided: {stats['skipped_chunks']}/{chunks}"
+        f" ({stats['skipped_chunks'] / max(chunks, 1):.1%})"
+    )
+    print(f"agreement with full model: {agreement}/{len(items)} ({agreement / max(len(items), 1):.1%})")
+
+    labelled = [i for i, label in enumerate(labels) if label is not None]
+    for name, run in (("full model", full), ("cascade", cascade)):
+        line = f"{name:>10}: {run['seconds'] * 1e3:8.1f} ms"
+        if labelled:
+            correct = sum(run["predictions"][i] == labels[i] for i in labelled)
+            line += f" | accuracy {correct}/{len(labelled)} ({correct / len(labelled):.1%})"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
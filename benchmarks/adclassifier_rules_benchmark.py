@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the AdClassifier rule-based features.
+
+Compares rule_flags(), which scans a text once with RuleScanner and stops as
+soon as every feature is found, against the previous implementation, which
+ran the seven feature regexes (PHONE, PRICE, AREA, ROOMS_FR, CUES, ADDRESS,
+ZIP_CH) one after the other over the whole text. The script first checks that
+both return identical flags for every item, then times them on whole pages and
+on the individual items of classified-ad pages, as the pipeline sees them.
+
+Items are read from the given text files, one item per file, or from JSONL
+files with a "ft" (full text) field per line, as in impresso rebuilt data.
+Without input files, a small built-in sample of classified ads, news and
+OCR noise is used.
+
+Usage:
+    python benchmarks/adclassifier_rules_benchmark.py [ITEMS ...] [--repeat N]
+
+Example:
+    python benchmarks/adclassifier_rules_benchmark.py GDL-1900-*.jsonl --repeat 5
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from impresso_pipelines.adclassifier.adclassifier_pipeline import (
+    ADDRESS,
+    AREA,
+    CUES,
+    PHONE,
+    PRICE,
+    ROOMS_FR,
+    ZIP_CH,
+    normalize_text,
+    rule_flags,
+)
+
+SAMPLE_ADS: List[str] = [
+    "À vendre: Belle villa 5 pièces, 150m², jardin arborisé, CHF 850'000.-."
+    " Tél. 021 123 45 67, Rue de la Paix 12, 1000 Lausanne.",
+    "Zu verkaufen: Klavier, gut erhalten, Preis Fr. 450.-. Adresse:"
+    " Bahnhofstr. 12, 8001 Zürich, Tel. 044 211 22 33.",
+    "On demande une jeune fille sérieuse pour aider au ménage. S'adresser sous"
+    " chiffres H 1234 L à Haasenstein & Vogler, Genève.",
+    "A louer pour le 24 juin, bel appartement de 4 pièces, chambre de bain,"
+    " balcon, vue sur le lac. Loyer modéré. S'adresser Avenue de la Gare 3.",
+    "Gelegenheit! Schönes Zimmer mit Pension an soliden Herrn zu vermieten."
+    " Offerten unter Chiffre Z 567 an die Expedition dieses Blattes.",
+    "Perdu dimanche soir, entre Neuchâtel et Serrières, une montre en or."
+    " La rapporter contre bonne récompense au bureau du journal.",
+]
+SAMPLE_NEWS: List[str] = [
+    "CONFÉDÉRATION SUISSE. — Le Conseil fédéral a décidé, dans sa séance d'hier,"
+    " de soumettre à l'Assemblée fédérale un projet d'arrêté concernant l'achat"
+    " du chemin de fer du Jura-Simplon. L'opinion publique n'est pas unanime.",
+    "Die Bundesversammlung hat gestern die Vorlage über den Rückkauf der Eisen-"
+    "bahnen mit 98 gegen 31 Stimmen angenommen. Der Bundesrath wird ersucht, die"
+    " nöthigen Maßnahmen zu treffen.",
+]
+SAMPLE_NOISE: List[str] = [
+    "1 2 3 4 5 6 7 8 9 0 11 22 333 4444 55555 0000 12 34 56 78 90 .- , ; '"
+    " 1899 1900 0 00 000 0000 00000 123 456 789 012 345 678 901 234 567 890",
+]
+
+
+def legacy_rule_flags(t: str) -> Dict[str, Any]:
+    """rule_flags() before RuleScanner, kept as a reference."""
+    return {
+        "has_phone": bool(PHONE.search(t)),
+        "has_price": bool(PRICE.search(t)),
+        "has_area": bool(AREA.search(t)),
+        "has_rooms": bool(ROOMS_FR.search(t)),
+        "has_cue": bool(CUES.search(t)),
+        "has_address": bool(ADDRESS.search(t)),
+        "has_zip": bool(ZIP_CH.search(t)),
+        "len_words": len(t.split()),
+    }
+
+
+def sample_items() -> Dict[str, List[str]]:
+    ad_page = " ".join(SAMPLE_ADS * 20)
+    news_page = " ".join(SAMPLE_NEWS * 60)
+    noise_page = " ".join(SAMPLE_NOISE * 20 + SAMPLE_NEWS * 20)
+    return {
+        "ad items": SAMPLE_ADS * 200,
+        "ad pages": [ad_page] * 10,
+        "news pages": [news_page] * 10,
+        "noisy pages": [noise_page] * 10,
+    }
+
+
+def read_items(paths: List[str]) -> List[str]:
+    items: List[str] = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            if path.endswith(".jsonl"):
+                items.extend(json.loads(line).get("ft", "") for line in f if line.strip())
+            else:
+                items.append(f.read())
+    return [item for item in items if item]
+
+
+def best_time(func: Callable[[str], Dict[str, Any]], items: List[str], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(args: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("items", nargs="*", help="Text or JSONL files with items")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is kept)")
+    options = parser.parse_args(args)
+
+    samples = {"items": read_items(options.items)} if options.items else sample_items()
+    samples = {
+        label: [normalize_text(item) for item in items] for label, items in samples.items()
+    }
+
+    mismatches = sum(
+        rule_flags(item) != legacy_rule_flags(item)
+        for items in samples.values()
+        for item in items
+    )
+    print(f"items: {sum(map(len, samples.values()))}, mismatches: {mismatches}")
+    if mismatches:
+        return 1
+
+    for label, items in samples.items():
+        legacy_time = best_time(legacy_rule_flags, items, options.repeat)
+        current_time = best_time(rule_flags, items, options.repeat)
+        print(
+            f"{label:>12}: legacy {legacy_time * 1e3:8.1f} ms"
+            f" | current {current_time * 1e3:8.1f} ms"
+            f" | speedup {legacy_time / current_time:4.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the OCRQA v2 normalization and tokenizer.
+
+Compares the precompiled single-pass V2Tokenizer against the previous
+implementation, which compiled the tokenization pattern on every call and ran
+an extra regex match per token to split possessives, and the single-pass
+normalize_text() against the previous one, which protected word-internal
+apostrophes and hyphens with a regex substitution before translating. The
+script first checks that both produce identical output for every page, then
+times normalization, tokenization alone (on normalized text) and the full
+subtokens() call.
+
+Pages are read from the given text files, one page per file, or from JSONL
+files with a "ft" (full text) field per line, as in impresso rebuilt data.
+Without input files, a small built-in sample of OCR'd newspaper text is used.
+
+Usage:
+    python benchmarks/ocrqa_tokenizer_benchmark.py [PAGES ...] [--repeat N]
+
+Example:
+    python benchmarks/ocrqa_tokenizer_benchmark.py GDL-1900-*.jsonl --repeat 5
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+import unicodedata
+from typing import Callable, List
+
+from impresso_pipelines.ocrqa.ocrqa_pipeline import (
+    _V2_APOSTROPHES,
+    _V2_HYPHENS,
+    _V2_NORMALIZATION_TABLE,
+    _V2_PRIVATE_CHAR_APOSTROPHE,
+    _V2_PRIVATE_CHAR_HYPHEN,
+    V2Tokenizer,
+    normalize_text,
+    subtokens,
+)
+
+SAMPLE_PAGES: List[str] = [
+    "CONFÉDÉRATION SUISSE. — Le Conseil fédéral a décidé, dans sa séance d'hier,"
+    " de soumettre à l'Assemblée fédérale un projet d'arrêté concernant l'achat"
+    " du chemin de fer du Jura-Simplon. Il s'agit d'une dépense de 85,000,000 fr."
+    " qu'il juge nécessaire ; l'opinion publique n'est pas unanime. ~~ Les jour-"
+    " naux de la Suisse allemande s'en occupent longuement. □□□ Qu'en sera-t-il ?",
+    "Die Bundesversammlung hat gestern die Vorlage über den Rückkauf der Eisen-"
+    "bahnen mit 98 gegen 31 Stimmen angenommen. Der Bundesrath wird ersucht, die"
+    " nöthigen Maßnahmen zu treffen. — Aus dem Kanton Zürich wird gemeldet, daß"
+    " die Ernte dieses Jahr sehr gut ausgefallen ist. ### Inserate ### Zu ver-"
+    " kaufen: ein gut erhaltenes Klavier, Preis Fr. 450. —. Adresse: Bahnhofstr. 12.",
+    "LATEST TELEGRAMS. It's reported from London that the Government's proposal"
+    " has been well-received; what's more, the Opposition's leader said he's"
+    " prepared to support it. The mother-in-law of the Duke didn't attend. ..."
+    " Shipping News: the s.s. Campania arrived at New York at 10.30 a.m. ___",
+    "D'Regierung huet haut de Moien annoncéiert, datt d'Stroossen am Norden vum"
+    " Land nees op sinn. Et ass e gudde Wanter fir d'Baueren gewiescht, huet de"
+    " Minister gesot. ’t gëtt och eng nei Schoul zu Ettelbréck gebaut.",
+]
+
+
+def legacy_v2_normalize(text: str) -> str:
+    """v2 branch of normalize_text() before the single-pass version, kept as a reference."""
+    text = unicodedata.normalize("NFKC", text)
+    char_to_private = {char: _V2_PRIVATE_CHAR_APOSTROPHE for char in _V2_APOSTROPHES} | {
+        char: _V2_PRIVATE_CHAR_HYPHEN for char in _V2_HYPHENS
+    }
+    apostrophe_pattern = "[" + re.escape("".join(_V2_APOSTROPHES)) + "]"
+    hyphen_pattern = "[" + re.escape("".join(_V2_HYPHENS)) + "]"
+    combined_pattern = (
+        r"(?<=[^\W_])(" + apostrophe_pattern + "|" + hyphen_pattern + r")(?=[^\W_])"
+    )
+    text = re.sub(combined_pattern, lambda m: char_to_private[m.group(1)], text)
+    return text.translate(_V2_NORMALIZATION_TABLE)
+
+
+def legacy_v2_tokenize(text: str) -> List[str]:
+    """Tokenizer of subtokens() before V2Tokenizer, kept as a reference."""
+    tokenization_pattern = re.compile(
+        r"""
+        \b [^\W_] '
+        (?=[^\W_])
+        |
+        [^\W_]+
+        (?: ['-] [^\W_]+ )*
+        |
+        _+
+        |
+        ([^\w\s]) \1*
+    """,
+        re.UNICODE | re.VERBOSE,
+    )
+    tokens = [match.group(0) for match in tokenization_pattern.finditer(text)]
+    processed_tokens = []
+    for token in tokens:
+        match = re.match(r"^(.+)'([^\W_])$", token, re.UNICODE)
+        if match:
+            processed_tokens.append(match.group(1))
+            processed_tokens.append("'" + match.group(2))
+        else:
+            processed_tokens.append(token)
+    return processed_tokens
+
+
+def legacy_subtokens(text: str, version: str) -> List[str]:
+    return legacy_v2_tokenize(legacy_v2_normalize(text.lower()))
+
+
+def read_pages(paths: List[str]) -> List[str]:
+    pages: List[str] = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            if path.endswith(".jsonl"):
+                pages.extend(json.loads(line).get("ft", "") for line in f if line.strip())
+            else:
+                pages.append(f.read())
+    return [page for page in pages if page]
+
+
+def best_time(func: Callable[[str], List[str]], pages: List[str], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            func(page)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(args: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("pages", nargs="*", help="Text or JSONL files with pages")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is kept)")
+    parser.add_argument("--version", default="2.0.0", help="v2 BloomFilter version for normalization")
+    options = parser.parse_args(args)
+    if not options.version.startswith("2."):
+        parser.error("the legacy reference implementations are v2 only")
+
+    pages = read_pages(options.pages) if options.pages else SAMPLE_PAGES * 200
+    tokenizer = V2Tokenizer()
+    normalized = [normalize_text(page.lower(), options.version) for page in pages]
+
+    mismatches = sum(
+        normalize_text(page, options.version) != legacy_v2_normalize(page) for page in pages
+    )
+    mismatches += sum(tokenizer(page) != legacy_v2_tokenize(page) for page in normalized)
+    mismatches += sum(
+        subtokens(page, options.version) != legacy_subtokens(page, options.version)
+        for page in pages
+    )
+    token_count = sum(len(tokenizer(page)) for page in normalized)
+    print(f"pages: {len(pages)}, tokens: {token_count}, mismatches: {mismatches}")
+    if mismatches:
+        return 1
+
+    for label, legacy, current, inputs in (
+        (
+            "normalize",
+            legacy_v2_normalize,
+            lambda page: normalize_text(page, options.version),
+            pages,
+        ),
+        ("tokenize", legacy_v2_tokenize, tokenizer, normalized),
+        (
+            "subtokens",
+            lambda page: legacy_subtokens(page, options.version),
+            lambda page: subtokens(page, options.version),
+            pages,
+        ),
+    ):
+        legacy_time = best_time(legacy, inputs, options.repeat)
+        current_time = best_time(current, inputs, options.repeat)
+        print(
+            f"{label:>10}: legacy {legacy_time * 1e3:8.1f} ms"
+            f" | current {current_time * 1e3:8.1f} ms"
+            f" | speedup {legacy_time / current_time:4.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
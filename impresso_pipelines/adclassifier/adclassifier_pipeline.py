@@ -7,7 +7,9 @@ XLM-RoBERTa model combined with rule-based features and adaptive thresholding.
 
 import re
 import math
-from typing import Union, List, Dict, Any, Optional
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Union, List, Dict, Any, Optional, Iterable, Iterator, Tuple
 import numpy as np
 import torch
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
@@ -36,6 +38,38 @@ def chunk_words(text: str, max_words: int):
         yield " ".join(ws[i:i+max_words])
 
 
+WORD = re.compile(r"\S+")
+
+
+class PreparedItem:
+    """
+    An input item normalized and tokenized once, split into model chunks.
+
+    Attributes:
+        item: The input dictionary
+        text: Normalized text, shared by the model and the rule features
+        n_words: Number of whitespace-separated words of text
+        input_ids: Token ids of each chunk, with special tokens
+        chunk_lens: Number of words of each chunk (for weighted pooling)
+    """
+
+    __slots__ = ("item", "text", "n_words", "input_ids", "chunk_lens")
+
+    def __init__(
+        self,
+        item: Dict[str, Any],
+        text: str,
+        n_words: int,
+        input_ids: List[List[int]],
+        chunk_lens: List[int],
+    ):
+        self.item = item
+        self.text = text
+        self.n_words = n_words
+        self.input_ids = input_ids
+        self.chunk_lens = chunk_lens
+
+
 # Rule-based patterns
 PHONE = re.compile(r"(?:\+?\d{2,3}[\s./-]?)?(?:\(?0\d{1,3}\)?[\s./-]?)\d(?:[\d\s./-]{5,})")
 PRICE = re.compile(
@@ -53,19 +87,86 @@ CUES = re.compile(fr"\b(?:{CUES_FR}|{CUES_DE}|{CUES_LB})\b", re.I)
 ADDRESS = re.compile(r"\b(Rue|Av\.?|Avenue|Platz|Str\.?|Strasse|Grand'Rue|Place)\b", re.I)
 ZIP_CH = re.compile(r"\b\d{4}\b")
 
+# Reduced forms of the patterns above, used by RuleScanner. Rule features only
+# test whether a pattern occurs, so optional prefixes and suffixes are dropped
+# and repetitions cut to their minimum: each reduced pattern matches somewhere
+# in a text exactly when the full one does, without backtracking over long
+# digit runs.
+_CURRENCY = r"(?:CHF|SFr\.?|Fr\.?|€|\$|USD|EUR)"
+RULE_FEATURES: Dict[str, str] = {
+    "has_phone": r"0\d{1,3}\)?[\s./-]?\d[\d\s./-]{5}",
+    "has_price": fr"(?i:{_CURRENCY}\s?\d|\d\s?{_CURRENCY})",
+    "has_area": AREA.pattern,
+    "has_rooms": r"(?i:\b\d{1,2}\s?pi[eè]ce?s?\b)",
+    "has_cue": fr"(?i:\b(?:{CUES_FR}|{CUES_DE}|{CUES_LB})\b)",
+    "has_address": r"(?i:\b(?:Rue|Av\.?|Avenue|Platz|Str\.?|Strasse|Grand'Rue|Place)\b)",
+    "has_zip": ZIP_CH.pattern,
+}
+# First characters of all RULE_FEATURES matches: lets the regex engine skip
+# other positions without trying every alternative
+RULE_FEATURES_START = r"(?=\d|(?i:[acdefgklmoprstuvzàé€$]))"
+
+
+class RuleScanner:
+    """
+    Single-pass scanner of the rule-based features.
+
+    All features still to be found are combined into one alternation of named
+    groups. Each match sets its feature, the others are tested at the same
+    position, and the scan resumes with the remaining features only, so a text
+    is read about once and scanning stops as soon as every feature is found.
+
+    Args:
+        features: Mapping of feature names to regex patterns
+        start: Lookahead matching the first character of any feature match
+    """
+
+    def __init__(
+        self,
+        features: Optional[Dict[str, str]] = None,
+        start: str = RULE_FEATURES_START,
+    ):
+        self.features = dict(features or RULE_FEATURES)
+        self.start = start
+        self.names = tuple(self.features)
+        self.patterns = {name: re.compile(p) for name, p in self.features.items()}
+        self._combined: Dict[Tuple[str, ...], "re.Pattern[str]"] = {}
+
+    def _combined_pattern(self, names: Tuple[str, ...]) -> "re.Pattern[str]":
+        """Return the alternation of the given features, compiled once per set."""
+        pattern = self._combined.get(names)
+        if pattern is None:
+            alternatives = "|".join(f"(?P<{name}>{self.features[name]})" for name in names)
+            pattern = self._combined[names] = re.compile(f"{self.start}(?:{alternatives})")
+        return pattern
+
+    def __call__(self, t: str) -> Dict[str, bool]:
+        """Return whether each feature occurs in the text."""
+        flags = dict.fromkeys(self.names, False)
+        remaining = self.names
+        pos = 0
+        while remaining:
+            match = self._combined_pattern(remaining).search(t, pos)
+            if match is None:
+                break
+            pos = match.start()
+            flags[match.lastgroup] = True
+            for name in remaining:
+                if not flags[name] and self.patterns[name].match(t, pos):
+                    flags[name] = True
+            remaining = tuple(name for name in remaining if not flags[name])
+            pos += 1
+        return flags
+
 
-def rule_flags(t: str) -> Dict[str, Any]:
-    """Extract rule-based features from text."""
-    return {
-        "has_phone": bool(PHONE.search(t)),
-        "has_price": bool(PRICE.search(t)),
-        "has_area": bool(AREA.search(t)),
-        "has_rooms": bool(ROOMS_FR.search(t)),
-        "has_cue": bool(CUES.search(t)),
-        "has_address": bool(ADDRESS.search(t)),
-        "has_zip": bool(ZIP_CH.search(t)),
-        "len_words": len(t.split()),
-    }
+RULE_SCANNER = RuleScanner()
+
+
+def rule_flags(t: str, n_words: Optional[int] = None) -> Dict[str, Any]:
+    """Extract rule-based features from text (n_words: word count, if already known)."""
+    flags: Dict[str, Any] = RULE_SCANNER(t)
+    flags["len_words"] = len(t.split()) if n_words is None else n_words
+    return flags
 
 
 def calculate_rule_score_and_confidence(flags: Dict[str, Any]):
@@ -147,6 +248,8 @@ class AdClassifierPipeline:
         batch_size: int = 16,
         max_length: int = 512,
         chunk_words: int = 0,
+        chunk_tokens: int = 0,
+        chunk_stride: int = 0,
         pool: str = "logits_max",
         ad_threshold: float = 0.9991338849067688,
         lang_thresholds: str = "other:0.9991,fr:0.0755",
@@ -155,6 +258,12 @@ class AdClassifierPipeline:
         temperature: float = 0.8,
         device: Optional[str] = None,
         diagnostics: bool = False,
+        length_bucketing: bool = False,
+        max_batch_tokens: Optional[int] = None,
+        cascade: bool = False,
+        cascade_rule_score: float = 5.5,
+        cascade_max_words: int = 100,
+        cascade_min_words: int = 3,
     ):
         """
         Initialize the ad classification pipeline.
@@ -164,6 +273,10 @@ class AdClassifierPipeline:
             batch_size: Batch size for processing
             max_length: Maximum token length per chunk
             chunk_words: Words per chunk (0 = no chunking)
+            chunk_tokens: Tokens per chunk (0 = no token windows); takes
+                precedence over chunk_words. Windows are capped to max_length
+                including special tokens
+            chunk_stride: Tokens shared by consecutive token windows
             pool: Pooling strategy for chunks
             ad_threshold: Default threshold for ad classification
             lang_thresholds: Language-specific thresholds (e.g., "fr:0.58,de:0.62")
@@ -171,10 +284,33 @@ class AdClassifierPipeline:
             short_bonus: Threshold reduction for short texts
             temperature: Calibration temperature
             device: Device to use ('cuda', 'mps', 'cpu', or None for auto)
+            length_bucketing: Batch chunks by token length, so short texts are
+                not padded to the longest text of their batch (results are
+                returned in input order)
+            max_batch_tokens: With length_bucketing, fill batches up to this
+                number of (padded) tokens instead of batch_size chunks (a
+                ValueError is raised without length_bucketing)
+            cascade: Classify items with decisive rule evidence, or too short
+                to classify, without running the model (see cascade_stats)
+            cascade_rule_score: With cascade, items of at most cascade_max_words
+                words with at least this rule score are ads
+            cascade_max_words: Longest item classified as an ad by rules alone
+            cascade_min_words: With cascade, items with fewer words and no rule
+                feature are non-ads
         """
+        if max_batch_tokens is not None and max_batch_tokens <= 0:
+            raise ValueError(f"max_batch_tokens must be positive, got {max_batch_tokens}")
+        if max_batch_tokens is not None and not length_bucketing:
+            raise ValueError("max_batch_tokens requires length_bucketing=True")
+        if chunk_tokens > 0 and not 0 <= chunk_stride < chunk_tokens:
+            raise ValueError(
+                f"chunk_stride must be in [0, chunk_tokens), got {chunk_stride}"
+            )
         self.batch_size = batch_size
         self.max_length = max_length
         self.chunk_words = chunk_words
+        self.chunk_tokens = chunk_tokens
+        self.chunk_stride = chunk_stride
         self.pool = pool
         self.ad_threshold = ad_threshold
         self.short_len = short_len
@@ -182,6 +318,19 @@ class AdClassifierPipeline:
         self.temperature = temperature
         self.lang_thr_map = parse_lang_thresholds(lang_thresholds) if lang_thresholds else {}
         self.diagnostics = diagnostics
+        self.length_bucketing = length_bucketing
+        self.max_batch_tokens = max_batch_tokens
+        self.cascade = cascade
+        self.cascade_rule_score = cascade_rule_score
+        self.cascade_max_words = cascade_max_words
+        self.cascade_min_words = cascade_min_words
+        # Items classified since creation, and those decided without the model
+        self.cascade_stats = {
+            "items": 0,
+            "rule_ads": 0,
+            "short_non_ads": 0,
+            "skipped_chunks": 0,
+        }
         # Auto-detect device
         if device is None:
             if torch.cuda.is_available():
@@ -193,6 +342,8 @@ class AdClassifierPipeline:
         self.device = device
         # Load model and tokenizer
         self.tokenizer = AutoTokenizer.from_pretrained(model_name, trust_remote_code=True)
+        if not self.tokenizer.is_fast:
+            raise RuntimeError("A fast tokenizer (with offset mappings) is required")
         self.model = AutoModelForSequenceClassification.from_pretrained(
             model_name, trust_remote_code=True
         )
@@ -247,47 +398,166 @@ class AdClassifierPipeline:
         else:
             raise ValueError(f"Unsupported input type: {type(inputs)}")
     
+    def stream(
+        self,
+        items: Iterable[Union[str, Dict[str, Any]]],
+        precision: int = 2,
+        buffer_chunks: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Classify an iterable of texts or items, yielding results as they are ready.
+
+        Items are read lazily, batch_size at a time for tokenization, and
+        classified in groups of about buffer_chunks chunks, so memory stays
+        bounded however long the input is. All chunks of an item are classified
+        in the same group, so multi-chunk items are pooled exactly as with
+        __call__. Results are yielded in input order.
+
+        Args:
+            items: Iterable of text strings or dicts with 'ft' field
+            precision: Number of decimal places for float results (default 2)
+            buffer_chunks: Number of chunks classified at a time (default:
+                8 * batch_size); larger buffers batch better with length_bucketing
+        Returns:
+            An iterator of one result dictionary per item
+        Raises:
+            ValueError: If items is a single text or dict instead of an iterable
+        """
+        if isinstance(items, (str, dict)):
+            raise ValueError(
+                f"stream() expects an iterable of items, got a single {type(items).__name__}"
+            )
+        return self._stream(iter(items), precision, buffer_chunks or 8 * self.batch_size)
+
+    def _stream(
+        self, iterator: Iterator[Union[str, Dict[str, Any]]], precision: int, buffer_chunks: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Generator behind stream(), which validates its arguments eagerly."""
+        buffered = []
+        n_chunks = 0
+        while True:
+            # Tokenize batch_size items at a time in a single tokenizer call
+            group = [
+                {"ft": item} if isinstance(item, str) else item
+                for item in islice(iterator, self.batch_size)
+            ]
+            if not group:
+                break
+            for prepared in self._prepare_items(group):
+                buffered.append(prepared)
+                n_chunks += len(prepared.input_ids)
+                if n_chunks >= buffer_chunks:
+                    yield from self._classify_prepared(buffered, precision)
+                    buffered = []
+                    n_chunks = 0
+        if buffered:
+            yield from self._classify_prepared(buffered, precision)
+
+    def _prepare_items(self, items: List[Dict[str, Any]]) -> List[PreparedItem]:
+        """
+        Normalize and tokenize whole items once, and split them into chunks.
+
+        Chunks are slices of the document encoding: token windows (chunk_tokens),
+        groups of chunk_words words located through the token offsets, or the
+        first max_length tokens. Each chunk gets its own special tokens.
+        """
+        texts = [normalize_text(item.get("ft", "")) for item in items]
+        encodings = self.tokenizer(
+            texts,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            verbose=False,
+        )
+        return [
+            self._chunk_encoding(item, text, ids, offsets)
+            for item, text, ids, offsets in zip(
+                items, texts, encodings["input_ids"], encodings["offset_mapping"]
+            )
+        ]
+
+    def _chunk_encoding(
+        self,
+        item: Dict[str, Any],
+        text: str,
+        ids: List[int],
+        offsets: List[Tuple[int, int]],
+    ) -> PreparedItem:
+        """Split the encoding of a normalized text into model chunks."""
+        max_tokens = self.max_length - self.tokenizer.num_special_tokens_to_add()
+        word_ends = [m.end() for m in WORD.finditer(text)]
+        n_words = len(word_ends)
+        # Word of each token: the first word ending after the token start
+        token_words = [min(bisect_right(word_ends, start), n_words - 1) for start, _ in offsets]
+
+        if self.chunk_tokens > 0:
+            size = min(self.chunk_tokens, max_tokens)
+            step = max(size - min(self.chunk_stride, size - 1), 1)
+            starts = range(0, max(len(ids) - size, 0) + step, step)
+            spans = [(start, min(start + size, len(ids))) for start in starts]
+        elif self.chunk_words > 0:
+            spans = []
+            for first_word in range(0, n_words, self.chunk_words):
+                start = bisect_left(token_words, first_word)
+                end = bisect_left(token_words, first_word + self.chunk_words)
+                spans.append((start, min(end, start + max_tokens)))
+        else:
+            spans = [(0, min(len(ids), max_tokens))]
+        if not spans:
+            spans = [(0, 0)]
+
+        input_ids = [
+            self.tokenizer.build_inputs_with_special_tokens(ids[start:end])
+            for start, end in spans
+        ]
+        if self.chunk_words > 0 and self.chunk_tokens <= 0:
+            chunk_lens = [
+                min(self.chunk_words, n_words - first_word)
+                for first_word in range(0, n_words, self.chunk_words)
+            ] or [0]
+        else:
+            chunk_lens = [
+                token_words[end - 1] - token_words[start] + 1 if end > start else 0
+                for start, end in spans
+            ]
+        return PreparedItem(item, text, n_words, input_ids, chunk_lens)
+
     def _process_batch(self, items: List[Dict[str, Any]], precision: int = 2) -> List[Dict[str, Any]]:
         """Process a batch of items."""
+        return self._classify_prepared(self._prepare_items(items), precision)
+
+    def _classify_prepared(
+        self, prepared_items: List[PreparedItem], precision: int = 2
+    ) -> List[Dict[str, Any]]:
+        """Classify items prepared by _prepare_items."""
         results = []
-        # Prepare chunks for all items
-        all_texts = []
-        all_meta = []
-        all_chunk_counts = []
-        all_chunk_lens = []
-        for item in items:
-            txt = item.get("ft", "")
-            txt = normalize_text(txt)
-            if self.chunk_words > 0:
-                parts = list(chunk_words(txt, self.chunk_words))
-            else:
-                parts = [txt]
-            lens = [len(p.split()) for p in parts]
-            all_texts.extend(parts)
-            all_meta.append(item)
-            all_chunk_counts.append(len(parts))
-            all_chunk_lens.extend(lens)
-        # Process in batches
-        all_logits = []
-        for i in range(0, len(all_texts), self.batch_size):
-            batch_texts = all_texts[i:i + self.batch_size]
-            enc = self.tokenizer(
-                batch_texts,
-                padding=True,
-                truncation=True,
-                max_length=self.max_length,
-                return_tensors="pt"
-            )
-            enc = {k: v.to(self.device) for k, v in enc.items()}
-            with torch.no_grad():
-                logits = self.model(**enc).logits
-            all_logits.append(logits.cpu().numpy())
-        all_logits = np.concatenate(all_logits, axis=0)
+        # Rule features reuse the normalized text and word count
+        all_flags = [rule_flags(prepared.text, prepared.n_words) for prepared in prepared_items]
+        decisions = [
+            self._cascade_decision(flags) if self.cascade else None for flags in all_flags
+        ]
+        self.cascade_stats["items"] += len(prepared_items)
+        # Classify the chunks of the items left to the model
+        all_logits = self._chunk_logits(
+            [
+                ids
+                for prepared, decision in zip(prepared_items, decisions)
+                if decision is None
+                for ids in prepared.input_ids
+            ]
+        )
         # Process each item
         pos = 0
-        for meta, n_chunks in zip(all_meta, all_chunk_counts):
+        for prepared, flags, decision in zip(prepared_items, all_flags, decisions):
+            meta = prepared.item
+            lg = (meta.get("lg") or meta.get("lang") or "").lower()
+            if decision is not None:
+                self.cascade_stats[decision] += 1
+                self.cascade_stats["skipped_chunks"] += len(prepared.input_ids)
+                results.append(self._cascade_result(meta, lg, flags, decision, precision))
+                continue
+            n_chunks = len(prepared.input_ids)
             L = all_logits[pos:pos+n_chunks]
-            lens = all_chunk_lens[pos:pos+n_chunks]
+            lens = prepared.chunk_lens
             pos += n_chunks
             # Pool across chunks
             pooled_probs = self._pool_logits(L, lens)
@@ -299,11 +569,6 @@ class AdClassifierPipeline:
             ensemble_ad_signal = calculate_ensemble_ad_signal(
                 promo_prob, top_label, pooled_probs, self.id2label
             )
-            # Get text and language
-            lg = (meta.get("lg") or meta.get("lang") or "").lower()
-            text_raw = meta.get("ft", "")
-            text_norm = normalize_text(text_raw)
-            flags = rule_flags(text_norm)
             # Calculate threshold
             base_thr = lang_len_threshold(
                 lg, flags["len_words"], self.lang_thr_map, 
@@ -346,9 +611,118 @@ class AdClassifierPipeline:
                     "rule_confidence": round(rule_confidence, precision),
                     "model_confidence": round(model_confidence, precision),
                 })
+                if self.cascade:
+                    result["decided_by"] = "model"
             results.append(result)
         return results
+
+    def _cascade_decision(self, flags: Dict[str, Any]) -> Optional[str]:
+        """
+        Decide an item from its rule features alone, if they are conclusive.
+
+        Returns:
+            "rule_ads" for short items with decisive rule evidence (e.g. price,
+            phone and cue), "short_non_ads" for items too short to classify and
+            without any rule feature, None for items left to the model
+        """
+        n_words = flags["len_words"]
+        if n_words < self.cascade_min_words and not any(
+            value for name, value in flags.items() if name.startswith("has_")
+        ):
+            return "short_non_ads"
+        if n_words <= self.cascade_max_words:
+            rule_score, _ = calculate_rule_score_and_confidence(flags)
+            if rule_score >= self.cascade_rule_score:
+                return "rule_ads"
+        return None
+
+    def _cascade_result(
+        self,
+        meta: Dict[str, Any],
+        lg: str,
+        flags: Dict[str, Any],
+        decision: str,
+        precision: int = 2,
+    ) -> Dict[str, Any]:
+        """Build the result of an item decided by _cascade_decision."""
+        result = {
+            "id": meta.get("id"),
+            "type": "ad" if decision == "rule_ads" else "non-ad",
+        }
+        if self.diagnostics:
+            base_thr = lang_len_threshold(
+                lg, flags["len_words"], self.lang_thr_map,
+                self.ad_threshold, self.short_bonus, self.short_len
+            )
+            rule_score, rule_confidence = calculate_rule_score_and_confidence(flags)
+            # Model outputs are unknown for items the model did not see
+            result.update({
+                "promotion_prob": None,
+                "promotion_prob_final": None,
+                "ensemble_ad_signal": None,
+                "xgenre_top_label": None,
+                "xgenre_top_prob": None,
+                "threshold_used": round(base_thr, precision),
+                "rule_score": round(rule_score, precision),
+                "rule_confidence": round(rule_confidence, precision),
+                "model_confidence": None,
+                "decided_by": "rules" if decision == "rule_ads" else "length",
+            })
+        return result
     
+    def _chunk_logits(self, input_ids: List[List[int]]) -> np.ndarray:
+        """Compute the logits of encoded chunks, in input order."""
+        if not input_ids:
+            return np.zeros((0, len(self.id2label)), dtype=np.float32)
+        if self.length_bucketing:
+            batches = self._length_batches([len(ids) for ids in input_ids])
+        else:
+            batches = (
+                list(range(i, min(i + self.batch_size, len(input_ids))))
+                for i in range(0, len(input_ids), self.batch_size)
+            )
+        logits = None
+        for batch in batches:
+            enc = self.tokenizer.pad(
+                {"input_ids": [input_ids[i] for i in batch]},
+                padding=True,
+                return_tensors="pt",
+            )
+            batch_logits = self._forward(enc)
+            if logits is None:
+                logits = np.empty((len(input_ids), batch_logits.shape[1]), dtype=batch_logits.dtype)
+            logits[batch] = batch_logits
+        return logits
+
+    def _length_batches(self, lengths: List[int]) -> Iterator[List[int]]:
+        """
+        Group chunk indices into batches of similar token length.
+
+        Batches hold batch_size chunks, or as many chunks as fit into
+        max_batch_tokens once padded to the longest one (at least one chunk).
+        """
+        order = sorted(range(len(lengths)), key=lengths.__getitem__)
+        if self.max_batch_tokens is None:
+            for i in range(0, len(order), self.batch_size):
+                yield order[i:i + self.batch_size]
+            return
+        batch = []
+        for i in order:
+            # Lengths are sorted: the padded length of the batch is lengths[i]
+            if batch and (len(batch) + 1) * lengths[i] > self.max_batch_tokens:
+                yield batch
+                batch = []
+            batch.append(i)
+        if batch:
+            yield batch
+
+    def _forward(self, enc: Dict[str, Any]) -> np.ndarray:
+        """Run the model on an encoded batch and return its logits."""
+        enc = {k: v.to(self.device) for k, v in enc.items()}
+        with torch.no_grad():
+            logits = self.model(**enc).logits
+        return logits.cpu().numpy()
+
     def _pool_logits(self, L: np.ndarray, lens: List[int]) -> np.ndarray:
         """Pool logits across chunks."""
         if self.pool == "logits_max":
@@ -7,11 +7,13 @@ pre-trained floret models from the Hugging Face Hub.
 """
 
 import logging
-import re
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
 import floret
-from huggingface_hub import hf_hub_download, list_repo_files
+import numpy as np
+
+from impresso_pipelines.model_registry import get_registry
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +30,14 @@ class LangIdentPipeline:
         >>> result = pipeline("Ceci est un texte en français")
         >>> print(result['language'])
         'fr'
+
+        >>> # Columnar results for many texts at once
+        >>> batch = pipeline.batch(["Ceci est un texte", "This is a text"])
+        >>> batch['language']
+        array(['fr', 'en'], dtype='<U2')
     """
+
+    DEFAULT_BATCH_SIZE: int = 1024
     
     def __init__(
         self, 
@@ -48,35 +57,20 @@ class LangIdentPipeline:
         Raises:
             ValueError: If no model files are found in the repository.
         """
+        registry = get_registry()
         if model_id is None:
             logger.info(f"No model specified, fetching latest from {repo_id}")
-            repo_files = list_repo_files(repo_id, revision=revision)
-            model_files = [
-                file for file in repo_files 
-                if re.match(r"langident-v\d+\.\d+\.\d+\.bin", file)
-            ]
-            
-            if not model_files:
-                raise ValueError(f"No model files found in repository {repo_id}")
-            
-            # Sort model files by semantic version and select the newest
-            model_files.sort(
-                key=lambda x: list(
-                    map(int, re.search(r"v(\d+\.\d+\.\d+)", x).group(1).split('.'))
-                ), 
-                reverse=True
+            model_id = registry.resolve_latest(
+                repo_id, r"^langident-v(\d+\.\d+\.\d+)\.bin$", revision=revision
             )
-            model_id = model_files[0]
+            if model_id is None:
+                raise ValueError(f"No model files found in repository {repo_id}")
             logger.info(f"Selected latest model: {model_id}")
         else:
             logger.info(f"Using specified model: {model_id}")
 
         logger.debug(f"Downloading model from {repo_id}/{model_id}")
-        model_path = hf_hub_download(
-            repo_id=repo_id, 
-            filename=model_id, 
-            revision=revision
-        )
+        model_path = registry.download(repo_id, model_id, revision=revision)
         logger.debug(f"Model downloaded to: {model_path}")
         
         self.model = floret.load_model(model_path)
@@ -150,3 +144,110 @@ class LangIdentPipeline:
             result["model_id"] = self.model_name
 
         return result
+
+    def batch(
+        self,
+        texts: Sequence[str],
+        k: Optional[int] = None,
+        diagnostics: bool = False,
+        model_id: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Identify the language of many texts with a single floret call.
+
+        All texts are passed to floret's multi-line prediction path at once,
+        which avoids one Python round-trip per text. Results are returned in
+        columnar form (one array per field) in the same order as the input.
+
+        Args:
+            texts: Input texts to identify the language for.
+            k: Number of predictions per text. Defaults to 300 if diagnostics
+                is True, otherwise 1.
+            diagnostics: If True, includes the top-k labels and scores per text.
+            model_id: If True, includes the model filename in the output.
+
+        Returns:
+            Dictionary containing:
+                - language (np.ndarray): Top language code per text, shape (n,)
+                - score (np.ndarray): Top confidence score per text, shape (n,)
+                - diagnostics (dict, optional): ``languages`` and ``scores``
+                  arrays of shape (n, k) if requested
+                - model_id (str, optional): Model filename if requested
+
+        Example:
+            >>> pipeline = LangIdentPipeline()
+            >>> result = pipeline.batch(["Hallo Welt", "Bonjour le monde"])
+            >>> result['language'].tolist()
+            ['de', 'fr']
+        """
+        if k is None:
+            k = 300 if diagnostics else 1
+
+        # floret predicts one line per entry, so newlines must not survive
+        lines: List[str] = [text.replace("\n", " ") for text in texts]
+        logger.debug(f"Identifying language for a batch of {len(lines)} texts")
+
+        if lines:
+            all_labels, all_probs = self.model.predict(lines, k=k)
+        else:
+            all_labels, all_probs = [], []
+
+        # Pad ragged rows so the result is a rectangular (n, k) array
+        width = max((len(labels) for labels in all_labels), default=0) or 1
+        labels = np.full((len(lines), width), "", dtype=object)
+        scores = np.zeros((len(lines), width), dtype=np.float64)
+        for row, (row_labels, row_probs) in enumerate(zip(all_labels, all_probs)):
+            labels[row, : len(row_labels)] = row_labels
+            # Round like __call__ so batch and single-text scores are equal
+            scores[row, : len(row_probs)] = [round(float(p), 2) for p in row_probs]
+
+        labels = np.char.replace(labels.astype(str), "__label__", "").reshape(
+            scores.shape
+        )
+
+        result: Dict[str, Any] = {
+            "language": labels[:, 0],
+            "score": scores[:, 0],
+        }
+
+        if diagnostics:
+            result["diagnostics"] = {"languages": labels, "scores": scores}
+
+        if model_id:
+            result["model_id"] = self.model_name
+
+        return result
+
+    def iter_batches(
+        self,
+        texts: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        k: Optional[int] = None,
+        diagnostics: bool = False,
+        model_id: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily identify languages over an arbitrarily long stream of texts.
+
+        Consumes ``texts`` in chunks of ``batch_size`` and yields one columnar
+        result per chunk, so memory stays bounded regardless of input length.
+
+        Args:
+            texts: Iterable of input texts (e.g., a generator over a corpus).
+            batch_size: Number of texts passed to floret per call.
+            k: Number of predictions per text (see batch()).
+            diagnostics: If True, includes the top-k labels and scores per text.
+            model_id: If True, includes the model filename in each chunk.
+
+        Yields:
+            Columnar result dictionaries as returned by batch().
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        iterator = iter(texts)
+        while chunk := list(islice(iterator, batch_size)):
+            yield self.batch(chunk, k=k, diagnostics=diagnostics, model_id=model_id)
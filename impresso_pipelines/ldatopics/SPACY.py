@@ -1,17 +1,23 @@
 import spacy
 import subprocess
 import json
-import gzip
+import hashlib
 import os
 import tarfile
 import tempfile
 import requests
 import shutil  # Add this import for moving directories
 import logging
-from huggingface_hub import hf_hub_download
+from itertools import islice
+from impresso_pipelines.ldatopics.file_cache import atomic_write, file_fingerprint
+from impresso_pipelines.ldatopics.lemma_table import load_lemma_table
+from impresso_pipelines.model_registry import get_registry
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 64
+SPACY_MODEL_CACHE_DIR = "~/.cache/spacy_models"
+
 class SPACY:
     def __init__(self, model_id, language, latest_version):
         self.language = language
@@ -26,23 +32,19 @@ class SPACY:
 
         # load lemmatization files from hf
         # prepare and load lemmatization file and lower case it
-        lemmatization_file = hf_hub_download(
-            repo_id="impresso-project/mallet-topic-inferencer",
-            filename=f"models/tm/tm-{language}-all-v{latest_version}.vocab.lemmatization.tsv.gz"
+        lemmatization_file = get_registry().download(
+            "impresso-project/mallet-topic-inferencer",
+            f"models/tm/tm-{language}-all-v{latest_version}.vocab.lemmatization.tsv.gz"
         )
-        # load the file, lower case the first column, make dict, first column key and third value
-        self.lemmatization_dict = {}
-        with gzip.open(lemmatization_file, "rt", encoding="utf-8") as f:
-            for line in f:
-                lemma = line.strip().split("\t")
-                if len(lemma) > 2:
-                    self.lemmatization_dict[lemma[0].lower()] = lemma[2]
+        # compile the file once (lower cased first column as key, third column as value)
+        # into a memory-mapped lemma table shared by all worker processes
+        self.lemmatization_dict = load_lemma_table(lemmatization_file, lowercase_keys=True)
 
        
         # load config file
-        config_file = hf_hub_download(
-            repo_id="impresso-project/lb-spacy-pos",
-            filename=f"tm-{language}-all-v{latest_version}.config.json"
+        config_file = get_registry().download(
+            "impresso-project/lb-spacy-pos",
+            f"tm-{language}-all-v{latest_version}.config.json"
         )
         with open(config_file, "r") as f:
             self.config = json.load(f)
@@ -60,8 +62,18 @@ class SPACY:
             subprocess.run(["python", "-m", "spacy", "download", model_id], check=True)
 
     def download_and_extract_model(self, model_url):
-        """Downloads and extracts the SpaCy model tar file to a cache directory."""
-        cache_dir = os.path.expanduser("~/.cache/spacy_models")
+        """
+        Downloads the SpaCy model tar file and extracts it once into a cache directory.
+
+        Extracted models are stored under ``<cache>/extracted/<sha256 of the tarball>``.
+        Extraction happens in a temporary directory next to the cache entry and is
+        published with an atomic rename, so concurrent workers never see a partially
+        extracted model and later loads go straight to spacy.load.
+
+        Returns:
+            Path of the extracted model directory (the one containing config.cfg)
+        """
+        cache_dir = os.path.expanduser(SPACY_MODEL_CACHE_DIR)
         os.makedirs(cache_dir, exist_ok=True)
 
         # Generate a unique filename for the model based on its URL
@@ -70,61 +82,152 @@ class SPACY:
 
         # Check if the model is already cached
         if os.path.exists(cached_model_path):
-            # print(f"Using cached SpaCy model from: {cached_model_path}")
             logger.info("Using cached SpaCy model...")
         else:
-            # Download the tar file
+            # Download the tar file to a temporary name, then publish it atomically
             logger.info("Downloading SpaCy model from: %s...", model_url)
             response = requests.get(model_url, stream=True)
             response.raise_for_status()
-            with open(cached_model_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-        # Extract the tar file to a temporary directory
-        temp_dir = tempfile.mkdtemp()
-        # print(f"Extracting SpaCy model to: {temp_dir}...")
-        with tarfile.open(cached_model_path, "r:gz") as tar:
-            tar.extractall(path=temp_dir)
-
-        # Locate the directory containing the config.cfg file
-        for root, dirs, files in os.walk(temp_dir):
-            if "config.cfg" in files:
-                # Move the model directory to a new location and return its path
-                model_dir = root
-                final_model_dir = os.path.join(temp_dir, "model")
-                shutil.move(model_dir, final_model_dir)
-                return final_model_dir
-
-        raise IOError("Could not find config.cfg in the extracted model directory.")
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{model_filename}.")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+                os.replace(tmp_path, cached_model_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        extracted_root = os.path.join(cache_dir, "extracted")
+        os.makedirs(extracted_root, exist_ok=True)
+        final_model_dir = os.path.join(extracted_root, self.archive_digest(cached_model_path))
+        if os.path.isfile(os.path.join(final_model_dir, "config.cfg")):
+            logger.info("Using extracted SpaCy model from: %s", final_model_dir)
+            return final_model_dir
+
+        # Extract the tar file to a temporary directory on the same file system
+        temp_dir = tempfile.mkdtemp(dir=extracted_root, prefix=".extract-")
+        try:
+            logger.info("Extracting SpaCy model to: %s...", final_model_dir)
+            with tarfile.open(cached_model_path, "r:gz") as tar:
+                tar.extractall(path=temp_dir)
+
+            # Locate the directory containing the config.cfg file
+            model_dir = next(
+                (root for root, dirs, files in os.walk(temp_dir) if "config.cfg" in files),
+                None,
+            )
+            if model_dir is None:
+                raise IOError("Could not find config.cfg in the extracted model directory.")
+
+            try:
+                os.rename(model_dir, final_model_dir)
+            except OSError:
+                # Another worker published the same model first; use its copy
+                if not os.path.isfile(os.path.join(final_model_dir, "config.cfg")):
+                    raise
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        return final_model_dir
+
+    @staticmethod
+    def archive_digest(path):
+        """
+        Returns the SHA-256 hex digest of a file, memoized in a ``<path>.sha256`` sidecar.
+
+        The sidecar records the fingerprint (real path, size and modification
+        time) of the file it was computed from, so a re-downloaded archive is
+        hashed again.
+        """
+        stamp = file_fingerprint(path)
+        sidecar = f"{path}.sha256"
+        try:
+            with open(sidecar, "r") as f:
+                cached_stamp, digest = f.read().split()
+            if cached_stamp == stamp:
+                return digest
+        except (OSError, ValueError):
+            pass
+
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+
+        atomic_write(sidecar, lambda f: f.write(f"{stamp} {digest}\n"))
+        return digest
 
     def __call__(self, text):
         # download lemmatiazation files from hf
 
 
         doc = self.nlp(text)
-
+        return self.lemmatize_doc(doc)
+
+    def lemmatize_doc(self, doc):
+        """Filters the tokens of a parsed spaCy Doc by UPOS and maps them to their lemmas."""
+        return self.lemmatize_batch([doc])[0]
+
+    def pipe(self, texts, batch_size=DEFAULT_BATCH_SIZE, n_process=1):
+        """
+        Lemmatizes a stream of texts with spaCy's batched nlp.pipe.
+
+        Args:
+            texts: Iterable of texts to lemmatize
+            batch_size: Number of texts parsed and lemmatized per batch
+            n_process: Number of spaCy worker processes (-1 uses all CPUs)
+
+        Yields:
+            One list of lemmas per text, in input order
+        """
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        while True:
+            batch = list(islice(docs, batch_size))
+            if not batch:
+                return
+            yield from self.lemmatize_batch(batch)
+
+    def lemmatize_batch(self, docs):
+        """
+        Filters the tokens of parsed spaCy Docs by UPOS and maps them to their lemmas.
+
+        The lemmatization dictionary is looked up once per distinct word form of
+        the batch rather than once per token.
+        """
         # lemmatized_text = [token.lemma_.lower() for token in doc if not token.is_punct and not token.is_stop] # replace this filter with UPOS category is from config
         # and then use lemmas as filter from the lemma file
         # https://github.com/impresso/impresso-mallet-topic-inference/blob/15f80246ed7511d8fc4570b2dcb4d1978c59a59d/lib/multilingual_lemmatizer.py#L83
 
-        # for token in doc:
-        #     print(f"Token: {token.text}, POS: {token.pos_}, Tag: {token.tag_}")
-        # Filter tokens based on POS tags from config and lemmatize using the dictionary
-        lemmatized_text = []
-        for token in doc:
-            if self.language == "lb":
-                pos_tag = token.pos_ or self.map_tag_to_pos(token.tag_)
-            else:
-                pos_tag = token.pos_
-            if pos_tag in self.upos_filter:
-                lemmatized_text.append(
-                    self.lemmatization_dict.get(token.text.lower(), token.lemma_.lower())
-                )
-
-        # print("French lemmatized tokens:", lemmatized_text)
-
-        return lemmatized_text
+        # Filter tokens based on POS tags from config
+        filtered = [
+            [
+                (token.text.lower(), token.lemma_)
+                for token in doc
+                if self.token_pos(token) in self.upos_filter
+            ]
+            for doc in docs
+        ]
+
+        # Lemmatize using the dictionary, falling back to the spaCy lemma
+        forms = {form for tokens in filtered for form, _ in tokens}
+        lemmas = {
+            form: lemma
+            for form in forms
+            if (lemma := self.lemmatization_dict.get(form)) is not None
+        }
+        return [
+            [lemmas.get(form, lemma.lower()) for form, lemma in tokens]
+            for tokens in filtered
+        ]
+
+    def token_pos(self, token):
+        """Returns the UPOS tag of a token, mapping Luxembourgish fine-grained tags if needed."""
+        if self.language == "lb":
+            return token.pos_ or self.map_tag_to_pos(token.tag_)
+        return token.pos_
 
     def map_tag_to_pos(self, tag):
         # Map the fine-grained tags used by your Luxembourgish model to Universal POS tags
@@ -0,0 +1,85 @@
+"""
+Fingerprinted, atomically written cache files of the LDA topics pipeline.
+
+Files derived from model files (compiled lemma tables, topic word indexes,
+archive digests) are cached under names or stamps derived from the real path,
+size and modification time of their source, so an updated source is processed
+again. They are written to a temporary file and renamed into place, so
+concurrent workers never read a partial file.
+
+Cache writes are best effort: if a file cannot be written, a warning is logged
+and the caller keeps using the result it computed in memory.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from typing import IO, Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_cache_dir(cache_dir: Optional[str], env_var: str, default: str) -> str:
+    """
+    Return the cache directory to use, with the user directory expanded.
+
+    Args:
+        cache_dir: Directory given by the caller, if any
+        env_var: Environment variable overriding the default
+        default: Default directory
+
+    Returns:
+        cache_dir, else the value of env_var, else default
+    """
+    return os.path.expanduser(cache_dir or os.environ.get(env_var, default))
+
+
+def file_fingerprint(path: str, *options: Any) -> str:
+    """
+    Return a short fingerprint of a file and the options it is processed with.
+
+    Args:
+        path: Source file
+        *options: Processing options that change the derived file
+
+    Returns:
+        The first 16 hex digits of the SHA-256 of the real path, size,
+        modification time and options
+    """
+    real_path = os.path.realpath(path)
+    stat = os.stat(real_path)
+    key = ":".join(str(part) for part in (real_path, stat.st_size, stat.st_mtime_ns, *options))
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def atomic_write(path: str, write: Callable[[IO], None], binary: bool = False) -> bool:
+    """
+    Write a cache file through a temporary file renamed into place.
+
+    Args:
+        path: Destination path; missing parent directories are created
+        write: Function writing the content to the open temporary file
+        binary: Open the file in binary mode instead of UTF-8 text
+
+    Returns:
+        True if the file was written, False if it could not be (a warning is
+        logged and no temporary file is left behind)
+    """
+    tmp_path = None
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.")
+        mode, encoding = ("wb", None) if binary else ("w", "utf-8")
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            write(f)
+        os.replace(tmp_path, path)
+        return True
+    except BaseException as e:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        if not isinstance(e, OSError):
+            raise
+        logger.warning("Could not write cache file %s: %s", path, e)
+        return False
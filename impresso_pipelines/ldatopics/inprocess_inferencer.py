@@ -0,0 +1,134 @@
+"""
+In-process Mallet topic inference through JPype.
+
+The file-based path (MalletVectorizer + LanguageInferencer) writes a CSV, a
+.mallet and a .doctopics file for every call and re-reads them. This module
+instead loads the Mallet Pipe and TopicInferencer Java objects once per
+language, turns lemma lists directly into Mallet Instances and samples topic
+distributions in memory, returning them as numpy arrays.
+
+The JVM must already be running with the Mallet jars on the classpath (see
+LDATopicsPipeline.__init__).
+
+Example usage:
+    >>> inferencer = InProcessInferencer("fr", "tm-fr-all-v2.0.inferencer", "tm-fr-all-v2.0.pipe")
+    >>> inferencer.infer([["gouvernement", "mesure"], ["village", "école"]]).shape
+    (2, 100)
+"""
+
+import logging
+from typing import Any, List, Optional, Sequence
+
+import jpype.imports  # noqa: F401 (enables Java package imports)
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessInferencer:
+    """
+    Vectorize lemmatized documents and infer their topic distributions in memory.
+
+    Sampling parameters default to the values used by Mallet's InferTopics
+    command, so results match the file-based LanguageInferencer.
+
+    Attributes:
+        language (str): Language code of the topic model
+        random_seed (int): Seed set on the inferencer before each inference call
+        num_iterations (int): Number of Gibbs sampling iterations
+        thinning (int): Sampling interval after burn-in
+        burn_in (int): Number of burn-in iterations
+        pipe: Mallet Pipe used to vectorize documents
+        inferencer: Mallet TopicInferencer
+    """
+
+    def __init__(
+        self,
+        language: str,
+        inferencer_file: str,
+        pipe_file: str,
+        random_seed: int = 42,
+        num_iterations: int = 100,
+        thinning: int = 10,
+        burn_in: int = 10,
+    ) -> None:
+        # Import after JVM is started, so that the classes are available
+        # noinspection PyUnresolvedReferences
+        from cc.mallet.topics import TopicInferencer  # type: ignore
+        from cc.mallet.types import InstanceList  # type: ignore
+        from java.io import File  # type: ignore
+
+        self.language = language
+        self.random_seed = random_seed
+        self.num_iterations = num_iterations
+        self.thinning = thinning
+        self.burn_in = burn_in
+
+        logger.info("Loading Mallet pipe and inferencer for %s", language)
+        # A .pipe file is an empty InstanceList that carries the training pipe
+        self.pipe = InstanceList.load(File(pipe_file)).getPipe()
+        # Unknown words are dropped by the inferencer anyway; never grow the vocabulary
+        self.pipe.getDataAlphabet().stopGrowth()
+        self.inferencer = TopicInferencer.read(File(inferencer_file))
+
+    def vectorize(
+        self, documents: Sequence[List[str]], names: Optional[Sequence[str]] = None
+    ) -> Any:
+        """
+        Turn lemma lists into a Mallet InstanceList using the model's pipe.
+
+        Args:
+            documents: One list of lemmas per document
+            names: Optional document identifiers (default: "doc0", "doc1", ...)
+
+        Returns:
+            A Java cc.mallet.types.InstanceList holding one instance per document
+        """
+        from cc.mallet.types import Instance, InstanceList  # type: ignore
+
+        if names is None:
+            names = [f"doc{i}" for i in range(len(documents))]
+
+        instances = InstanceList(self.pipe)
+        for name, lemmas in zip(names, documents):
+            instances.addThruPipe(Instance(" ".join(lemmas), "dummy", name, None))
+        return instances
+
+    def infer_instances(self, instances: Any) -> np.ndarray:
+        """
+        Sample topic distributions for vectorized instances.
+
+        Args:
+            instances: A Mallet InstanceList (see vectorize())
+
+        Returns:
+            Array of shape (n_documents, n_topics) with topic proportions
+        """
+        self.inferencer.setRandomSeed(self.random_seed)
+        rows = [
+            np.asarray(
+                self.inferencer.getSampledDistribution(
+                    instance, self.num_iterations, self.thinning, self.burn_in
+                ),
+                dtype=np.float64,
+            )
+            for instance in instances
+        ]
+        if not rows:
+            return np.zeros((0, 0), dtype=np.float64)
+        return np.vstack(rows)
+
+    def infer(
+        self, documents: Sequence[List[str]], names: Optional[Sequence[str]] = None
+    ) -> np.ndarray:
+        """
+        Vectorize lemma lists and infer their topic distributions in one call.
+
+        Args:
+            documents: One list of lemmas per document
+            names: Optional document identifiers
+
+        Returns:
+            Array of shape (n_documents, n_topics) with topic proportions
+        """
+        return self.infer_instances(self.vectorize(documents, names))
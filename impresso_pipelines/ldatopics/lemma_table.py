@@ -0,0 +1,273 @@
+"""
+Compact, memory-mapped lemmatization dictionary for the LDA topics pipeline.
+
+The topic models ship a ``vocab.lemmatization.tsv.gz`` file (token, POS, lemma)
+with hundreds of thousands of entries. Loading it into a Python dict costs
+hundreds of MB per language in every worker process. This module compiles the
+TSV once into a read-only binary lemma table and reads it through ``mmap``, so
+all processes on a host share a single copy through the page cache.
+
+File layout (native byte order, all sections 8-byte aligned):
+    header:         magic (8 bytes), entry count (uint64), bucket count (uint64)
+    buckets:        open-addressing hash index, uint32 entry number + 1 (0 = empty)
+    key offsets:    uint64[count + 1] into the key blob
+    value offsets:  uint64[count + 1] into the value blob
+    key blob:       UTF-8 keys, sorted
+    value blob:     UTF-8 lemmas, aligned with the keys
+
+Lookups hash the key with CRC-32 and probe the bucket array linearly, so they
+cost a handful of slice comparisons, comparable to a dict lookup.
+
+Configuration (environment variables):
+    IMPRESSO_LEMMA_CACHE_DIR: Directory for compiled lemma tables
+        (default: ~/.cache/impresso_pipelines/lemmas)
+
+Example usage:
+    >>> table = load_lemma_table("tm-fr-all-v2.0.vocab.lemmatization.tsv.gz", lowercase_keys=True)
+    >>> table.get("chevaux")
+    'cheval'
+"""
+
+import gzip
+import logging
+import mmap
+import os
+import struct
+import sys
+import zlib
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional
+
+from impresso_pipelines.ldatopics.file_cache import (
+    atomic_write,
+    file_fingerprint,
+    resolve_cache_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEMMA_CACHE_DIR: str = os.path.join(
+    "~", ".cache", "impresso_pipelines", "lemmas"
+)
+
+_MAGIC = b"IMPLEM1" + (b"L" if sys.byteorder == "little" else b"B")
+_HEADER = struct.Struct("=8sQQ")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def read_lemmatization_tsv(
+    path: str, lowercase_keys: bool = False, lowercase_values: bool = False
+) -> Dict[str, str]:
+    """
+    Read a (possibly gzipped) token/POS/lemma TSV file into a dictionary.
+
+    Lines with fewer than three columns are skipped; later entries win.
+
+    Args:
+        path: Path of the TSV file (.tsv or .tsv.gz)
+        lowercase_keys: Lowercase the tokens
+        lowercase_values: Lowercase the lemmas
+
+    Returns:
+        Mapping of tokens to lemmas
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    token2lemma: Dict[str, str] = {}
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            fields = line.strip().split("\t")
+            if len(fields) < 3:
+                continue
+            token, lemma = fields[0], fields[2]
+            if lowercase_keys:
+                token = token.lower()
+            if lowercase_values:
+                lemma = lemma.lower()
+            token2lemma[token] = lemma
+    return token2lemma
+
+
+def build_lemma_table(token2lemma: Mapping, output_path: str) -> bool:
+    """
+    Compile a token-to-lemma mapping into a binary lemma table file.
+
+    The file is written with file_cache.atomic_write, so concurrent builders
+    never expose a partial table.
+
+    Args:
+        token2lemma: Mapping of tokens to lemmas
+        output_path: Path of the compiled table
+
+    Returns:
+        True if the table was written, False if it could not be (a warning is
+        logged)
+    """
+    items = sorted(
+        (key.encode("utf-8"), value.encode("utf-8"))
+        for key, value in token2lemma.items()
+    )
+    count = len(items)
+    bucket_count = 1
+    while bucket_count < 2 * count:
+        bucket_count <<= 1
+
+    buckets = [0] * bucket_count
+    mask = bucket_count - 1
+    for number, (key, _) in enumerate(items):
+        slot = zlib.crc32(key) & mask
+        while buckets[slot]:
+            slot = (slot + 1) & mask
+        buckets[slot] = number + 1
+
+    key_offsets = [0]
+    value_offsets = [0]
+    for key, value in items:
+        key_offsets.append(key_offsets[-1] + len(key))
+        value_offsets.append(value_offsets[-1] + len(value))
+
+    sections = [
+        _HEADER.pack(_MAGIC, count, bucket_count),
+        struct.pack(f"={bucket_count}I", *buckets),
+        struct.pack(f"={count + 1}Q", *key_offsets),
+        struct.pack(f"={count + 1}Q", *value_offsets),
+        b"".join(key for key, _ in items),
+        b"".join(value for _, value in items),
+    ]
+
+    def write(f):
+        for section in sections:
+            f.write(section)
+            f.write(b"\0" * (_align(len(section)) - len(section)))
+
+    if not atomic_write(output_path, write, binary=True):
+        return False
+    logger.info("Compiled %d lemmatization entries to %s", count, output_path)
+    return True
+
+
+class LemmaTable(Mapping):
+    """
+    Read-only, memory-mapped token-to-lemma mapping.
+
+    Behaves like a ``Mapping[str, str]`` (``get``, ``in``, ``[]``, ``len``,
+    iteration in sorted key order) without materializing the entries in Python.
+
+    Attributes:
+        path (str): Path of the compiled table
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, bucket_count = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a lemma table for this platform: {path}")
+
+        view = memoryview(self._mm)
+        offset = _align(_HEADER.size)
+        end = offset + 4 * bucket_count
+        self._buckets = view[offset:end].cast("I")
+        offset = _align(end)
+        end = offset + 8 * (count + 1)
+        self._key_offsets = view[offset:end].cast("Q")
+        offset = _align(end)
+        end = offset + 8 * (count + 1)
+        self._value_offsets = view[offset:end].cast("Q")
+        self._keys_start = _align(end)
+        self._values_start = _align(self._keys_start + self._key_offsets[count])
+        self._count = count
+        self._mask = bucket_count - 1
+
+    def _find(self, key: str) -> int:
+        """Return the entry number of key, or -1 if it is absent."""
+        encoded = key.encode("utf-8")
+        mm = self._mm
+        buckets = self._buckets
+        key_offsets = self._key_offsets
+        start = self._keys_start
+        slot = zlib.crc32(encoded) & self._mask
+        while True:
+            number = buckets[slot] - 1
+            if number < 0:
+                return -1
+            if mm[start + key_offsets[number]:start + key_offsets[number + 1]] == encoded:
+                return number
+            slot = (slot + 1) & self._mask
+
+    def _value(self, number: int) -> str:
+        start = self._values_start
+        return self._mm[
+            start + self._value_offsets[number]:start + self._value_offsets[number + 1]
+        ].decode("utf-8")
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        number = self._find(key)
+        return default if number < 0 else self._value(number)
+
+    def __getitem__(self, key: str) -> str:
+        number = self._find(key)
+        if number < 0:
+            raise KeyError(key)
+        return self._value(number)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        start = self._keys_start
+        for number in range(self._count):
+            yield self._mm[
+                start + self._key_offsets[number]:start + self._key_offsets[number + 1]
+            ].decode("utf-8")
+
+    def close(self) -> None:
+        """Release the memory map."""
+        for view in (self._buckets, self._key_offsets, self._value_offsets):
+            view.release()
+        self._mm.close()
+
+
+def load_lemma_table(
+    tsv_path: str,
+    lowercase_keys: bool = False,
+    lowercase_values: bool = False,
+    cache_dir: Optional[str] = None,
+) -> Mapping:
+    """
+    Open the compiled lemma table of a lemmatization TSV, building it on first use.
+
+    Compiled tables are stored in the cache directory under a name derived from
+    the real path, size and modification time of the TSV and the lowercasing
+    options, so an updated TSV is compiled again. If the table cannot be
+    written, a warning is logged and the TSV is served from a dictionary.
+
+    Args:
+        tsv_path: Path of the lemmatization TSV (.tsv or .tsv.gz)
+        lowercase_keys: Lowercase the tokens
+        lowercase_values: Lowercase the lemmas
+        cache_dir: Directory for compiled tables (default: IMPRESSO_LEMMA_CACHE_DIR
+            or ~/.cache/impresso_pipelines/lemmas)
+
+    Returns:
+        The memory-mapped lemma table, or a dictionary if it could not be written
+    """
+    cache_dir = resolve_cache_dir(cache_dir, "IMPRESSO_LEMMA_CACHE_DIR", DEFAULT_LEMMA_CACHE_DIR)
+    fingerprint = file_fingerprint(tsv_path, lowercase_keys, lowercase_values)
+    name = os.path.basename(tsv_path).split(".tsv")[0]
+    table_path = os.path.join(cache_dir, f"{name}.{fingerprint}.lemmas")
+
+    if not os.path.exists(table_path):
+        logger.info("Compiling lemma table for %s", tsv_path)
+        token2lemma = read_lemmatization_tsv(tsv_path, lowercase_keys, lowercase_values)
+        if not build_lemma_table(token2lemma, table_path):
+            return token2lemma
+    return LemmaTable(table_path)
@@ -39,7 +39,8 @@ import traceback
 import collections
 import jsonschema
 from jsonschema import Draft7Validator
-from typing import Generator, List, Dict, Any, Optional
+from typing import Generator, List, Dict, Any, Optional, Sequence, Tuple
+import numpy as np
 from smart_open import open
 import impresso_pipelines.ldatopics.s3_to_local_stamps
 
@@ -48,6 +49,9 @@ SCHEMA_BASE_URI = "https://impresso.github.io/impresso-schemas/json/topic_model/
 
 IMPRESSO_SCHEMA = "topic_assignment.v2.schema.json"
 
+# Number of doctopics lines converted together in matrix format
+DEFAULT_BLOCK_SIZE = 4096
+
 
 # Regular expression to extract the CI_ID from the document path with unix path separators
 # Pattern breakdown:
@@ -102,6 +106,15 @@ class Mallet2TopicAssignment:
         convert_matrix_row(self, row: List[str]) -> Dict[str, Any]:
             Converts a row from a matrix format TSV file to a dictionary.
 
+        convert_distribution(self, doc_name: str, distribution: Sequence[float]) -> Dict[str, Any]:
+            Converts a dense topic distribution of one document to a dictionary.
+
+        read_matrix_blocks(self, filenames: List[str], block_size: int) -> Generator[Tuple[List[str], np.ndarray], None, None]:
+            Reads matrix format TSV files into blocks of document names and 2D arrays.
+
+        convert_matrix(self, doc_names: Sequence[str], matrix: np.ndarray) -> List[Dict[str, Any]]:
+            Converts a 2D array of topic distributions to dictionaries, vectorized per block.
+
         convert_sparse_row(self, row: List[str]) -> Dict[str, Any]:
             Converts a row from a sparse format TSV file to a dictionary.
 
@@ -155,6 +168,7 @@ class Mallet2TopicAssignment:
         self.topic_id_format = (
             f"{self.topic_model}_tp{{t:0{self.padding_length}d}}_{self.lang}"
         )
+        self._topic_ids: List[str] = []
         self.last_timestamp = impresso_pipelines.ldatopics.s3_to_local_stamps.get_timestamp()
 
     def validate_options(self) -> None:
@@ -191,28 +205,147 @@ class Mallet2TopicAssignment:
                     logging.info("Processed lines: %s", line_count)
 
     def convert_matrix_row(self, row: List[str]) -> Dict[str, Any]:
-        ci_id = re.sub(CI_ID_REGEX, r"\2", row[1])
-        topics = row[2:]
-        topic_count = len(topics)
-        if self.numeric_topic_ids:
-            topics = [
-                {"t": t, "p": round(fp, self.precision)}
-                for t, p in enumerate(topics)
-                if (fp := float(p)) >= self.min_p
+        return self.convert_distribution(row[1], [float(p) for p in row[2:]])
+
+    def convert_distribution(
+        self, doc_name: str, distribution: Sequence[float]
+    ) -> Dict[str, Any]:
+        """
+        Converts a dense topic distribution of one document to a dictionary.
+
+        Used for single matrix rows of doctopics files as well as for
+        distributions inferred in memory (see InProcessInferencer).
+
+        Args:
+            doc_name (str): The document name, from which the CI_ID is extracted.
+            distribution (Sequence[float]): The topic proportions indexed by topic.
+
+        Returns:
+            Dict[str, Any]: The topic assignment of the document.
+        """
+        matrix = np.asarray(distribution, dtype=np.float64).reshape(1, -1)
+        return self.convert_matrix([doc_name], matrix)[0]
+
+    def topic_ids(self, topic_count: int) -> List[str]:
+        """
+        Returns the formatted topic ids 0..topic_count-1, computed once per topic count.
+        """
+        if len(self._topic_ids) != topic_count:
+            self._topic_ids = [
+                self.topic_id_format.format(t=t) for t in range(topic_count)
             ]
+        return self._topic_ids
+
+    def read_matrix_blocks(
+        self, filenames: List[str], block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> Generator[Tuple[List[str], np.ndarray], None, None]:
+        """
+        Reads matrix format TSV files in blocks of documents.
+
+        Args:
+            filenames (List[str]): A list of file paths to the TSV files.
+            block_size (int): Maximum number of documents per block.
+
+        Yields:
+            Tuple[List[str], np.ndarray]: The document names of a block and their
+            topic proportions as an array of shape (n_documents, n_topics).
+
+        Raises:
+            ValueError: If the rows of a block have different numbers of topics.
+        """
+        line_count = 0
+        for filename in filenames:
+            with open(filename, "r", encoding="utf-8") as file:
+                names: List[str] = []
+                weights: List[str] = []
+                for line in file:
+                    line_count += 1
+                    if line.startswith("#"):
+                        continue
+                    fields = line.rstrip("\n").split("\t", 2)
+                    names.append(fields[1])
+                    weights.append(fields[2].replace("\t", " ") if len(fields) > 2 else "")
+                    if len(names) == block_size:
+                        yield names, self._parse_matrix_block(names, weights)
+                        logging.info("Processed lines: %s", line_count)
+                        names, weights = [], []
+                if names:
+                    yield names, self._parse_matrix_block(names, weights)
+
+    @staticmethod
+    def _parse_matrix_block(names: List[str], weights: List[str]) -> np.ndarray:
+        rows = [row.split() for row in weights]
+        topic_count = len(rows[0])
+        for name, row in zip(names, rows):
+            if len(row) != topic_count:
+                raise ValueError(
+                    f"Inconsistent topic counts in doctopics block starting at {names[0]}:"
+                    f" {name} has {len(row)} topics, expected {topic_count}"
+                )
+        values = np.fromiter(
+            (float(value) for row in rows for value in row),
+            dtype=np.float64,
+            count=len(rows) * topic_count,
+        )
+        return values.reshape(len(names), topic_count)
+
+    def convert_matrix(
+        self, doc_names: Sequence[str], matrix: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """
+        Converts a block of dense topic distributions to dictionaries.
+
+        The min_p threshold and the per-document ordering of topics (decreasing
+        proportion, ties in topic order) are computed with numpy on the whole
+        block; only the selected topics are rounded and formatted.
+
+        Args:
+            doc_names (Sequence[str]): The document names, one per row.
+            matrix (np.ndarray): Topic proportions of shape (n_documents, n_topics).
+
+        Returns:
+            List[Dict[str, Any]]: The topic assignments, one per document.
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        topic_count = matrix.shape[1]
+        selected = matrix >= self.min_p
+        if self.numeric_topic_ids:
+            # selected topics in topic order, flattened row by row
+            topics_flat = np.nonzero(selected)[1].tolist()
+            values = matrix[selected]
         else:
+            # stable sort on negated proportions keeps ties in topic order; the
+            # selected topics of a row are then a prefix of its sorted order
+            order = np.argsort(-matrix, axis=1, kind="stable")
+            prefix = (
+                np.arange(topic_count) < selected.sum(axis=1, keepdims=True)
+            )
+            topic_ids = self.topic_ids(topic_count)
+            topics_flat = [topic_ids[t] for t in order[prefix].tolist()]
+            values = np.take_along_axis(matrix, order, axis=1)[prefix]
+        precision = self.precision
+        values_flat = [round(p, precision) for p in values.tolist()]
+        bounds = np.cumsum(selected.sum(axis=1)).tolist()
+
+        results = []
+        start = 0
+        for doc_name, end in zip(doc_names, bounds):
             topics = [
-                {
-                    "t": self.topic_id_format.format(t=t),
-                    "p": round(p, self.precision),
-                }
-                for t, p in sorted(
-                    enumerate(float(p) for p in topics),
-                    key=lambda x: x[1],
-                    reverse=True,
-                )
-                if p >= self.min_p
+                {"t": t, "p": p}
+                for t, p in zip(topics_flat[start:end], values_flat[start:end])
             ]
+            start = end
+            match = CI_ID_REGEX.match(doc_name)
+            ci_id = match.group(2) if match else doc_name
+            results.append(self.topic_assignment(ci_id, topic_count, topics))
+        return results
+
+    def topic_assignment(
+        self, ci_id: str, topic_count: int, topics: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Builds the topic assignment dictionary of one document in matrix format.
+        """
         result = {
             "ci_id": ci_id,
             "ts": self.last_timestamp,
@@ -289,20 +422,25 @@ class Mallet2TopicAssignment:
 
         ci_id_stats = collections.Counter()
         if self.input_format_type == "sparse":
-            convert_row = self.convert_sparse_row
+            documents = (
+                self.convert_sparse_row(row) for row in self.read_tsv_files(filenames)
+            )
         elif self.input_format_type == "matrix":
-            convert_row = self.convert_matrix_row
+            documents = (
+                doc_json
+                for doc_names, matrix in self.read_matrix_blocks(filenames)
+                for doc_json in self.convert_matrix(doc_names, matrix)
+            )
         else:
             raise ValueError(f"Invalid format type: {self.input_format_type}")
 
-        for row in self.read_tsv_files(filenames):
-            ci_id = re.sub(CI_ID_REGEX, r"\2", row[1])
+        for doc_json in documents:
+            ci_id = doc_json["ci_id"]
             if ci_id in ci_id_stats:
                 ci_id_stats["DUPLICATE_COUNT"] += 1
                 continue
             ci_id_stats[ci_id] = 1
 
-            doc_json = convert_row(row)
             if self.schema_validator:
                 if not self.validate_document(doc_json):
                     continue
@@ -29,15 +29,16 @@ from impresso_pipelines.ldatopics.config import (
     TOPIC_MODEL_DESCRIPTIONS,
     TOPIC_MODEL_DESCRIPTIONS_HF,
 )
+from impresso_pipelines.ldatopics.mallet2topic_assignment_jsonl import Mallet2TopicAssignment
 from impresso_pipelines.ldatopics.mallet_topic_inferencer import MalletTopicInferencer
+from impresso_pipelines.ldatopics.topic_model import ResolvedTopicModel
+from impresso_pipelines.model_registry import get_registry
 import argparse
 import json
 import os
-import bz2
-from typing import Dict, List, Any, Optional, Union, Tuple
-from huggingface_hub import hf_hub_download, list_repo_files
+from typing import Dict, Iterable, List, Any, Optional, Sequence, Union
+import numpy as np
 import tempfile
-import shutil
 import subprocess
 import sys
 import logging
@@ -59,6 +60,11 @@ class LDATopicsPipeline:
     2. Lemmatization using SpaCy language models
     3. Text vectorization with Mallet
     4. Topic inference using pre-trained LDA models
+
+    By default, steps 3 and 4 run in process: the Mallet pipe and inferencer are
+    loaded once per language through JPype and documents never touch the disk.
+    The legacy file-based path (Csv2Vectors/InferTopics) is kept for comparison
+    and can be selected with ``in_process=False``.
     
     The pipeline uses pre-trained topic models from Hugging Face Hub and
     automatically downloads required Mallet JARs and SpaCy models.
@@ -67,8 +73,10 @@ class LDATopicsPipeline:
         temp_dir (str): Temporary directory for model files and intermediate outputs
         temp_output_file: Temporary file handle for Mallet output
         latest_model (Optional[str]): Version string of the latest topic model
+        model (Optional[ResolvedTopicModel]): Resolved model handle for the current language
         doc_counter (int): Counter for auto-generated document names
         language (Optional[str]): Detected or specified language code
+        in_process (bool): Whether vectorization and inference run in memory
         
     Example:
         >>> pipeline = LDATopicsPipeline()
@@ -81,12 +89,16 @@ class LDATopicsPipeline:
         >>> print(f"Topics: {len(result['topics'])}")
     """
 
-    def __init__(self) -> None:
+    def __init__(self, in_process: bool = True) -> None:
         """
         Initialize the LDA topics pipeline.
         
         Sets up temporary directories, downloads Mallet JAR files from Hugging Face,
         and initializes the Java Virtual Machine (JVM) with Mallet's classpath.
+
+        Args:
+            in_process: If True (default), vectorize and infer topics in memory
+                through JPype. If False, use the file-based Mallet command path.
         
         Raises:
             RuntimeError: If JVM cannot be started or Mallet classes are unavailable
@@ -96,11 +108,13 @@ class LDATopicsPipeline:
         self.temp_output_file = None  # Placeholder for temporary output file
         self.latest_model = None
         self.doc_counter = 0
+        self.in_process = in_process
         self.lang_identifier = LangIdentPipeline()
         self.supported_languages = SUPPORTED_LANGUAGES
         self.topic_model_descriptions = TOPIC_MODEL_DESCRIPTIONS
         self.topic_model_descriptions_hf = TOPIC_MODEL_DESCRIPTIONS_HF
-        self._spacy_pipelines: Dict[Tuple[str, str], Any] = {}
+        self.model: Optional[ResolvedTopicModel] = None
+        self._resolved_models: Dict[str, ResolvedTopicModel] = {}
 
         # Start JVM if not already running
         if not jpype.isJVMStarted():
@@ -154,16 +168,16 @@ class LDATopicsPipeline:
             Path to the directory containing the downloaded Mallet JAR files.
             
         Note:
-            Files are cached by Hugging Face Hub, so subsequent calls won't re-download.
+            Files are cached by Hugging Face Hub and served by the shared model
+            registry, so subsequent calls neither re-download nor contact the hub.
         """
         jar_files = ["mallet.jar", "mallet-deps.jar"]
         jar_paths = []
 
         for jar_name in jar_files:
             logger.info("Downloading %s from Hugging Face Hub...", jar_name)
-            jar_path = hf_hub_download(
-                repo_id="impresso-project/mallet-topic-inferencer",
-                filename=f"mallet/lib/{jar_name}"
+            jar_path = get_registry().download(
+                "impresso-project/mallet-topic-inferencer", f"mallet/lib/{jar_name}"
             )
             jar_paths.append(jar_path)
 
@@ -221,12 +235,6 @@ class LDATopicsPipeline:
         if self.min_p < 0.02:
             raise ValueError("min_p must be at least 0.02")
        
-        self.temp_output_file = tempfile.NamedTemporaryFile(
-            prefix="tmp_output_", suffix=".mallet", dir=self.temp_dir, delete=False
-        )
-        self.output_file = self.temp_output_file.name
-       
-
         # PART 1: Language Identification
         self.language = language
         if self.language is None:
@@ -243,15 +251,151 @@ class LDATopicsPipeline:
         # PART 2: Lemmatization using SpaCy
         lemma_text = self.SPACY(text)
 
-        # PART 3: Vectorization using Mallet
-        self.vectorizer_mallet(lemma_text, self.output_file, doc_name)
+        if self.in_process:
+            # PART 3-4: In-memory vectorization, inference and JSONification
+            name = doc_name if doc_name is not None else f"doc{self.doc_counter}"
+            distributions = self.infer_topic_distributions([lemma_text], [name])
+            output = self.topic_assignments([name], distributions)
+        else:
+            output = self.file_topic_assignments(lemma_text, doc_name)
 
-        # PART 4: Mallet inferencer and JSONification
-        self.mallet_inferencer()
+        output = self.finalize_output(
+            output, [lemma_text], diagnostics_lemmatization, diagnostics_topics
+        )
 
-        # PART 5: Return the JSON output
-        output = self.json_output(filepath=os.path.join(self.temp_dir, "tmp_output.jsonl"))
+        if doc_name is None:
+            self.doc_counter += 1  # Increment the document counter for the next call
+        return output[0]  # Returns clean lemmatized text without punctuation
+
+    def batch(
+        self,
+        docs: Iterable[Dict[str, Any]],
+        diagnostics_lemmatization: bool = False,
+        diagnostics_topics: bool = False,
+        min_relevance: float = 0.02,
+        n_process: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the topic modeling pipeline on many documents at once.
+
+        Documents are processed in bulk: languages are identified in a single
+        LangIdentPipeline.batch() call, each language group is lemmatized with
+        spaCy's nlp.pipe(), vectorized into one Mallet InstanceList and inferred
+        in one pass. Annotating a newspaper issue therefore costs one JVM
+        round-trip per language instead of one per article. With
+        ``in_process=False``, each document goes through the file-based Mallet
+        path after the batched language identification and lemmatization.
+
+        Args:
+            docs: Iterable of dictionaries with keys 'text', and optionally
+                'id' (auto-generated if missing) and 'language' (auto-detected
+                if missing)
+            diagnostics_lemmatization: If True, includes lemmatized text in output
+            diagnostics_topics: If True, includes top-10 words for each topic
+            min_relevance: Minimum topic relevance threshold (must be >= 0.02)
+            n_process: Number of spaCy worker processes used for lemmatization
+
+        Returns:
+            List of result dictionaries in input order, with the same structure
+            as the output of __call__
+
+        Raises:
+            ValueError: If min_relevance < 0.02 or a language is not supported
+
+        Example:
+            >>> pipeline = LDATopicsPipeline()
+            >>> results = pipeline.batch([
+            ...     {"id": "GDL-1900-01-01-a-i0001", "text": "Le gouvernement a annoncé..."},
+            ...     {"id": "GDL-1900-01-01-a-i0002", "text": "Der Bundesrat hat...", "language": "de"},
+            ... ])
+            >>> [r["language"] for r in results]
+            ['fr', 'de']
+        """
+        self.min_p = min_relevance
+        if self.min_p < 0.02:
+            raise ValueError("min_p must be at least 0.02")
+
+        docs = list(docs)
+        names = []
+        for doc in docs:
+            if doc.get("id") is not None:
+                names.append(doc["id"])
+            else:
+                names.append(f"doc{self.doc_counter}")
+                self.doc_counter += 1
+
+        # PART 1: Language Identification, in one call for all documents without a language
+        languages = [doc.get("language") for doc in docs]
+        missing = [i for i, language in enumerate(languages) if language is None]
+        if missing:
+            detected = self.lang_identifier.batch([docs[i]["text"] for i in missing])
+            for i, language in zip(missing, detected["language"]):
+                languages[i] = str(language)
+
+        unsupported = set(languages) - set(self.supported_languages)
+        if unsupported:
+            raise ValueError(
+                f"Unsupported language(s): {sorted(unsupported)}. Supported languages are: {self.supported_languages.keys()}"
+            )
+
+        groups: Dict[str, List[int]] = {}
+        for i, language in enumerate(languages):
+            groups.setdefault(language, []).append(i)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(docs)
+        for language, indices in groups.items():
+            self.language = language
+            self.find_latest_model_version()
+            group_names = [names[i] for i in indices]
+
+            # PART 2: Lemmatization using SpaCy, batched with nlp.pipe
+            lemma_texts = list(
+                self.model.spacy.pipe(
+                    (docs[i]["text"] for i in indices), n_process=n_process
+                )
+            )
+
+            if self.in_process:
+                # PART 3-4: One InstanceList and one inference pass per language
+                distributions = self.infer_topic_distributions(lemma_texts, group_names)
+                output = self.topic_assignments(group_names, distributions)
+            else:
+                # PART 3-5: File-based Mallet commands, one document at a time
+                output = [
+                    entry
+                    for lemma_text, name in zip(lemma_texts, group_names)
+                    for entry in self.file_topic_assignments(lemma_text, name)
+                ]
+            output = self.finalize_output(
+                output, lemma_texts, diagnostics_lemmatization, diagnostics_topics
+            )
+            for i, entry in zip(indices, output):
+                results[i] = entry
+
+        return results
+
+    def finalize_output(
+        self,
+        output: List[Dict[str, Any]],
+        lemma_texts: Sequence[List[str]],
+        diagnostics_lemmatization: bool = False,
+        diagnostics_topics: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Turn Mallet2TopicAssignment entries into the public pipeline output.
+
+        Adds the topic model description and optional diagnostics for
+        self.language, and renames the internal keys to the public ones.
+
+        Args:
+            output: Topic assignment dictionaries, one per document
+            lemma_texts: Lemmatized documents, aligned with output
+            diagnostics_lemmatization: If True, includes lemmatized text in output
+            diagnostics_topics: If True, includes top-10 words for each topic
 
+        Returns:
+            List of result dictionaries as returned by __call__ and batch()
+        """
         # for each entry in the output list, add key "topic_model_description" with the value from the config file for the language
         for entry in output:
             entry["topic_model_description"] = self.topic_model_descriptions[self.language]
@@ -265,9 +409,9 @@ class LDATopicsPipeline:
         # rename the key "min_p" to "min_relevance" in the output list, preserving the original key order
         output = [self.rename_key_preserve_position(entry, 'min_p', 'min_relevance') for entry in output]
             
-        # for each entry in output, if diagnostics_lemmatization is True, add the key "diagnostics_lemmatization" with the value of lemma_text
+        # for each entry in output, if diagnostics_lemmatization is True, add the key "diagnostics_lemmatization" with the value of its lemma_text
         if diagnostics_lemmatization:
-            for entry in output:
+            for entry, lemma_text in zip(output, lemma_texts):
                 entry["diagnostics_lemmatization"] = lemma_text
         
         if diagnostics_topics:
@@ -279,36 +423,47 @@ class LDATopicsPipeline:
                 for topic in entry["topics"]:
                     topic["uid"] = topic.pop("t", None)
                     topic["relevance"] = topic.pop("p", None)
-                    
 
-        if doc_name is None:
-            self.doc_counter += 1  # Increment the document counter for the next call
-        return output[0]  # Returns clean lemmatized text without punctuation
+        return output
     
+    def resolve_model(self, language: str) -> ResolvedTopicModel:
+        """
+        Return the resolved topic model handle for a language, memoized per pipeline.
+
+        The first call for a language looks up the latest model version and fetches
+        the Mallet pipe and inferencer files; later calls are dictionary lookups.
+
+        Args:
+            language: Language code ('fr', 'de', 'lb')
+
+        Returns:
+            The resolved model handle for the language
+
+        Raises:
+            ValueError: If no model version is found for the language
+        """
+        model = self._resolved_models.get(language)
+        if model is None:
+            model = ResolvedTopicModel.resolve(language)
+            self._resolved_models[language] = model
+        return model
+
     def find_latest_model_version(self) -> None:
         """
         Find and set the latest topic model version for the current language.
         
-        Queries Hugging Face Hub for available model versions and selects the
-        most recent one based on version numbering in filenames.
+        Uses the memoized model handle from resolve_model(), so only the first
+        document of each language triggers a lookup of available model versions.
 
         Raises:
             ValueError: If no model version is found for the specified language
             
         Side effects:
-            Sets self.latest_model to the version string (e.g., "2.1.0")
+            Sets self.model to the resolved handle and self.latest_model to its
+            version string (e.g., "2.1.0")
         """
-        repo_id = "impresso-project/mallet-topic-inferencer"
-        files = list_repo_files(repo_id)
-        versions = [f for f in files if f.startswith(f"models/tm/tm-{self.language}-all") and f.endswith(".pipe")] # check version of pipe 
-        
-        # Extract version numbers and find the latest one
-        versions.sort(reverse=True)
-        # extract the version number from the filename and set self.latest_model to the latest version
-        if versions:
-            self.latest_model = versions[0].split('-v')[-1].replace('.pipe', '')
-        else:
-            raise ValueError(f"Could not get latest version for language: {self.language}")
+        self.model = self.resolve_model(self.language)
+        self.latest_model = self.model.version
 
     def language_detection(self, text: str) -> str:
         """
@@ -331,8 +486,8 @@ class LDATopicsPipeline:
         """
         Lemmatize input text using language-specific SpaCy models.
         
-        Downloads and uses the appropriate SpaCy model based on self.language.
-        The model is configured for the specific topic model version being used.
+        Uses the SpaCy model of the resolved topic model for self.language, which
+        is loaded once per language and configured for that model version.
 
         Args:
             text: Input text to lemmatize
@@ -346,24 +501,90 @@ class LDATopicsPipeline:
         Note:
             SpaCy models are downloaded automatically if not already present.
         """
-        from impresso_pipelines.ldatopics.SPACY import SPACY as SpacyPipeline  # Lazy import
+        return self.resolve_model(self.language).spacy(text)
+
+    def infer_topic_distributions(
+        self, documents: Sequence[List[str]], doc_names: Sequence[str]
+    ) -> np.ndarray:
+        """
+        Infer topic distributions of lemmatized documents in memory.
+
+        Uses the in-process Mallet inferencer of the resolved model for the
+        current language; no temporary files are written.
+
+        Args:
+            documents: One list of lemmas per document
+            doc_names: Document identifiers, aligned with documents
+
+        Returns:
+            Array of shape (n_documents, n_topics) with topic proportions
+        """
+        return self.resolve_model(self.language).inferencer.infer(documents, doc_names)
+
+    def topic_assignments(
+        self, doc_names: Sequence[str], distributions: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert topic distributions to impresso topic assignment dictionaries.
+
+        Produces the same structure as the file-based path (Mallet2TopicAssignment
+        on a doctopics file), using self.language and self.min_p.
+
+        Args:
+            doc_names: Document identifiers, aligned with distributions
+            distributions: Array of shape (n_documents, n_topics)
+
+        Returns:
+            List of topic assignment dictionaries, one per document
+        """
+        converter = Mallet2TopicAssignment(
+            min_p=self.min_p,
+            lang=self.language,
+            topic_model=self.resolve_model(self.language).model_id,
+            numeric_topic_ids=False,
+            input_format_type="matrix",
+            topic_count=distributions.shape[1],
+            output="<generator>",
+            no_jsonschema_validation=True,
+        )
+        return converter.convert_matrix(doc_names, distributions)
+
+    def file_topic_assignments(
+        self, lemma_text: str, doc_name: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Assign topics to one document through the file-based Mallet path.
+
+        Used instead of the in-process inferencer when ``in_process=False``:
+        the document is vectorized into a temporary Mallet file, inferred with
+        MalletTopicInferencer and the JSONL output is read back.
+
+        Args:
+            lemma_text: Lemmatized text of the document
+            doc_name: Document identifier. Auto-generated if None.
+
+        Returns:
+            List of topic assignment dictionaries read from the inference output
+        """
+        self.temp_output_file = tempfile.NamedTemporaryFile(
+            prefix="tmp_output_", suffix=".mallet", dir=self.temp_dir, delete=False
+        )
+        self.output_file = self.temp_output_file.name
+
+        # PART 3: Vectorization using Mallet
+        self.vectorizer_mallet(lemma_text, self.output_file, doc_name)
 
-        model_id = self.supported_languages[self.language]
-        if not model_id:
-            raise ValueError(f"No SpaCy model available for {self.language}")
+        # PART 4: Mallet inferencer and JSONification
+        self.mallet_inferencer()
 
-        cache_key = (self.language, self.latest_model)
-        nlp = self._spacy_pipelines.get(cache_key)
-        if nlp is None:
-            nlp = SpacyPipeline(model_id, self.language, self.latest_model)
-            self._spacy_pipelines[cache_key] = nlp
-        return nlp(text)
+        # PART 5: Return the JSON output
+        return self.json_output(filepath=os.path.join(self.temp_dir, "tmp_output.jsonl"))
 
     def vectorizer_mallet(self, text: str, output_file: str, doc_name: str) -> None:
         """
         Vectorize lemmatized text using Mallet's pipeline.
         
-        Loads the appropriate Mallet pipeline file for the current language and
+        Uses the resolved Mallet pipeline file for the current language and
         version, then converts text to Mallet's vector format.
 
         Args:
@@ -377,14 +598,7 @@ class LDATopicsPipeline:
         from impresso_pipelines.ldatopics.mallet_vectorizer_changed import MalletVectorizer  # Lazy import
 
 
-        # Load the Mallet pipeline
-        pipe_file = hf_hub_download(
-            repo_id="impresso-project/mallet-topic-inferencer",
-            filename=f"models/tm/tm-{self.language}-all-v{self.latest_model}.pipe"
-        )
-
-
-        
+        pipe_file = self.resolve_model(self.language).pipe_path
         mallet = MalletVectorizer(pipe_file, output_file)
         if doc_name is not None:
             mallet(text, doc_name)
@@ -395,7 +609,7 @@ class LDATopicsPipeline:
         """
         Run Mallet topic inference on vectorized text.
         
-        Downloads pre-trained topic model files (inferencer and pipe) from Hugging Face,
+        Uses the resolved topic model files (inferencer and pipe) for the current language,
         configures the MalletTopicInferencer with appropriate parameters, and executes
         topic inference.
         
@@ -406,18 +620,9 @@ class LDATopicsPipeline:
             Uses self.language, self.latest_model, and self.min_p to configure inference.
         """
         lang = self.language  # adjusting calling based on language
-
-
-        inferencer_pipe = hf_hub_download(
-            repo_id="impresso-project/mallet-topic-inferencer",
-            filename=f"models/tm/tm-{lang}-all-v{self.latest_model}.pipe"
-        )
-        
-        inferencer_file = hf_hub_download(  
-            repo_id="impresso-project/mallet-topic-inferencer",
-            filename=f"models/tm/tm-{lang}-all-v{self.latest_model}.inferencer"
-        )
-      
+        model = self.resolve_model(lang)
+        inferencer_pipe = model.pipe_path
+        inferencer_file = model.inferencer_path
 
 
         args = argparse.Namespace(
@@ -429,7 +634,7 @@ class LDATopicsPipeline:
             **{
                 f"{lang}_inferencer": inferencer_file,
                 f"{lang}_pipe": inferencer_pipe,
-                f"{lang}_model_id": f"tm-{lang}-all-v{self.latest_model}",
+                f"{lang}_model_id": model.model_id,
                 f"{lang}_topic_count": 20
             },
             min_p=self.min_p,
@@ -491,8 +696,9 @@ class LDATopicsPipeline:
         """
         Add top-10 topic words to output for diagnostic purposes.
         
-        Downloads pre-computed topic descriptions from Hugging Face, extracts the
-        top 10 words for each topic, and adds them to the output under 'diagnostics_topics'.
+        Looks up the top 10 words of each topic in the topic word index of the
+        resolved model, which is built once per language from the pre-computed
+        topic descriptions, and adds them to the output under 'diagnostics_topics'.
 
         Args:
             output: Single result dictionary or list of result dictionaries
@@ -516,47 +722,16 @@ class LDATopicsPipeline:
         if isinstance(output, list):
             return [self.add_topic_words_to_output(item) for item in output]
 
-        # 1) Lookup repo_id & filename from your config
-        try:
-            repo_id, hf_filename = self.topic_model_descriptions_hf[self.language]
-        except KeyError:
-            raise ValueError(f"No HF topic‐description entry for language '{self.language}'")
-
-        # 2) Download the compressed .jsonl.bz2 from HF
-        compressed = hf_hub_download(repo_id=repo_id, filename=hf_filename)
-
-        # 3) Unpack into a temp folder
-        temp_dir = tempfile.mkdtemp(prefix="topic_desc_")
-        try:
-            jsonl_path = os.path.join(temp_dir, "topic_model_descriptions.jsonl")
-            with bz2.open(compressed, "rb") as f_in, open(jsonl_path, "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
-
-            # 4) Build a map: full_topic_id → top-10 words
-            topic_to_words = {}
-            with open(jsonl_path, "r", encoding="utf-8") as fin:
-                for line in fin:
-                    data = json.loads(line)
-                    # use the JSONL's `id` field, which matches your output['topics'][*]['t']
-                    full_id = data["id"]
-                    word_probs = data.get("word_probs", [])
-                    # sort by prob desc, take the first 10 words
-                    top10 = [
-                        wp["word"]
-                        for wp in sorted(word_probs, key=lambda x: x.get("prob", 0), reverse=True)[:10]
-                    ]
-                    topic_to_words[full_id] = top10
-
-            # 5) Stitch into output
-            diagnostics = {}
-            for t in output.get("topics", []):
-                key = t.get("t") or t.get("topic_model")
-                diagnostics[key] = topic_to_words.get(key, [])
-
-            output["diagnostics_topics"] = diagnostics
-
-        finally:
-            shutil.rmtree(temp_dir)
+        # Map: full_topic_id → top-10 words, built once per language
+        topic_to_words = self.resolve_model(self.language).topic_words
+
+        # Stitch into output
+        diagnostics = {}
+        for t in output.get("topics", []):
+            key = t.get("t") or t.get("topic_model")
+            diagnostics[key] = topic_to_words.get(key, [])
+
+        output["diagnostics_topics"] = diagnostics
 
         return output
 
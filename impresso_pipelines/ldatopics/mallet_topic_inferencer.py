@@ -35,7 +35,7 @@ import json
 import csv
 import tempfile
 
-from typing import List, Dict, Generator, Optional, Set, Iterable, Any
+from typing import List, Dict, Generator, Mapping, Optional, Set, Iterable, Any
 
 import impresso_pipelines.ldatopics.language_inferencer as language_inferencer
 # Remove direct imports to avoid circular dependencies
@@ -45,6 +45,7 @@ from smart_open import open
 
 
 from impresso_pipelines.ldatopics.language_inferencer import LanguageInferencer
+from impresso_pipelines.ldatopics.lemma_table import load_lemma_table
 
 from impresso_pipelines.ldatopics.input_reader import (
     InputReader,
@@ -96,7 +97,7 @@ class MalletTopicInferencer:
         self.args = args
         self.languages = set(args.languages)
         self.language_inferencers: Optional[Dict[str, LanguageInferencer]] = None
-        self.language_lemmatizations: Optional[Dict[str, Dict[str, str]]] = None
+        self.language_lemmatizations: Optional[Dict[str, Mapping[str, str]]] = None
         self.language_ma2ta_converters: Optional[Dict[str, Generator]] = None
         self.language_configs: Optional[Dict[str, Dict[str, str]]] = None
         self.input_reader = None
@@ -245,13 +246,31 @@ class MalletTopicInferencer:
         bidi: bool = False,
         lowercase: bool = False,
         ignore_pos: bool = True,
-    ) -> Dict[str, str]:
+    ) -> Mapping[str, str]:
         """
         Load lemmatization data from the file.
+
+        Local files are compiled once into a memory-mapped lemma table (see
+        lemma_table.py) that is shared read-only across processes; remote
+        files are read into a dictionary.
+
         :param lemmatization_file_path: Path to the lemmatization file.
-        :return: A dictionary mapping tokens to their corresponding lemmas.
+        :return: A mapping of tokens to their corresponding lemmas.
         """
 
+        if os.path.isfile(lemmatization_file_path):
+            table = load_lemma_table(
+                lemmatization_file_path,
+                lowercase_keys=lowercase,
+                lowercase_values=lowercase,
+            )
+            logging.info(
+                "Loaded %d lemmatization entries from %s",
+                len(table),
+                getattr(table, "path", lemmatization_file_path),
+            )
+            return table
+
         token2lemma = {}
         n = 0
         logging.info(
@@ -326,11 +345,11 @@ class MalletTopicInferencer:
 
     def init_language_lemmatizations(
         self, args: argparse.Namespace
-    ) -> Dict[str, Dict[str, str]]:
+    ) -> Dict[str, Mapping[str, str]]:
         """Build a mapping of languages to their respective lemmatization
         dictionaries."""
 
-        language_lemmatizations: Dict[str, Dict[str, str]] = {}
+        language_lemmatizations: Dict[str, Mapping[str, str]] = {}
         for language in args.languages:
             lemmatization_key = f"{language}_lemmatization"
             if getattr(args, lemmatization_key, None):
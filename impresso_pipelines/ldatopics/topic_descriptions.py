@@ -0,0 +1,98 @@
+"""
+Cached top-k word index of topic model descriptions.
+
+Topic descriptions ship as a bz2-compressed JSONL file with the full word
+distribution of every topic. Diagnostics only need the top words of a few
+topics, so this module parses the file once, keeps the top-k words per topic
+and persists that index as a small JSON file. Later loads read the index
+directly instead of decompressing and sorting the full descriptions.
+
+Configuration (environment variables):
+    IMPRESSO_TOPIC_INDEX_DIR: Directory for topic word indexes
+        (default: ~/.cache/impresso_pipelines/topic_descriptions)
+
+Example usage:
+    >>> index = load_topic_words("tm-fr-all-v2.0.topic_model_topic_description.jsonl.bz2")
+    >>> index["tm-fr-all-v2.0_tp07_fr"]
+    ['guerre', 'armée', 'soldat', ...]
+"""
+
+import bz2
+import heapq
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+from impresso_pipelines.ldatopics.file_cache import (
+    atomic_write,
+    file_fingerprint,
+    resolve_cache_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOPIC_INDEX_DIR: str = os.path.join(
+    "~", ".cache", "impresso_pipelines", "topic_descriptions"
+)
+DEFAULT_TOP_K: int = 10
+
+
+def build_topic_words(descriptions_path: str, k: int = DEFAULT_TOP_K) -> Dict[str, List[str]]:
+    """
+    Parse a compressed topic description file into a top-k word index.
+
+    Args:
+        descriptions_path: Path of the .jsonl.bz2 topic description file
+        k: Number of words kept per topic, by decreasing probability
+
+    Returns:
+        Mapping of topic ids (the JSONL 'id' field) to their top-k words
+    """
+    topic_words: Dict[str, List[str]] = {}
+    with bz2.open(descriptions_path, "rt", encoding="utf-8") as f:
+        for line in f:
+            data = json.loads(line)
+            top_k = heapq.nlargest(
+                k, data.get("word_probs", []), key=lambda x: x.get("prob", 0)
+            )
+            topic_words[data["id"]] = [wp["word"] for wp in top_k]
+    return topic_words
+
+
+def load_topic_words(
+    descriptions_path: str,
+    k: int = DEFAULT_TOP_K,
+    cache_dir: Optional[str] = None,
+) -> Dict[str, List[str]]:
+    """
+    Load the top-k word index of a topic description file, building it on first use.
+
+    The index is persisted under a name derived from the real path, size and
+    modification time of the description file and k, and is written with
+    file_cache.atomic_write so concurrent workers never read a partial index.
+
+    Args:
+        descriptions_path: Path of the .jsonl.bz2 topic description file
+        k: Number of words kept per topic
+        cache_dir: Directory for indexes (default: IMPRESSO_TOPIC_INDEX_DIR or
+            ~/.cache/impresso_pipelines/topic_descriptions)
+
+    Returns:
+        Mapping of topic ids to their top-k words
+    """
+    cache_dir = resolve_cache_dir(cache_dir, "IMPRESSO_TOPIC_INDEX_DIR", DEFAULT_TOPIC_INDEX_DIR)
+    fingerprint = file_fingerprint(descriptions_path)
+    name = os.path.basename(descriptions_path).split(".jsonl")[0]
+    index_path = os.path.join(cache_dir, f"{name}.top{k}.{fingerprint}.json")
+
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    logger.info("Building top-%d topic word index for %s", k, descriptions_path)
+    topic_words = build_topic_words(descriptions_path, k)
+    atomic_write(index_path, lambda f: json.dump(topic_words, f, ensure_ascii=False))
+    return topic_words
@@ -0,0 +1,168 @@
+"""
+Per-language resolved topic model handles for the LDA topics pipeline.
+
+A ResolvedTopicModel bundles everything the pipeline needs for one language:
+the model version, the local paths of the Mallet pipe and inferencer files, the
+topic description file, the spaCy lemmatizer and the in-process Mallet
+inferencer. It is resolved once through the shared model registry and then
+reused, so per-document processing performs no Hugging Face Hub metadata
+requests.
+
+Example usage:
+    >>> model = ResolvedTopicModel.resolve("fr")
+    >>> model.model_id
+    'tm-fr-all-v2.0'
+    >>> lemmas = model.spacy("Le gouvernement a annoncé de nouvelles mesures.")
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from impresso_pipelines.ldatopics.config import (
+    SUPPORTED_LANGUAGES,
+    TOPIC_MODEL_DESCRIPTIONS_HF,
+)
+from impresso_pipelines.ldatopics.topic_descriptions import load_topic_words
+from impresso_pipelines.model_registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+TOPIC_MODEL_REPO_ID: str = "impresso-project/mallet-topic-inferencer"
+
+
+class ResolvedTopicModel:
+    """
+    Resolved files and lazily loaded components of one language's topic model.
+
+    Attributes:
+        language (str): Language code ('fr', 'de', 'lb')
+        version (str): Topic model version (e.g., "2.0")
+        model_id (str): Topic model identifier (e.g., "tm-fr-all-v2.0")
+        pipe_path (str): Local path of the Mallet .pipe file
+        inferencer_path (str): Local path of the Mallet .inferencer file
+        repo_id (str): Hugging Face repository holding the model files
+    """
+
+    def __init__(
+        self,
+        language: str,
+        version: str,
+        pipe_path: str,
+        inferencer_path: str,
+        repo_id: str = TOPIC_MODEL_REPO_ID,
+    ) -> None:
+        self.language = language
+        self.version = version
+        self.model_id = f"tm-{language}-all-v{version}"
+        self.pipe_path = pipe_path
+        self.inferencer_path = inferencer_path
+        self.repo_id = repo_id
+        self._topic_descriptions_path: Optional[str] = None
+        self._topic_words: Optional[Dict[str, List[str]]] = None
+        self._spacy: Optional[Any] = None
+        self._inferencer: Optional[Any] = None
+
+    @classmethod
+    def resolve(
+        cls, language: str, repo_id: str = TOPIC_MODEL_REPO_ID
+    ) -> "ResolvedTopicModel":
+        """
+        Find the latest model version for a language and fetch its Mallet files.
+
+        Args:
+            language: Language code ('fr', 'de', 'lb')
+            repo_id: Hugging Face repository holding the topic models
+
+        Returns:
+            A resolved handle for the latest topic model of the language
+
+        Raises:
+            ValueError: If no model version is found for the language
+        """
+        registry = get_registry()
+        files = registry.list_repo_files(repo_id)
+        versions = [
+            f
+            for f in files
+            if f.startswith(f"models/tm/tm-{language}-all") and f.endswith(".pipe")
+        ]
+        if not versions:
+            raise ValueError(f"Could not get latest version for language: {language}")
+
+        versions.sort(reverse=True)
+        version = versions[0].split("-v")[-1].replace(".pipe", "")
+        model_prefix = f"models/tm/tm-{language}-all-v{version}"
+        logger.info("Resolved topic model for %s: %s", language, model_prefix)
+
+        return cls(
+            language=language,
+            version=version,
+            pipe_path=registry.download(repo_id, f"{model_prefix}.pipe"),
+            inferencer_path=registry.download(repo_id, f"{model_prefix}.inferencer"),
+            repo_id=repo_id,
+        )
+
+    @property
+    def topic_descriptions_path(self) -> str:
+        """
+        Local path of the compressed topic description file (.jsonl.bz2).
+
+        Raises:
+            ValueError: If no topic description file is configured for the language
+        """
+        if self._topic_descriptions_path is None:
+            try:
+                repo_id, filename = TOPIC_MODEL_DESCRIPTIONS_HF[self.language]
+            except KeyError:
+                raise ValueError(
+                    f"No HF topic‐description entry for language '{self.language}'"
+                )
+            self._topic_descriptions_path = get_registry().download(repo_id, filename)
+        return self._topic_descriptions_path
+
+    @property
+    def topic_words(self) -> Dict[str, List[str]]:
+        """
+        Top-10 words of every topic, keyed by topic id, loaded on first access.
+
+        Built once from the topic description file and persisted as a compact
+        index (see topic_descriptions.py).
+
+        Raises:
+            ValueError: If no topic description file is configured for the language
+        """
+        if self._topic_words is None:
+            self._topic_words = load_topic_words(self.topic_descriptions_path)
+        return self._topic_words
+
+    @property
+    def spacy(self) -> Any:
+        """
+        The spaCy lemmatizer configured for this model, loaded on first access.
+
+        Raises:
+            ValueError: If no spaCy model is available for the language
+        """
+        if self._spacy is None:
+            from impresso_pipelines.ldatopics.SPACY import SPACY as SpacyPipeline  # Lazy import
+
+            spacy_model_id = SUPPORTED_LANGUAGES.get(self.language)
+            if not spacy_model_id:
+                raise ValueError(f"No SpaCy model available for {self.language}")
+            self._spacy = SpacyPipeline(spacy_model_id, self.language, self.version)
+        return self._spacy
+
+    @property
+    def inferencer(self) -> Any:
+        """
+        The in-process Mallet inferencer for this model, loaded on first access.
+
+        Requires a running JVM with the Mallet jars on the classpath.
+        """
+        if self._inferencer is None:
+            from impresso_pipelines.ldatopics.inprocess_inferencer import InProcessInferencer  # Lazy import
+
+            self._inferencer = InProcessInferencer(
+                self.language, self.inferencer_path, self.pipe_path
+            )
+        return self._inferencer
@@ -0,0 +1,280 @@
+"""
+Local model registry shared by all impresso pipelines.
+
+Pipelines discover their "latest" model by listing the files of a Hugging Face
+repository. This module resolves each repository listing once, persists it to a
+JSON manifest on disk and serves subsequent lookups from that manifest until its
+time-to-live (TTL) expires. File downloads are served straight from the Hugging
+Face cache when the file is already present, so that after the first resolution
+a worker needs no network access at all.
+
+Configuration (environment variables):
+    IMPRESSO_MODEL_REGISTRY_DIR: Directory for manifests
+        (default: ~/.cache/impresso_pipelines/registry)
+    IMPRESSO_MODEL_REGISTRY_TTL: Manifest time-to-live in seconds (default: 86400).
+        A negative value means manifests never expire.
+    HF_HUB_OFFLINE: If set, the registry never contacts the hub and relies on
+        existing manifests and cached files only.
+
+Example usage:
+    >>> from impresso_pipelines.model_registry import get_registry
+    >>> registry = get_registry()
+    >>> files = registry.list_repo_files("impresso-project/impresso-floret-langident")
+    >>> registry.latest_file(files, r"langident-v(\\d+\\.\\d+\\.\\d+)\\.bin")
+    'langident-v1.2.3.bin'
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_DIR: str = os.path.join(
+    os.path.expanduser("~"), ".cache", "impresso_pipelines", "registry"
+)
+DEFAULT_TTL: float = 24 * 60 * 60
+
+
+def _env_flag(name: str) -> bool:
+    """Return True if the environment variable is set to a truthy value."""
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def parse_version(version: str) -> Tuple[int, ...]:
+    """
+    Convert a dotted version string into a tuple for numeric comparison.
+
+    Example:
+        >>> parse_version("2.10.0") > parse_version("2.9.1")
+        True
+    """
+    return tuple(int(part) for part in version.split("."))
+
+
+class ModelRegistry:
+    """
+    Resolve and persist Hugging Face repository listings for offline reuse.
+
+    Listings are kept in memory for the lifetime of the registry and in a JSON
+    manifest per (repo_id, revision) on disk. A fresh manifest is always served
+    without network access; a stale manifest is refreshed from the hub, but is
+    still served if the hub cannot be reached.
+
+    Attributes:
+        cache_dir: Directory where manifests are stored
+        ttl: Manifest time-to-live in seconds (negative: never expires)
+        offline: If True, never contact the Hugging Face Hub
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl: Optional[float] = None,
+        offline: Optional[bool] = None,
+    ) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            cache_dir: Manifest directory. Defaults to IMPRESSO_MODEL_REGISTRY_DIR
+                or DEFAULT_REGISTRY_DIR.
+            ttl: Manifest time-to-live in seconds. Defaults to
+                IMPRESSO_MODEL_REGISTRY_TTL or DEFAULT_TTL.
+            offline: Disable all hub access. Defaults to HF_HUB_OFFLINE.
+        """
+        self.cache_dir: str = cache_dir or os.environ.get(
+            "IMPRESSO_MODEL_REGISTRY_DIR", DEFAULT_REGISTRY_DIR
+        )
+        self.ttl: float = (
+            ttl
+            if ttl is not None
+            else float(os.environ.get("IMPRESSO_MODEL_REGISTRY_TTL", DEFAULT_TTL))
+        )
+        self.offline: bool = offline if offline is not None else _env_flag("HF_HUB_OFFLINE")
+        self._manifests: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # Stale manifests already served after a failed refresh (no retry per call)
+        self._stale_keys: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def _manifest_path(self, repo_id: str, revision: str) -> str:
+        """Return the manifest file path for a repository revision."""
+        safe_name = re.sub(r"[^A-Za-z0-9._-]+", "--", f"{repo_id}@{revision}")
+        return os.path.join(self.cache_dir, f"{safe_name}.json")
+
+    def _is_fresh(self, manifest: Dict[str, Any]) -> bool:
+        """Check whether a manifest is still within its TTL."""
+        if self.ttl < 0:
+            return True
+        return time.time() - manifest.get("resolved_at", 0) < self.ttl
+
+    def _read_manifest(self, repo_id: str, revision: str) -> Optional[Dict[str, Any]]:
+        """Load a manifest from disk, returning None if missing or unreadable."""
+        path = self._manifest_path(repo_id, revision)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable model manifest {path}: {e}")
+            return None
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Atomically persist a manifest so concurrent workers never see partial files."""
+        path = self._manifest_path(manifest["repo_id"], manifest["revision"])
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=1)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # A read-only cache must not break model resolution
+            logger.warning(f"Could not write model manifest {path}: {e}")
+
+    def _resolve(self, repo_id: str, revision: str) -> Dict[str, Any]:
+        """Return the manifest for a repository, refreshing it if needed."""
+        key = (repo_id, revision)
+        manifest = self._manifests.get(key)
+        if manifest is not None and (
+            self.offline or key in self._stale_keys or self._is_fresh(manifest)
+        ):
+            return manifest
+
+        with self._lock:
+            manifest = self._manifests.get(key) or self._read_manifest(repo_id, revision)
+            if manifest is not None and (self.offline or self._is_fresh(manifest)):
+                self._manifests[key] = manifest
+                return manifest
+
+            if self.offline:
+                raise RuntimeError(
+                    f"No model manifest for {repo_id}@{revision} in {self.cache_dir} "
+                    "and hub access is disabled (offline mode)."
+                )
+
+            from huggingface_hub import list_repo_files  # Lazy import
+
+            try:
+                logger.info(f"Resolving model files of {repo_id}@{revision} from the hub")
+                files = list_repo_files(repo_id, revision=revision)
+            except Exception as e:
+                if manifest is None:
+                    raise
+                logger.warning(
+                    f"Could not refresh model manifest for {repo_id}@{revision}, "
+                    f"using stale copy: {e}"
+                )
+                self._manifests[key] = manifest
+                self._stale_keys.add(key)
+                return manifest
+
+            manifest = {
+                "repo_id": repo_id,
+                "revision": revision,
+                "resolved_at": time.time(),
+                "files": sorted(files),
+                "latest": {},
+            }
+            self._write_manifest(manifest)
+            self._manifests[key] = manifest
+            return manifest
+
+    def list_repo_files(self, repo_id: str, revision: str = "main") -> List[str]:
+        """
+        List repository files, served from the manifest when possible.
+
+        Args:
+            repo_id: Hugging Face repository ID
+            revision: Repository revision - branch, tag, or commit hash
+
+        Returns:
+            Sorted list of file paths in the repository
+
+        Raises:
+            RuntimeError: If offline and no manifest exists for the repository
+        """
+        return list(self._resolve(repo_id, revision)["files"])
+
+    def latest_file(self, files: List[str], pattern: str) -> Optional[str]:
+        """
+        Select the file with the highest semantic version matching a pattern.
+
+        Args:
+            files: Candidate file paths
+            pattern: Regular expression whose first group captures the version
+
+        Returns:
+            The newest matching file, or None if nothing matches
+        """
+        regex = re.compile(pattern)
+        candidates = [
+            (parse_version(match.group(1)), file)
+            for file in files
+            if (match := regex.search(file))
+        ]
+        return max(candidates)[1] if candidates else None
+
+    def resolve_latest(
+        self, repo_id: str, pattern: str, revision: str = "main"
+    ) -> Optional[str]:
+        """
+        Resolve and remember the newest file of a repository matching a pattern.
+
+        The resolution is stored in the manifest, so subsequent processes reuse
+        the same pinned file until the manifest expires.
+
+        Args:
+            repo_id: Hugging Face repository ID
+            pattern: Regular expression whose first group captures the version
+            revision: Repository revision - branch, tag, or commit hash
+
+        Returns:
+            The newest matching file, or None if nothing matches
+        """
+        manifest = self._resolve(repo_id, revision)
+        with self._lock:
+            latest = manifest.setdefault("latest", {})
+            if pattern not in latest:
+                latest[pattern] = self.latest_file(manifest["files"], pattern)
+                self._write_manifest(manifest)
+            return latest[pattern]
+
+    def download(self, repo_id: str, filename: str, revision: str = "main") -> str:
+        """
+        Return a local path for a repository file, downloading it only if needed.
+
+        Files already present in the Hugging Face cache are returned without any
+        network request (hf_hub_download would otherwise check the remote ETag).
+
+        Args:
+            repo_id: Hugging Face repository ID
+            filename: File path within the repository
+            revision: Repository revision - branch, tag, or commit hash
+
+        Returns:
+            Local path to the file
+        """
+        from huggingface_hub import hf_hub_download, try_to_load_from_cache  # Lazy import
+
+        cached = try_to_load_from_cache(repo_id, filename, revision=revision)
+        if isinstance(cached, str):
+            return cached
+        return hf_hub_download(repo_id=repo_id, filename=filename, revision=revision)
+
+
+_DEFAULT_REGISTRY: Optional[ModelRegistry] = None
+
+
+def get_registry() -> ModelRegistry:
+    """Return the process-wide default ModelRegistry, creating it on first use."""
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
+        _DEFAULT_REGISTRY = ModelRegistry()
+    return _DEFAULT_REGISTRY
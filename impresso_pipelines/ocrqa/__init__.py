@@ -11,7 +11,7 @@ try:
     import pybloomfilter
     
     # Only import this after checking dependencies
-    from .ocrqa_pipeline import OCRQAPipeline
+    from .ocrqa_pipeline import OCRQAError, OCRQAPipeline
 except ImportError:
     raise ImportError(
         "The ocrqa subpackage requires additional dependencies. "
@@ -0,0 +1,3 @@
+from impresso_pipelines.ocrqa.cli import main
+
+main()
@@ -0,0 +1,306 @@
+"""
+Command-line runner scoring OCR quality of JSONL content items.
+
+Streams content items (one JSON object per line, e.g. impresso rebuilt data in
+.jsonl.bz2 files) from local paths or any smart_open URL, scores their text with
+OCRQAPipeline in a pool of worker processes and writes one JSON line per item,
+in input order. The BloomFilters of all supported languages are preloaded
+once in the parent process as read-only memory maps and shared with the
+workers, so the filter pages exist once on the host however many workers run.
+Throughput is logged in documents per second.
+
+Output lines contain the item id, the language and the score, plus the
+frequency-weighted token score and the model id (or diagnostics) on request.
+Items that cannot be scored (unsupported language, no BloomFilter of the
+requested version, ...) get an "error" field instead of a score.
+
+Example usage:
+    $ impresso-ocrqa GDL-1900.jsonl.bz2 -o GDL-1900.ocrqa.jsonl --workers 8
+    $ python -m impresso_pipelines.ocrqa s3://bucket/rebuilt/GDL-1900.jsonl.bz2 -o - \\
+        --language-field lg --token-cache-size 100000
+"""
+
+import argparse
+import bz2
+import gzip
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
+
+from impresso_pipelines.ocrqa.ocrqa_pipeline import OCRQAError, OCRQAPipeline
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_LOG_EVERY = 10000
+
+# Pipeline and scoring options of the current worker process
+_worker_pipeline: Optional[OCRQAPipeline] = None
+_worker_options: Dict[str, Any] = {}
+
+
+def open_text(path: str, mode: str = "r") -> IO[str]:
+    """
+    Open a local path, a smart_open URL or "-" (stdin/stdout) as text.
+
+    Compressed files (.bz2, .gz) are decompressed transparently. smart_open is
+    used when installed; otherwise only local paths are supported.
+
+    Args:
+        path: File path, URL (s3://, https://, ...) or "-"
+        mode: "r" or "w"
+
+    Returns:
+        A text file object (UTF-8)
+    """
+    if path == "-":
+        return sys.stdin if mode == "r" else sys.stdout
+    try:
+        from smart_open import open as smart_open  # Lazy import
+
+        return smart_open(path, mode, encoding="utf-8")
+    except ImportError:
+        if path.endswith(".bz2"):
+            return bz2.open(path, mode + "t", encoding="utf-8")
+        if path.endswith(".gz"):
+            return gzip.open(path, mode + "t", encoding="utf-8")
+        return open(path, mode, encoding="utf-8")
+
+
+def read_items(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream content items from JSONL files.
+
+    Args:
+        paths: Input paths or URLs
+
+    Yields:
+        One dictionary per non-empty line
+    """
+    for path in paths:
+        logger.info("Reading %s", path)
+        f = open_text(path, "r")
+        try:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+def _init_worker(pipeline_kwargs: Dict[str, Any], options: Dict[str, Any]) -> None:
+    """Create the pipeline of a worker process."""
+    global _worker_pipeline, _worker_options
+    _worker_pipeline = OCRQAPipeline(**pipeline_kwargs)
+    _worker_options = options
+
+
+def _score_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Score a chunk of content items with the worker's pipeline.
+
+    Args:
+        items: Content items of one chunk
+
+    Returns:
+        One output record per item, in input order
+    """
+    options = _worker_options
+    ids = [item.get(options["id_field"]) for item in items]
+    texts = [item.get(options["text_field"]) or "" for item in items]
+    languages = [
+        item.get(options["language_field"]) if options["language_field"] else None
+        for item in items
+    ]
+    score_kwargs = {
+        "version": options["version"],
+        "diagnostics": options["diagnostics"],
+        "model_id": options["model_id"],
+        "token_score": options["token_score"],
+    }
+
+    try:
+        results = _worker_pipeline.batch(texts, languages=languages, **score_kwargs)
+    except (ValueError, OCRQAError):
+        # Some item cannot be scored (e.g. unsupported language, or no filter of
+        # the requested version): score items one by one
+        results = []
+        for text, language in zip(texts, languages):
+            try:
+                results.extend(
+                    _worker_pipeline.batch([text], languages=[language], **score_kwargs)
+                )
+            except Exception as e:
+                results.append({"language": language, "error": str(e)})
+
+    return [{"id": doc_id, **result} for doc_id, result in zip(ids, results)]
+
+
+def _chunks(items: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(
+    inputs: List[str],
+    output: str = "-",
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    log_every: int = DEFAULT_LOG_EVERY,
+    pipeline_kwargs: Optional[Dict[str, Any]] = None,
+    preload: bool = True,
+    **options: Any,
+) -> int:
+    """
+    Score all content items of the inputs and write the results as JSONL.
+
+    Args:
+        inputs: Input paths or URLs of JSONL files
+        output: Output path or URL ("-" for stdout)
+        workers: Number of worker processes (0 or 1 scores in this process)
+        batch_size: Number of items sent to a worker at a time
+        log_every: Log throughput every this many items
+        pipeline_kwargs: Keyword arguments of OCRQAPipeline
+        preload: With several workers, preload the BloomFilters in this process
+            and share them with the workers (see OCRQAPipeline.preload_bloomfilters)
+        **options: Scoring options: id_field, text_field, language_field,
+            version, diagnostics, model_id, token_score
+
+    Returns:
+        Number of scored items
+    """
+    options = {
+        "id_field": "id",
+        "text_field": "ft",
+        "language_field": None,
+        "version": None,
+        "diagnostics": False,
+        "model_id": False,
+        "token_score": False,
+        **options,
+    }
+    pipeline_kwargs = pipeline_kwargs or {}
+    chunks = _chunks(read_items(inputs), batch_size)
+
+    pool = None
+    if workers > 1:
+        if preload and "shared_bloomfilters" not in pipeline_kwargs:
+            shared = OCRQAPipeline(**pipeline_kwargs).preload_bloomfilters(
+                version=options["version"]
+            )
+            pipeline_kwargs = {**pipeline_kwargs, "shared_bloomfilters": shared}
+        pool = multiprocessing.Pool(
+            workers, initializer=_init_worker, initargs=(pipeline_kwargs, options)
+        )
+        scored_chunks = pool.imap(_score_items, chunks)
+    else:
+        _init_worker(pipeline_kwargs, options)
+        scored_chunks = map(_score_items, chunks)
+
+    count = 0
+    next_log = log_every
+    start = time.perf_counter()
+    out = None
+    try:
+        out = open_text(output, "w")
+        for records in scored_chunks:
+            for record in records:
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += len(records)
+            if count >= next_log:
+                elapsed = time.perf_counter() - start
+                logger.info("Scored %d docs (%.1f docs/s)", count, count / elapsed)
+                next_log += log_every
+    except BaseException:
+        # Do not wait for the workers to score the chunks already queued
+        if pool is not None:
+            pool.terminate()
+        raise
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "Scored %d docs in %.1fs (%.1f docs/s) with %d worker(s)",
+        count,
+        elapsed,
+        count / elapsed if elapsed else 0.0,
+        max(workers, 1),
+    )
+    return count
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="impresso-ocrqa",
+        description="Score OCR quality of JSONL content items with OCRQAPipeline.",
+    )
+    parser.add_argument("inputs", nargs="+", help="Input JSONL files or URLs (.bz2/.gz supported, - for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Output JSONL file or URL (default: stdout)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Items per worker task (default: %(default)s)")
+    parser.add_argument("--id-field", default="id", help="Field holding the item id (default: %(default)s)")
+    parser.add_argument("--text-field", default="ft", help="Field holding the text (default: %(default)s)")
+    parser.add_argument("--language-field", default=None, help="Field holding a known language; detected if missing")
+    parser.add_argument("--version", default=None, help="BloomFilter version (default: latest per language)")
+    parser.add_argument("--diagnostics", action="store_true", help="Include known/unknown tokens")
+    parser.add_argument("--model-id", action="store_true", help="Include the BloomFilter model id")
+    parser.add_argument("--token-score", action="store_true", help="Include the frequency-weighted token score")
+    parser.add_argument("--repo-id", default=None, help="Hugging Face repository of the BloomFilters")
+    parser.add_argument("--revision", default="main", help="Repository revision (default: %(default)s)")
+    parser.add_argument("--no-preload", dest="preload", action="store_false", help="Let each worker load its own BloomFilters")
+    parser.add_argument("--token-cache-size", type=int, default=None, help="Per-filter token cache size (default: disabled)")
+    parser.add_argument("--log-every", type=int, default=DEFAULT_LOG_EVERY, help="Log throughput every N docs (default: %(default)s)")
+    parser.add_argument("--log-level", default="INFO", help="Logging level (default: %(default)s)")
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """Entry point of the impresso-ocrqa command."""
+    options = parse_args(args)
+    logging.basicConfig(
+        level=getattr(logging, options.log_level.upper(), logging.INFO),
+        format="%(asctime)-15s %(levelname)s: %(message)s",
+        stream=sys.stderr,
+    )
+    if options.batch_size <= 0:
+        raise SystemExit("--batch-size must be positive")
+
+    run(
+        options.inputs,
+        output=options.output,
+        workers=options.workers,
+        batch_size=options.batch_size,
+        log_every=options.log_every,
+        pipeline_kwargs={
+            "repo_id": options.repo_id,
+            "revision": options.revision,
+            "token_cache_size": options.token_cache_size,
+        },
+        preload=options.preload,
+        id_field=options.id_field,
+        text_field=options.text_field,
+        language_field=options.language_field,
+        version=options.version,
+        diagnostics=options.diagnostics,
+        model_id=options.model_id,
+        token_score=options.token_score,
+    )
+
+
+if __name__ == "__main__":
+    main()
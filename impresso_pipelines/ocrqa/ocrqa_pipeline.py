@@ -41,19 +41,29 @@ Version differences:
 For detailed normalization behavior, see the normalize_text() and subtokens() functions.
 """
 
+import functools
 import logging
+import os
 import re
+import time
 import unicodedata
-from typing import Dict, List, Optional, Set, Union
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
-from huggingface_hub import hf_hub_download, list_repo_files
+import numpy as np
 from pybloomfilter import BloomFilter
 
 from impresso_pipelines.langident.langident_pipeline import LangIdentPipeline
+from impresso_pipelines.model_registry import get_registry
 
 logger = logging.getLogger(__name__)
 
 
+class OCRQAError(Exception):
+    """Raised when BloomFilters cannot be resolved, downloaded or applied."""
+
+
 # ===== Normalization Tables for Different BloomFilter Versions =====
 
 # v1.x.x normalization constants
@@ -84,10 +94,10 @@ _V1_NORMALIZATION_TABLE = str.maketrans(
 )
 
 # v2.x.x normalization constants
-_V2_PRIVATE_CHAR_APOSTROPHE = (  # Private-use Unicode character for preserving apostrophes
+_V2_PRIVATE_CHAR_APOSTROPHE = (  # Private-use Unicode character formerly protecting apostrophes
     "\ue000"
 )
-_V2_PRIVATE_CHAR_HYPHEN = (  # Private-use Unicode character for preserving hyphens
+_V2_PRIVATE_CHAR_HYPHEN = (  # Private-use Unicode character formerly protecting hyphens
     "\ue001"
 )
 
@@ -101,7 +111,7 @@ _V2_HYPHENS = "-‐‑–"  # Excludes em-dash (—) which should remain separat
 
 _V2_DIGITS = "0123456789"
 
-# v2.x.x normalization table: apostrophe/hyphen variants to ASCII + digit normalization + restore protected chars
+# v2.x.x normalization table: apostrophe/hyphen variants to ASCII + digit normalization
 _V2_NORMALIZATION_TABLE = str.maketrans(
     {
         char: "'" for char in _V2_APOSTROPHES
@@ -111,16 +121,11 @@ _V2_NORMALIZATION_TABLE = str.maketrans(
     }  # All hyphen variants → ASCII (including ASCII itself)
     | {char: "0" for char in _V2_DIGITS}  # Digits → '0'
     | {
-        _V2_PRIVATE_CHAR_APOSTROPHE: "'",  # Restore protected apostrophes
-        _V2_PRIVATE_CHAR_HYPHEN: "-",  # Restore protected hyphens
+        _V2_PRIVATE_CHAR_APOSTROPHE: "'",  # Kept so that these characters in the
+        _V2_PRIVATE_CHAR_HYPHEN: "-",  # input normalize as in earlier releases
     }
 )
 
-# Lookup table for fast character classification during preservation (O(1) instead of O(n))
-_V2_CHAR_TO_PRIVATE = {
-    char: _V2_PRIVATE_CHAR_APOSTROPHE for char in _V2_APOSTROPHES
-} | {char: _V2_PRIVATE_CHAR_HYPHEN for char in _V2_HYPHENS}
-
 
 # ===== Module-Level Utility Functions =====
 
@@ -188,8 +193,9 @@ def normalize_text(
     """
     Normalize text using version-specific rules for BloomFilter comparison.
 
-    Applies Unicode normalization, handles apostrophes and hyphens, and performs character
-    substitution based on the BloomFilter version. For v2+, word-internal apostrophes and
+    Applies Unicode normalization (skipped for ASCII text, which it leaves unchanged), then
+    maps apostrophe and hyphen variants and other characters in a single translation pass
+    based on the BloomFilter version. For v2+, word-internal apostrophes and
     hyphens are preserved for all languages (not just Luxembourgish).
 
     **Important**: This function does NOT lowercase. Lowercasing should be done
@@ -218,32 +224,100 @@ def normalize_text(
     """
     major_version: int = _extract_major_version(version)
 
-    # Apply Unicode normalization first
-    if unicode_normalize:
+    # ASCII text is left unchanged by every Unicode normalization form
+    if unicode_normalize and not s.isascii():
         s = unicodedata.normalize(unicode_normalize, s)
 
+    # V2 used to protect word-internal apostrophes and hyphens with private-use
+    # characters before translating, then restore them. Protected and unprotected
+    # variants are translated to the same ASCII character, so a single
+    # translation gives the same text. Word-internal apostrophes and hyphens are
+    # kept together by the tokenizer.
     if major_version >= 2:
-        # V2: Simplified approach with single translation table
-        # 1. Preserve word-internal apostrophes and hyphens using temporary private chars
-        # This must happen BEFORE translation to catch all apostrophe/hyphen variants
-        # Pattern: [^\W_] matches word characters excluding underscore (i.e., letters and digits in any language)
-        # The character class matches any apostrophe or hyphen variant
-        apostrophe_pattern = "[" + re.escape("".join(_V2_APOSTROPHES)) + "]"
-        hyphen_pattern = "[" + re.escape("".join(_V2_HYPHENS)) + "]"
-        combined_pattern = (
-            r"(?<=[^\W_])(" + apostrophe_pattern + "|" + hyphen_pattern + r")(?=[^\W_])"
+        return s.translate(_V2_NORMALIZATION_TABLE)
+    return s.translate(_V1_NORMALIZATION_TABLE)
+
+
+class V2Tokenizer:
+    r"""
+    Precompiled regex tokenizer for v2.x.x BloomFilters.
+
+    Splits normalized text into word tokens, single-letter elisions, underscore
+    runs and runs of identical symbols, and splits possessives/contractions ending
+    in apostrophe + single letter (it's → it + 's) in the same pass: the word
+    pattern captures its last separator and segment, so no per-token regex is
+    needed. The pattern is compiled once and the instance can be reused freely.
+
+    Tokenization strategy:
+    1. Match elisions: single letter + apostrophe at word boundary followed by letter (e.g., l', d', c')
+    2. Match word sequences: [^\W_] (word chars except underscore) that may contain internal ' or -
+    3. Match underscore sequences (since it's in \w but we want it separate)
+    4. Match sequences of identical non-word chars: groups OCR artifacts together
+
+    Example:
+        >>> tokenizer = V2Tokenizer()
+        >>> tokenizer("it's l'auto ~~~ well-known")
+        ['it', "'s", "l'", 'auto', '~~~', 'well-known']
+    """
+
+    PATTERN: str = r"""
+        (?P<token>
+            # Pattern 1: Single-letter elision at word boundary
+            # Matches: d', l', c' (when followed by a word character)
+            # Examples: d'un → d' | un, l'auto → l' | auto
+            \b [^\W_] '                     # Word boundary + letter + apostrophe
+            (?=[^\W_])                      # Lookahead: must be followed by word char
+
+            |  # OR
+
+            # Pattern 2: Word sequences with optional internal apostrophes/hyphens
+            # Matches: don't, well-known, mother-in-law, qu'il
+            # The repeated group keeps the last (separator, segment) pair, which
+            # identifies possessives like it's without matching the token again
+            [^\W_]+                         # One or more word chars (letters/digits, not underscore)
+            (?: (?P<sep>['-]) (?P<seg>[^\W_]+) )*  # Zero or more: (apostrophe or hyphen) + word chars
+
+            |  # OR
+
+            # Pattern 3: Underscore sequences
+            # Matches: _, __, ___ (as separate tokens)
+            _+                              # One or more underscores
+
+            |  # OR
+
+            # Pattern 4: Sequences of identical non-word characters
+            # Matches: ###, □□□, ~~~, !!!, ... (groups identical symbols)
+            (?P<symbol>[^\w\s]) (?P=symbol)*  # Non-word char + zero or more of the same
         )
+    """
 
-        # Use dictionary lookup for O(1) character classification
-        s = re.sub(combined_pattern, lambda m: _V2_CHAR_TO_PRIVATE[m.group(1)], s)
+    def __init__(self) -> None:
+        self.pattern: re.Pattern = re.compile(self.PATTERN, re.UNICODE | re.VERBOSE)
+
+    def __call__(self, text: str) -> List[str]:
+        """
+        Tokenize normalized text.
+
+        Args:
+            text: Text normalized with normalize_text() for a v2 BloomFilter
+
+        Returns:
+            List of tokens in text order
+        """
+        tokens: List[str] = []
+        append = tokens.append
+        for token, sep, seg, _ in self.pattern.findall(text):
+            # Split words ending with apostrophe + single letter (e.g., it's → it + 's)
+            # This handles English possessives and contractions like: it's, that's, he's, what's
+            if sep == "'" and len(seg) == 1:
+                append(token[:-2])
+                append(token[-2:])
+            else:
+                append(token)
+        return tokens
 
-        # 2. Normalize all variants, map digits, and restore protected chars in a single pass
-        s = s.translate(_V2_NORMALIZATION_TABLE)
-    else:
-        # V1: Original logic with normalization table
-        s = s.translate(_V1_NORMALIZATION_TABLE)
 
-    return s
+_V2_TOKENIZER = V2Tokenizer()
 
 
 def subtokens(
@@ -309,61 +383,8 @@ def subtokens(
         # V2: Normalize then tokenize with regex
         text = normalize_text(text, version, language, unicode_normalize)
 
-        # Regex tokenization strategy:
-        # 1. Match elisions: single letter + apostrophe at word boundary followed by letter (e.g., l', d', c')
-        # 2. Match word sequences: [^\W_] (word chars except underscore) that may contain internal ' or -
-        # 3. Match underscore sequences (since it's in \w but we want it separate)
-        # 4. Match sequences of identical non-word chars: groups OCR artifacts together
-
-        # Use extended regex with verbose mode (re.VERBOSE) for readability
-        tokenization_pattern = re.compile(
-            r"""
-            # Pattern 1: Single-letter elision at word boundary
-            # Matches: d', l', c' (when followed by a word character)
-            # Examples: d'un → d' | un, l'auto → l' | auto
-            \b [^\W_] '                     # Word boundary + letter + apostrophe
-            (?=[^\W_])                      # Lookahead: must be followed by word char
-            
-            |  # OR
-            
-            # Pattern 2: Word sequences with optional internal apostrophes/hyphens
-            # Matches: don't, well-known, mother-in-law, qu'il
-            # Word characters with zero or more (apostrophe/hyphen + word chars) sequences
-            [^\W_]+                         # One or more word chars (letters/digits, not underscore)
-            (?: ['-] [^\W_]+ )*             # Zero or more: (apostrophe or hyphen) + word chars
-            
-            |  # OR
-            
-            # Pattern 3: Underscore sequences
-            # Matches: _, __, ___ (as separate tokens)
-            _+                              # One or more underscores
-            
-            |  # OR
-            
-            # Pattern 4: Sequences of identical non-word characters
-            # Matches: ###, □□□, ~~~, !!!, ... (groups identical symbols)
-            # Uses backreference to match repeated identical characters
-            ([^\w\s]) \1*                   # Non-word char + zero or more of the same
-        """,
-            re.UNICODE | re.VERBOSE,
-        )
-
-        # Use re.finditer to avoid empty captures, then extract matched text
-        tokens = [match.group(0) for match in tokenization_pattern.finditer(text)]
-
-        # Post-process: split words ending with apostrophe + single letter (e.g., it's → it + 's)
-        # This handles English possessives and contractions like: it's, that's, he's, what's
-        processed_tokens = []
-        for token in tokens:
-            # Check if token ends with apostrophe + single letter
-            match = re.match(r"^(.+)'([^\W_])$", token, re.UNICODE)
-            if match:
-                # Split: word part + apostrophe+letter part
-                processed_tokens.append(match.group(1))
-                processed_tokens.append("'" + match.group(2))
-            else:
-                processed_tokens.append(token)
-        tokens = processed_tokens
+        # Precompiled single-pass tokenizer (see V2Tokenizer)
+        tokens = _V2_TOKENIZER(text)
     else:
         # V1: Original whitespace-based tokenization
         tokens = normalize_text(text, version, language, unicode_normalize).split()
@@ -381,7 +402,8 @@ def get_bloomfilter(
     """
     Download and load a BloomFilter from the Hugging Face Hub.
 
-    Uses Hugging Face's caching mechanism to avoid redundant downloads.
+    Uses Hugging Face's caching mechanism (through the shared model registry) to
+    avoid redundant downloads and remote checks for already cached files.
 
     Args:
         model_id: The Hugging Face repository ID (e.g., "impresso-project/OCR-quality-assessment-unigram")
@@ -403,10 +425,171 @@ def get_bloomfilter(
         True
     """
     return BloomFilter.open(
-        hf_hub_download(repo_id=model_id, filename=filename, revision=revision)
+        get_registry().download(model_id, filename, revision=revision)
     )
 
 
+def open_shared_bloomfilter(path: str) -> BloomFilter:
+    """
+    Open a BloomFilter file as a read-only memory-mapped view.
+
+    The file is mapped read-only, so its pages are never copied: every process
+    opening (or inheriting) the same file shares them through the operating
+    system's page cache. The kernel is asked to read the file ahead so the
+    first lookups do not fault pages in one by one.
+
+    Args:
+        path: Local path of the BloomFilter file
+
+    Returns:
+        Read-only BloomFilter instance
+    """
+    bf = BloomFilter.open(path, "r")
+    if hasattr(os, "posix_fadvise"):
+        with open(path, "rb") as f:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    return bf
+
+
+def touch_file_pages(path: str, chunk_size: int = 1 << 20) -> int:
+    """
+    Read a file sequentially so that its pages are in the page cache.
+
+    Memory-mapped BloomFilter lookups then never wait for disk reads.
+
+    Args:
+        path: Path of the file
+        chunk_size: Number of bytes read at a time
+
+    Returns:
+        Number of bytes read
+    """
+    buffer = bytearray(chunk_size)
+    total = 0
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while count := f.readinto(buffer):
+            total += count
+    return total
+
+
+class SharedBloomFilters:
+    """
+    Read-only BloomFilters preloaded once and shared with worker processes.
+
+    Holds the local paths of BloomFilter files keyed like
+    OCRQAPipeline.bloomfilters ("<language>_<version>") and opens each one as a
+    read-only memory-mapped view. Forked workers inherit the open mappings;
+    when pickled (e.g., to spawned workers), only the paths are sent and each
+    worker maps the same files again on first use. Either way, all processes
+    share a single copy of the filter pages.
+
+    Attributes:
+        paths: Mapping of BloomFilter keys to local file paths
+
+    Example:
+        >>> shared = OCRQAPipeline().preload_bloomfilters()
+        >>> pool = multiprocessing.Pool(
+        ...     32, initializer=init_worker, initargs=(shared,)
+        ... )  # each worker creates OCRQAPipeline(shared_bloomfilters=shared)
+    """
+
+    def __init__(self, paths: Dict[str, str]) -> None:
+        self.paths: Dict[str, str] = dict(paths)
+        self._filters: Dict[str, BloomFilter] = {}
+
+    def get(self, language: str, version: str) -> Optional[BloomFilter]:
+        """
+        Return the shared BloomFilter of a language and version.
+
+        Args:
+            language: The language code (e.g., "en")
+            version: The BloomFilter version (e.g., "2.0.0")
+
+        Returns:
+            The read-only BloomFilter, or None if it was not preloaded
+        """
+        key = f"{language}_{version}"
+        if key not in self.paths:
+            return None
+        if key not in self._filters:
+            self._filters[key] = open_shared_bloomfilter(self.paths[key])
+        return self._filters[key]
+
+    def open_all(self) -> None:
+        """Open all BloomFilters, e.g., in a parent process before forking workers."""
+        for key in self.paths:
+            language, version = key.split("_", 1)
+            self.get(language, version)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getstate__(self) -> Dict[str, Dict[str, str]]:
+        # Open BloomFilters pickle their whole content: send only the paths
+        return {"paths": self.paths}
+
+    def __setstate__(self, state: Dict[str, Dict[str, str]]) -> None:
+        self.paths = state["paths"]
+        self._filters = {}
+
+
+class CachedBloomFilter:
+    """
+    BloomFilter wrapper that memoizes membership of recently seen tokens.
+
+    Historical newspaper text is highly Zipfian: articles, prepositions and
+    punctuation make up most tokens. A bounded LRU cache in front of the
+    memory-mapped BloomFilter answers these hot tokens without probing the
+    filter, and counts hits and misses to measure the probes saved.
+
+    Attributes:
+        bloom_filter: The wrapped BloomFilter
+        maxsize: Maximum number of cached tokens
+
+    Example:
+        >>> cached = CachedBloomFilter(get_bloomfilter(repo_id, "ocrqa-wp_v2.0.0-en.bloom"), maxsize=10000)
+        >>> "the" in cached, "the" in cached
+        (True, True)
+        >>> cached.cache_info()["hits"]
+        1
+    """
+
+    def __init__(self, bloom_filter: BloomFilter, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.bloom_filter: BloomFilter = bloom_filter
+        self.maxsize: int = maxsize
+        # functools.lru_cache is implemented in C and keeps hit/miss counters
+        self._contains = functools.lru_cache(maxsize=maxsize)(bloom_filter.__contains__)
+
+    def __contains__(self, token: str) -> bool:
+        return self._contains(token)
+
+    def cache_info(self) -> Dict[str, Union[int, float]]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dictionary with hits, misses (i.e., BloomFilter probes), hit_rate,
+            size (number of cached tokens) and maxsize
+        """
+        info = self._contains.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+            "size": info.currsize,
+            "maxsize": self.maxsize,
+        }
+
+    def cache_clear(self) -> None:
+        """Clear cached tokens and reset statistics."""
+        self._contains.cache_clear()
+
+
 class OCRQAPipeline:
     """
     OCR Quality Assessment pipeline using BloomFilter-based lexicon matching.
@@ -425,8 +608,13 @@ class OCRQAPipeline:
         score_precision: Number of decimal places for quality score rounding
         repo_files: List of files in the repository (cached at initialization)
         SUPPORTED_LANGUAGES: Set of available language codes
-        lang_model: Language identification pipeline
+        lang_model: Language identification pipeline, created on first use
         bloomfilters: Cache of loaded BloomFilter instances
+        shared_bloomfilters: Preloaded read-only BloomFilters shared across
+            processes, used before downloading (None if not shared)
+        latest_versions: Cache of the latest BloomFilter version per language
+        token_cache_size: Size of the per-BloomFilter token membership cache
+            (None disables it)
 
     Example:
         >>> pipeline = OCRQAPipeline()
@@ -447,38 +635,72 @@ class OCRQAPipeline:
     DEFAULT_REPO_ID: str = "impresso-project/OCR-quality-assessment-unigram"
     DEFAULT_REVISION: str = "main"
     DEFAULT_SCORE_PRECISION: int = 2
+    DEFAULT_WINDOW_SIZE: int = 50
+    GRANULARITIES: Tuple[str, ...] = ("document", "window")
 
     def __init__(
         self,
         repo_id: Optional[str] = None,
         revision: str = "main",
         score_precision: int = DEFAULT_SCORE_PRECISION,
+        token_cache_size: Optional[int] = None,
+        shared_bloomfilters: Optional[SharedBloomFilters] = None,
+        lang_model: Optional[LangIdentPipeline] = None,
     ) -> None:
         """
         Initialize the OCR Quality Assessment pipeline.
 
-        Connects to Hugging Face Hub, retrieves available BloomFilter files,
-        determines supported languages, and initializes the language detection model.
+        Retrieves available BloomFilter files through the shared model registry
+        (contacting the Hugging Face Hub only if no fresh manifest is cached),
+        and determines supported languages. The language detection model is only
+        created when a text without language needs to be detected.
 
         Args:
             repo_id: Hugging Face repository ID. If None, uses DEFAULT_REPO_ID
                     ("impresso-project/OCR-quality-assessment-unigram")
             revision: Repository revision - branch, tag, or commit hash (default: "main")
             score_precision: Number of decimal places for score rounding (default: 2)
+            token_cache_size: If set, each loaded BloomFilter is wrapped in a
+                CachedBloomFilter remembering the membership of up to this many
+                tokens (default: None, no cache). See token_cache_stats().
+            shared_bloomfilters: BloomFilters preloaded by preload_bloomfilters(),
+                typically in a parent process, used instead of opening the
+                filter files again (default: None)
+            lang_model: LangIdentPipeline to detect languages with, e.g., one
+                shared with other pipelines (default: None, a LangIdentPipeline is
+                created on first detection)
 
         Raises:
-            Exception: If repository access or language detection initialization fails
+            Exception: If repository access fails
         """
         self.repo_id: str = repo_id or self.DEFAULT_REPO_ID
         self.revision: str = revision
         self.score_precision: int = score_precision
+        self.token_cache_size: Optional[int] = token_cache_size
+        self.shared_bloomfilters: Optional[SharedBloomFilters] = shared_bloomfilters
 
-        self.repo_files: List[str] = list_repo_files(
+        self.repo_files: List[str] = get_registry().list_repo_files(
             self.repo_id, revision=self.revision
         )
         self.SUPPORTED_LANGUAGES: Set[str] = self._get_supported_languages()
-        self.lang_model: LangIdentPipeline = LangIdentPipeline()
-        self.bloomfilters: Dict[str, BloomFilter] = {}
+        self._lang_model: Optional[LangIdentPipeline] = lang_model
+        self.bloomfilters: Dict[str, Union[BloomFilter, CachedBloomFilter]] = {}
+        self.latest_versions: Dict[str, str] = {}
+
+    @property
+    def lang_model(self) -> LangIdentPipeline:
+        """
+        Language identification pipeline, created on first access.
+
+        Callers that always pass a language never load the floret model.
+        """
+        if self._lang_model is None:
+            self._lang_model = LangIdentPipeline()
+        return self._lang_model
+
+    @lang_model.setter
+    def lang_model(self, lang_model: LangIdentPipeline) -> None:
+        self._lang_model = lang_model
 
     def _is_bloomfilter_file(self, filename: str) -> bool:
         """
@@ -629,7 +851,24 @@ class OCRQAPipeline:
             >>> pipeline._build_bloomfilter_filename("2.0.0", "en")
             'ocrqa-wp_v2.0.0-en.bloom'
         """
-        return f"ocrqa-wp_v{version}-{language}.bloom"
+        return f"{self._model_id(language, version)}.bloom"
+
+    def _model_id(self, language: str, version: str) -> str:
+        """
+        Build the model ID of a BloomFilter, as reported in outputs and statistics.
+
+        Args:
+            language: The language code (e.g., "en")
+            version: The semantic version string (e.g., "2.0.0")
+
+        Returns:
+            The model ID (e.g., "ocrqa-wp_v2.0.0-en")
+
+        Example:
+            >>> pipeline._model_id("en", "2.0.0")
+            'ocrqa-wp_v2.0.0-en'
+        """
+        return f"ocrqa-wp_v{version}-{language}"
 
     def __call__(
         self,
@@ -639,6 +878,10 @@ class OCRQAPipeline:
         diagnostics: bool = False,
         model_id: bool = False,
         supported_languages: bool = False,
+        token_score: bool = False,
+        granularity: str = "document",
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        window_stride: Optional[int] = None,
     ) -> Dict[str, Union[str, float, List[str], Dict]]:
         """
         Assess OCR quality of input text using BloomFilter lexicon matching.
@@ -654,6 +897,13 @@ class OCRQAPipeline:
             diagnostics: If True, includes known/unknown tokens in output
             model_id: If True, includes BloomFilter model ID in output
             supported_languages: If True, includes list of supported languages in output
+            token_score: If True, also includes the frequency-weighted score
+                (proportion of recognized token occurrences)
+            granularity: "document" (default) for the document score only, or
+                "window" to add the scores of token windows (see window_scores())
+            window_size: Number of tokens per window (granularity="window")
+            window_stride: Tokens between window starts (default: window_size,
+                i.e. non-overlapping windows)
 
         Returns:
             Dictionary containing:
@@ -665,10 +915,14 @@ class OCRQAPipeline:
                     - model_id (str): BloomFilter model identifier
                 - model_id (str): Only if model_id=True (and diagnostics=False)
                 - supported_languages (List[str]): Only if supported_languages=True
+                - token_score (float): Only if token_score=True, proportion of
+                  recognized token occurrences (0.0-1.0)
+                - window_scores (List[float]): Only if granularity="window", the
+                  proportion of recognized tokens of each window, in text order
 
         Raises:
             ValueError: If language is not supported or no BloomFilter versions found
-            Exception: If BloomFilter download/loading fails or processing errors occur
+            OCRQAError: If BloomFilter download/loading fails or processing errors occur
 
         Example:
             >>> pipeline = OCRQAPipeline()
@@ -698,92 +952,501 @@ class OCRQAPipeline:
                 )
 
             if selected_version is None:
-                try:
-                    versions: List[str] = self._get_available_versions(
-                        detected_language
+                selected_version = self._resolve_latest_version(detected_language)
+
+            bf = self._load_bloomfilter(detected_language, selected_version)
+
+            output: Dict[str, Union[str, float, List[str]]] = self.filter_text(
+                text,
+                bf,
+                detected_language,
+                selected_version,
+                diagnostics,
+                model_id,
+                include_token_score=token_score,
+                granularity=granularity,
+                window_size=window_size,
+                window_stride=window_stride,
+            )
+
+            if supported_languages:
+                output["supported_languages"] = sorted(self.SUPPORTED_LANGUAGES)
+
+            return output
+
+        except (ValueError, OCRQAError):
+            raise
+        except Exception as e:
+            raise OCRQAError(f"OCR quality assessment failed: {str(e)}")
+
+    def batch(
+        self,
+        texts: Iterable[str],
+        languages: Optional[Sequence[Optional[str]]] = None,
+        version: Optional[str] = None,
+        diagnostics: bool = False,
+        model_id: bool = False,
+        supported_languages: bool = False,
+        token_score: bool = False,
+        granularity: str = "document",
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        window_stride: Optional[int] = None,
+    ) -> List[Dict[str, Union[str, float, List[str], Dict]]]:
+        """
+        Assess OCR quality of many texts at once.
+
+        Languages missing from `languages` are detected for the whole batch with a
+        single LangIdentPipeline.batch() call. Texts are then grouped by language and
+        version so that each BloomFilter is resolved once per group rather than once
+        per text.
+
+        Args:
+            texts: Input texts to assess
+            languages: Optional language codes aligned with texts; None entries
+                (or None for the whole argument) are auto-detected
+            version: BloomFilter version (e.g., "2.0.0"). Latest version per
+                language used if None.
+            diagnostics: If True, includes known/unknown tokens in each output
+            model_id: If True, includes BloomFilter model ID in each output
+            supported_languages: If True, includes list of supported languages in each output
+            token_score: If True, also includes the frequency-weighted score in each output
+            granularity: "document" or "window" (see __call__)
+            window_size: Number of tokens per window (granularity="window")
+            window_stride: Tokens between window starts (default: window_size)
+
+        Returns:
+            List of result dictionaries in input order, with the same structure as
+            the output of __call__
+
+        Raises:
+            ValueError: If `languages` and `texts` differ in length, a language is not
+                supported or no BloomFilter versions are found
+            OCRQAError: If BloomFilter download/loading fails or processing errors occur
+
+        Example:
+            >>> pipeline = OCRQAPipeline()
+            >>> results = pipeline.batch(["Good quality text", "Ein guter Text"])
+            >>> [r["language"] for r in results]
+            ['en', 'de']
+        """
+        texts = list(texts)
+        if languages is None:
+            detected: List[Optional[str]] = [None] * len(texts)
+        else:
+            detected = list(languages)
+            if len(detected) != len(texts):
+                raise ValueError(
+                    f"Got {len(detected)} languages for {len(texts)} texts"
+                )
+
+        try:
+            # Detect all missing languages in one call
+            missing: List[int] = [i for i, lang in enumerate(detected) if lang is None]
+            if missing:
+                lang_result = self.lang_model.batch([texts[i] for i in missing])
+                for i, lang in zip(missing, lang_result["language"]):
+                    detected[i] = str(lang)
+
+            unsupported: Set[str] = set(detected) - self.SUPPORTED_LANGUAGES
+            if unsupported:
+                raise ValueError(
+                    f"Unsupported language: {', '.join(sorted(unsupported))}. Supported"
+                    f" languages: {sorted(self.SUPPORTED_LANGUAGES)}"
+                )
+
+            # Group texts by language and version, resolving each BloomFilter once
+            groups: Dict[Tuple[str, str], List[int]] = {}
+            for i, lang in enumerate(detected):
+                selected_version = version or self._resolve_latest_version(lang)
+                groups.setdefault((lang, selected_version), []).append(i)
+
+            outputs: List[Optional[Dict]] = [None] * len(texts)
+            for (lang, selected_version), indices in groups.items():
+                bf = self._load_bloomfilter(lang, selected_version)
+                for i in indices:
+                    output = self.filter_text(
+                        texts[i],
+                        bf,
+                        lang,
+                        selected_version,
+                        diagnostics,
+                        model_id,
+                        include_token_score=token_score,
+                        granularity=granularity,
+                        window_size=window_size,
+                        window_stride=window_stride,
                     )
-                    if not versions:
-                        raise ValueError(
-                            "No BloomFilter versions found for language:"
-                            f" {detected_language}"
-                        )
-                    selected_version = self._select_latest_version(versions)
-                except Exception as e:
-                    raise Exception(
-                        f"Failed to retrieve BloomFilter versions: {str(e)}"
+                    if supported_languages:
+                        output["supported_languages"] = sorted(self.SUPPORTED_LANGUAGES)
+                    outputs[i] = output
+
+            return outputs
+
+        except (ValueError, OCRQAError):
+            raise
+        except Exception as e:
+            raise OCRQAError(f"OCR quality assessment failed: {str(e)}")
+
+    def _resolve_latest_version(self, language: str) -> str:
+        """
+        Return the latest BloomFilter version for a language, cached per language.
+
+        Args:
+            language: The language code (e.g., "en")
+
+        Returns:
+            The latest available version string
+
+        Raises:
+            OCRQAError: If no BloomFilter versions are found for the language
+        """
+        if language not in self.latest_versions:
+            try:
+                versions: List[str] = self._get_available_versions(language)
+                if not versions:
+                    raise ValueError(
+                        f"No BloomFilter versions found for language: {language}"
                     )
+                self.latest_versions[language] = self._select_latest_version(versions)
+            except Exception as e:
+                raise OCRQAError(f"Failed to retrieve BloomFilter versions: {str(e)}")
+        return self.latest_versions[language]
+
+    def _load_bloomfilter(
+        self, language: str, version: str
+    ) -> Union[BloomFilter, CachedBloomFilter]:
+        """
+        Return the BloomFilter for a language and version, loading it on first use.
+
+        Preloaded shared BloomFilters are used when available. The BloomFilter is
+        wrapped in a CachedBloomFilter if token_cache_size is set.
 
-            bloomfilter_key: str = f"{detected_language}_{selected_version}"
-            if bloomfilter_key not in self.bloomfilters:
-                try:
+        Args:
+            language: The language code (e.g., "en")
+            version: The BloomFilter version (e.g., "2.0.0")
+
+        Returns:
+            The cached BloomFilter (or CachedBloomFilter) instance
+
+        Raises:
+            OCRQAError: If the BloomFilter cannot be downloaded or loaded
+        """
+        bloomfilter_key: str = f"{language}_{version}"
+        if bloomfilter_key not in self.bloomfilters:
+            try:
+                bf = None
+                if self.shared_bloomfilters is not None:
+                    bf = self.shared_bloomfilters.get(language, version)
+                if bf is None:
                     bloomfilter_filename: str = self._build_bloomfilter_filename(
-                        selected_version, detected_language
+                        version, language
                     )
-                    self.bloomfilters[bloomfilter_key] = get_bloomfilter(
+                    bf = get_bloomfilter(
                         self.repo_id, bloomfilter_filename, self.revision
                     )
-                except Exception as e:
-                    raise Exception(
-                        "Failed to download or load BloomFilter for"
-                        f" {detected_language} v{selected_version}: {str(e)}"
-                    )
+            except Exception as e:
+                raise OCRQAError(
+                    "Failed to download or load BloomFilter for"
+                    f" {language} v{version}: {str(e)}"
+                )
+            if self.token_cache_size:
+                bf = CachedBloomFilter(bf, self.token_cache_size)
+            self.bloomfilters[bloomfilter_key] = bf
+        return self.bloomfilters[bloomfilter_key]
 
-            bf: BloomFilter = self.bloomfilters[bloomfilter_key]
+    def preload_bloomfilters(
+        self,
+        languages: Optional[Iterable[str]] = None,
+        version: Optional[str] = None,
+    ) -> SharedBloomFilters:
+        """
+        Download and open the BloomFilters of several languages for sharing.
 
-            output: Dict[str, Union[str, float, List[str]]] = self.filter_text(
-                text, bf, detected_language, selected_version, diagnostics, model_id
+        Call this once in a parent process and pass the result to the worker
+        pipelines (OCRQAPipeline(shared_bloomfilters=...)). The filters are
+        opened as read-only memory-mapped views, so forked or spawned workers
+        share their pages instead of each loading its own copy. This pipeline
+        uses the preloaded filters as well.
+
+        Args:
+            languages: Language codes to preload (default: all supported languages)
+            version: BloomFilter version (default: latest version per language).
+                Languages without this version are skipped.
+
+        Returns:
+            The preloaded SharedBloomFilters
+
+        Raises:
+            ValueError: If a language is not supported
+            OCRQAError: If a BloomFilter cannot be downloaded or opened
+
+        Example:
+            >>> shared = OCRQAPipeline().preload_bloomfilters(["de", "fr"])
+            >>> sorted(shared.paths)
+            ['de_2.0.0', 'fr_2.0.0']
+        """
+        languages = sorted(self.SUPPORTED_LANGUAGES if languages is None else languages)
+        unsupported: Set[str] = set(languages) - self.SUPPORTED_LANGUAGES
+        if unsupported:
+            raise ValueError(
+                f"Unsupported language: {', '.join(sorted(unsupported))}. Supported"
+                f" languages: {sorted(self.SUPPORTED_LANGUAGES)}"
             )
 
-            if supported_languages:
-                output["supported_languages"] = sorted(self.SUPPORTED_LANGUAGES)
+        paths: Dict[str, str] = {}
+        for language in languages:
+            if version is None:
+                selected_version = self._resolve_latest_version(language)
+            elif version in self._get_available_versions(language):
+                selected_version = version
+            else:
+                continue
+            filename = self._build_bloomfilter_filename(selected_version, language)
+            try:
+                paths[f"{language}_{selected_version}"] = get_registry().download(
+                    self.repo_id, filename, revision=self.revision
+                )
+            except Exception as e:
+                raise OCRQAError(
+                    "Failed to download or load BloomFilter for"
+                    f" {language} v{selected_version}: {str(e)}"
+                )
 
-            return output
+        shared = SharedBloomFilters(paths)
+        shared.open_all()
+        logger.info("Preloaded %d shared BloomFilters", len(shared))
+        self.shared_bloomfilters = shared
+        return shared
 
-        except ValueError:
-            raise
-        except Exception as e:
-            raise Exception(f"OCR quality assessment failed: {str(e)}")
+    def warmup(
+        self,
+        languages: Optional[Iterable[str]] = None,
+        versions: Optional[Iterable[str]] = None,
+        touch_pages: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Union[float, Dict[str, float]]]:
+        """
+        Download and open BloomFilters ahead of the first texts.
+
+        BloomFilters are otherwise loaded on the first text of each language, so
+        that text pays the download, open and page-fault latency. Call this, e.g.,
+        when a server starts: the requested filters are loaded concurrently in
+        threads and cached like filters loaded on demand.
+
+        Args:
+            languages: Language codes (default: all supported languages)
+            versions: BloomFilter versions to load for each language (default:
+                the latest version per language). Versions a language does not
+                have are skipped.
+            touch_pages: Also read each filter file sequentially so its pages
+                are in the page cache before the first lookup
+            max_workers: Maximum number of loading threads (default: one per
+                filter, up to 8)
+
+        Returns:
+            Dictionary with the wall-clock seconds of the whole warm-up ("total")
+            and the seconds spent per filter ("filters", keyed by model ID)
+
+        Raises:
+            ValueError: If a language is not supported
+            OCRQAError: If a BloomFilter cannot be downloaded or loaded
+
+        Example:
+            >>> pipeline = OCRQAPipeline()
+            >>> pipeline.warmup(["de", "fr", "lb"], touch_pages=True)
+            {'total': 1.92, 'filters': {'ocrqa-wp_v2.0.0-de': 1.85, ...}}
+        """
+        start = time.perf_counter()
+        languages = sorted(self.SUPPORTED_LANGUAGES if languages is None else languages)
+        unsupported: Set[str] = set(languages) - self.SUPPORTED_LANGUAGES
+        if unsupported:
+            raise ValueError(
+                f"Unsupported language: {', '.join(sorted(unsupported))}. Supported"
+                f" languages: {sorted(self.SUPPORTED_LANGUAGES)}"
+            )
+
+        # Versions are resolved here: the threads only download and open files
+        requested: List[Tuple[str, str]] = []
+        for language in languages:
+            if versions is None:
+                requested.append((language, self._resolve_latest_version(language)))
+            else:
+                available = set(self._get_available_versions(language))
+                requested.extend(
+                    (language, version) for version in versions if version in available
+                )
+
+        def warm(language: str, version: str) -> float:
+            filter_start = time.perf_counter()
+            bf = self._load_bloomfilter(language, version)
+            if touch_pages:
+                if isinstance(bf, CachedBloomFilter):
+                    bf = bf.bloom_filter
+                touch_file_pages(bf.filename)
+            return time.perf_counter() - filter_start
+
+        filter_seconds: Dict[str, float] = {}
+        if requested:
+            with ThreadPoolExecutor(max_workers or min(len(requested), 8)) as executor:
+                futures = {
+                    self._model_id(language, version): executor.submit(warm, language, version)
+                    for language, version in requested
+                }
+                filter_seconds = {
+                    model_id: future.result() for model_id, future in futures.items()
+                }
+
+        total = time.perf_counter() - start
+        logger.info("Warmed up %d BloomFilters in %.2fs", len(filter_seconds), total)
+        return {"total": total, "filters": filter_seconds}
+
+    def token_cache_stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Return token membership cache statistics per loaded BloomFilter.
+
+        Returns:
+            Dictionary mapping model IDs (e.g., "ocrqa-wp_v2.0.0-en") to the
+            CachedBloomFilter.cache_info() of their cache. Empty if the token
+            cache is disabled.
+
+        Example:
+            >>> pipeline = OCRQAPipeline(token_cache_size=100_000)
+            >>> _ = pipeline.batch(pages)
+            >>> pipeline.token_cache_stats()["ocrqa-wp_v2.0.0-fr"]["hit_rate"]
+            0.93
+        """
+        stats: Dict[str, Dict[str, Union[int, float]]] = {}
+        for key, bf in self.bloomfilters.items():
+            if isinstance(bf, CachedBloomFilter):
+                language, version = key.split("_", 1)
+                stats[self._model_id(language, version)] = bf.cache_info()
+        return stats
+
+    def window_scores(
+        self,
+        tokens: Sequence[str],
+        knowns: Set[str],
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        window_stride: Optional[int] = None,
+    ) -> List[float]:
+        """
+        Compute the quality scores of token windows in one pass.
+
+        Unlike the document score, which counts distinct tokens, a window score is
+        the proportion of recognized tokens among all tokens of the window, so
+        repeated garbage in a region lowers its score. Known-token counts are
+        accumulated once into prefix sums; each window score is then a difference
+        of two prefix sums, with no re-tokenization or BloomFilter lookup.
+
+        Windows start every window_stride tokens. If they do not reach the end of
+        the text, a last window ending at the final token is added. Texts shorter
+        than window_size get a single window.
+
+        Args:
+            tokens: Token stream of the text, as returned by subtokens()
+            knowns: Tokens recognized by the BloomFilter
+            window_size: Number of tokens per window
+            window_stride: Tokens between window starts (default: window_size)
+
+        Returns:
+            Window scores rounded to score_precision, in text order (empty if
+            there are no tokens)
+
+        Raises:
+            ValueError: If window_size or window_stride is not positive
+
+        Example:
+            >>> pipeline.window_scores(["a", "b", "x", "y"], {"a", "b"}, window_size=2)
+            [1.0, 0.0]
+        """
+        if window_stride is None:
+            window_stride = window_size
+        if window_size <= 0 or window_stride <= 0:
+            raise ValueError(
+                f"Window size and stride must be positive, got {window_size} and {window_stride}"
+            )
+        if not tokens:
+            return []
+
+        size = min(window_size, len(tokens))
+        known_counts = np.zeros(len(tokens) + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter((token in knowns for token in tokens), dtype=bool, count=len(tokens)),
+            out=known_counts[1:],
+        )
+        starts = np.arange(0, len(tokens) - size + 1, window_stride)
+        if starts[-1] + size < len(tokens):
+            starts = np.append(starts, len(tokens) - size)
+        scores = (known_counts[starts + size] - known_counts[starts]) / size
+        return [round(score, self.score_precision) for score in scores.tolist()]
 
     def filter_text(
         self,
         text: str,
-        bloom_filter: BloomFilter,
+        bloom_filter: Union[BloomFilter, CachedBloomFilter],
         language: str,
         version: str,
         include_diagnostics: bool,
         include_model_id: bool,
+        include_token_score: bool = False,
+        granularity: str = "document",
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        window_stride: Optional[int] = None,
     ) -> Dict[str, Union[str, float, List[str], Dict[str, Union[List[str], str]]]]:
         """
         Filter text tokens through BloomFilter and compute quality score.
 
         Tokenizes text using version-appropriate normalization, checks each token
         against the BloomFilter, and calculates the proportion of recognized tokens.
+        The score counts distinct tokens (types); with include_token_score, the
+        same lookups also give the frequency-weighted score over all token
+        occurrences. With granularity="window", the same token stream and lookups also yield
+        the scores of token windows.
 
         Args:
             text: Input text to filter
-            bloom_filter: Loaded BloomFilter instance for lexicon lookup
+            bloom_filter: Loaded BloomFilter (or CachedBloomFilter) for lexicon lookup
             language: Language code of the text
             version: BloomFilter version string for proper normalization
             include_diagnostics: Whether to include token lists in output
             include_model_id: Whether to include model identifier in output
+            include_token_score: Whether to include the frequency-weighted score
+            granularity: "document" or "window"
+            window_size: Number of tokens per window (granularity="window")
+            window_stride: Tokens between window starts (default: window_size)
 
         Returns:
             Dictionary containing:
                 - language (str): The language code
                 - score (float): Quality score (0.0-1.0)
+                - token_score (float): Only if include_token_score=True
+                - window_scores (List[float]): Only if granularity="window"
                 - diagnostics (Dict): Only if include_diagnostics=True
                 - model_id (str): Only if include_model_id=True (and not diagnostics)
 
+        Raises:
+            ValueError: If granularity is unknown or the window size or stride
+                is not positive
+
         Note:
             Uses module-level subtokens() function for version-compatible tokenization.
         """
+        if granularity not in self.GRANULARITIES:
+            raise ValueError(
+                f"Unknown granularity: {granularity}. Expected one of {self.GRANULARITIES}"
+            )
+
         knowns: Set[str] = set()
         unknowns: Set[str] = set()
 
         # Use module-level subtokens() for proper v2-compatible tokenization
         tokens: List[str] = subtokens(text, version, language)
 
-        for token in tokens:
+        # Each distinct token is looked up once; counted only for the token score
+        distinct_tokens: Union[Counter, Set[str]] = (
+            Counter(tokens) if include_token_score else set(tokens)
+        )
+        for token in distinct_tokens:
             if token in bloom_filter:
                 knowns.add(token)
             else:
@@ -801,14 +1464,24 @@ class OCRQAPipeline:
             "score": score,
         }
 
+        if include_token_score:
+            known_count: int = sum(distinct_tokens[token] for token in knowns)
+            output["token_score"] = round(
+                known_count / len(tokens) if tokens else 0, self.score_precision
+            )
+
+        if granularity == "window":
+            output["window_scores"] = self.window_scores(
+                tokens, knowns, window_size, window_stride
+            )
+
         if include_diagnostics:
             output["diagnostics"] = {
                 "known_tokens": sorted(knowns),
                 "unknown_tokens": sorted(unknowns),
-                "model_id": f"ocrqa-wp_v{version}-{language}",
+                "model_id": self._model_id(language, version),
             }
         elif include_model_id:
-            output["model_id"] = f"ocrqa-wp_v{version}-{language}"
+            output["model_id"] = self._model_id(language, version)
 
         return output
-        return output
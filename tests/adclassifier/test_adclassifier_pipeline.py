@@ -184,3 +184,156 @@ def test_custom_parameters():
     assert pipeline.batch_size == 8
     assert pipeline.ad_threshold == 0.5
     assert pipeline.temperature == 1.0
+
+
+def test_length_bucketing():
+    """Test length-bucketed batching gives the results of input-order batching."""
+    docs = [
+        {"id": "long", "lg": "fr", "ft": "Le conseil municipal s'est réuni hier. " * 40},
+        {"id": "ad", "lg": "fr", "ft": "À vendre: Belle villa 5 pièces, CHF 850'000. Tél. 021 123 45 67"},
+        {"id": "short", "lg": "de", "ft": "Zu verkaufen Haus"},
+        {"id": "empty", "ft": ""},
+    ] * 3
+    reference = AdClassifierPipeline(batch_size=4, diagnostics=True)(docs)
+
+    for max_batch_tokens in (None, 256):
+        pipeline = AdClassifierPipeline(
+            batch_size=4,
+            diagnostics=True,
+            length_bucketing=True,
+            max_batch_tokens=max_batch_tokens,
+        )
+        results = pipeline(docs)
+        assert [r["id"] for r in results] == [d["id"] for d in docs]
+        for result, expected in zip(results, reference):
+            assert result["type"] == expected["type"]
+            assert result["promotion_prob"] == pytest.approx(expected["promotion_prob"], abs=0.01)
+
+    with pytest.raises(ValueError):
+        AdClassifierPipeline(length_bucketing=True, max_batch_tokens=0)
+    with pytest.raises(ValueError):
+        AdClassifierPipeline(max_batch_tokens=256)
+
+
+def test_stream():
+    """Test streaming yields the results of a batch call, lazily and in order."""
+    pipeline = AdClassifierPipeline(batch_size=2, chunk_words=10, diagnostics=True)
+    docs = [
+        {"id": f"doc{i}", "lg": "fr", "ft": text}
+        for i, text in enumerate([
+            "À vendre: Belle villa 5 pièces, CHF 850'000. Tél. 021 123 45 67",
+            "Le conseil municipal s'est réuni hier pour discuter du budget. " * 5,
+            "Zu verkaufen Haus",
+        ] * 3)
+    ]
+    consumed = []
+
+    def items():
+        for doc in docs:
+            consumed.append(doc["id"])
+            yield doc
+
+    stream = pipeline.stream(items(), buffer_chunks=4)
+    first = next(stream)
+    assert first["id"] == "doc0"
+    assert len(consumed) < len(docs), "Results should be yielded before the input is consumed"
+
+    results = [first, *stream]
+    expected = pipeline(docs)
+    assert [(r["id"], r["type"]) for r in results] == [(r["id"], r["type"]) for r in expected]
+    for result, batch_result in zip(results, expected):
+        assert result["promotion_prob"] == pytest.approx(batch_result["promotion_prob"], abs=0.01)
+    assert [r["type"] for r in pipeline.stream(["Zu verkaufen Haus"])] == [pipeline("Zu verkaufen Haus")["type"]]
+
+    # Items are tokenized batch_size at a time, not one by one
+    prepare_items = pipeline._prepare_items
+    group_sizes = []
+
+    def counting_prepare_items(group):
+        group_sizes.append(len(group))
+        return prepare_items(group)
+
+    pipeline._prepare_items = counting_prepare_items
+    list(pipeline.stream(iter(docs)))
+    assert group_sizes == [2, 2, 2, 2, 1]
+
+    with pytest.raises(ValueError):
+        pipeline.stream("Zu verkaufen Haus")
+    with pytest.raises(ValueError):
+        pipeline.stream({"ft": "Zu verkaufen Haus"})
+
+
+def test_token_window_chunking():
+    """Test token windows are cut from a single encoding of the normalized text."""
+    from impresso_pipelines.adclassifier.adclassifier_pipeline import normalize_text
+
+    text = "Le conseil  municipal s'est réuni hier pour discuter du budget ~~ communal. " * 30
+    pipeline = AdClassifierPipeline(max_length=64, chunk_tokens=48, chunk_stride=8)
+
+    prepared = pipeline._prepare_items([{"ft": text}])[0]
+    assert prepared.text == normalize_text(text)
+    assert prepared.n_words == len(prepared.text.split())
+    assert len(prepared.input_ids) > 1
+    assert all(len(ids) <= 48 + 2 for ids in prepared.input_ids)
+
+    full_ids = pipeline.tokenizer(prepared.text, add_special_tokens=False)["input_ids"]
+    # XLM-RoBERTa adds one special token at each end of a chunk
+    windows = [ids[1:-1] for ids in prepared.input_ids]
+    assert windows[0] == full_ids[:48]
+    assert windows[1][:8] == windows[0][-8:], "Consecutive windows should overlap by chunk_stride"
+    assert windows[-1][-1] == full_ids[-1]
+
+    assert pipeline(text)["type"] in ["ad", "non-ad"]
+    with pytest.raises(ValueError):
+        AdClassifierPipeline(chunk_tokens=16, chunk_stride=16)
+
+
+def test_rule_scanner_matches_feature_patterns():
+    """Test the single-pass scanner finds exactly the features the full patterns find."""
+    import random
+
+    from impresso_pipelines.adclassifier.adclassifier_pipeline import (
+        ADDRESS, AREA, CUES, PHONE, PRICE, ROOMS_FR, ZIP_CH, rule_flags,
+    )
+
+    patterns = {
+        "has_phone": PHONE, "has_price": PRICE, "has_area": AREA, "has_rooms": ROOMS_FR,
+        "has_cue": CUES, "has_address": ADDRESS, "has_zip": ZIP_CH,
+    }
+    pieces = list("0123456789 ./-()+'`,€$²ſ") + [
+        "CHF", "SFr.", "fr.", "EUR", "USD", "m2", "m²", "pièces", "Pieces", "Rue", "Str.",
+        "Grand'Rue", "Tél.", "TEL", "à vendre", "a louer", "Zimmer", "Präis", "x", "é",
+        " 021 ", "(021) ", "1200", "+41 ", "12'000.-",
+    ]
+    rng = random.Random(0)
+    texts = [
+        "",
+        "À vendre: Belle villa 5 pièces, 150m², CHF 850'000.-. Tél. 021 123 45 67, Rue de la Paix 12, 1000 Lausanne",
+        "Die Bundesversammlung hat die Vorlage mit 98 gegen 31 Stimmen angenommen.",
+    ] + ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 20))) for _ in range(20000)]
+
+    for text in texts:
+        expected = {name: bool(p.search(text)) for name, p in patterns.items()}
+        expected["len_words"] = len(text.split())
+        assert rule_flags(text) == expected, text
+
+
+def test_cascade():
+    """Test decisive rule evidence and empty items skip the model, other items do not."""
+    texts = [
+        "À vendre: Belle villa 5 pièces, 150m², CHF 850'000.-. Tél. 021 123 45 67",
+        "",
+        "Le Conseil fédéral a décidé, dans sa séance d'hier, de soumettre un projet d'arrêté.",
+    ]
+    full = AdClassifierPipeline(diagnostics=True)
+    pipeline = AdClassifierPipeline(diagnostics=True, cascade=True)
+    results = pipeline(texts)
+
+    assert [r["decided_by"] for r in results] == ["rules", "length", "model"]
+    assert results[0]["type"] == "ad" and results[0]["promotion_prob"] is None
+    assert results[1]["type"] == "non-ad"
+    expected = full(texts[2])
+    assert {k: v for k, v in results[2].items() if k != "decided_by"} == pytest.approx(expected)
+    assert pipeline.cascade_stats == {
+        "items": 3, "rule_ads": 1, "short_non_ads": 1, "skipped_chunks": 2,
+    }
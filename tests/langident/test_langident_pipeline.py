@@ -143,3 +143,31 @@ def test_model_id_en():
 
 
 
+
+def test_batch():
+    lang_pipeline = LangIdentPipeline()
+    texts = [
+        "Ein kleiner Hund namens Max lebte in einem ruhigen Dorf.\nJeden Tag rannte er durch die Straßen.",
+        "Un petit chien nommé Max vivait dans un village tranquille.",
+        "A small dog named Max lived in a quiet village.",
+    ]
+    result = lang_pipeline.batch(texts, diagnostics=True, model_id=True)
+    assert isinstance(result, dict)
+    assert result['language'].tolist() == ['de', 'fr', 'en']
+    assert result['score'].shape == (3,)
+    assert result['diagnostics']['languages'].shape[0] == 3
+    assert result['diagnostics']['scores'].shape == result['diagnostics']['languages'].shape
+    assert result['model_id'] != ''
+    # batch results must agree with single-text calls
+    for i, text in enumerate(texts):
+        single = lang_pipeline(text)
+        assert result['language'][i] == single['language']
+        assert float(result['score'][i]) == single['score']
+
+def test_iter_batches():
+    lang_pipeline = LangIdentPipeline()
+    texts = ["Un petit chien nommé Max vivait dans un village tranquille."] * 5
+    chunks = list(lang_pipeline.iter_batches(iter(texts), batch_size=2))
+    assert [len(chunk['language']) for chunk in chunks] == [2, 2, 1]
+    assert all(lang == 'fr' for chunk in chunks for lang in chunk['language'])
+    assert lang_pipeline.batch([])['language'].shape == (0,)
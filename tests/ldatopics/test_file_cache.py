@@ -0,0 +1,30 @@
+import os
+
+from impresso_pipelines.ldatopics.file_cache import atomic_write, file_fingerprint
+
+
+def test_file_fingerprint(tmp_path):
+    path = tmp_path / "tm-fr-all-v2.0.vocab.lemmatization.tsv"
+    path.write_text("a\tNOUN\tb\n")
+    fingerprint = file_fingerprint(str(path))
+
+    assert len(fingerprint) == 16
+    assert file_fingerprint(str(path)) == fingerprint
+    assert file_fingerprint(str(path), True) != fingerprint
+
+    path.write_text("a\tNOUN\tb\nc\tNOUN\td\n")
+    assert file_fingerprint(str(path)) != fingerprint
+
+
+def test_atomic_write(tmp_path):
+    path = str(tmp_path / "index" / "topics.json")
+    assert atomic_write(path, lambda f: f.write("{}"))
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "{}"
+    assert atomic_write(path, lambda f: f.write(b"\0"), binary=True)
+    assert os.listdir(tmp_path / "index") == ["topics.json"]
+
+    # a directory below a regular file can never be created: warn, do not raise
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    assert not atomic_write(str(blocker / "topics.json"), lambda f: f.write("{}"))
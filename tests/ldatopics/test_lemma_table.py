@@ -0,0 +1,57 @@
+import gzip
+import os
+
+from impresso_pipelines.ldatopics.lemma_table import (
+    LemmaTable,
+    load_lemma_table,
+    read_lemmatization_tsv,
+)
+
+
+def write_tsv(path):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("Chevaux\tNOUN\tcheval\n")
+        f.write("étés\tNOUN\tété\n")
+        f.write("malformed line\n")
+        f.write("Allait\tVERB\taller\n")
+
+
+def test_lemma_table_matches_dict(tmp_path):
+    tsv_path = str(tmp_path / "tm-fr-all-v2.0.vocab.lemmatization.tsv.gz")
+    write_tsv(tsv_path)
+    cache_dir = str(tmp_path / "lemmas")
+
+    expected = read_lemmatization_tsv(tsv_path, lowercase_keys=True)
+    table = load_lemma_table(tsv_path, lowercase_keys=True, cache_dir=cache_dir)
+
+    assert isinstance(table, LemmaTable)
+    assert len(table) == len(expected) == 3
+    assert dict(table.items()) == expected
+    assert table.get("étés") == "été"
+    assert table["chevaux"] == "cheval"
+    assert table.get("Chevaux") is None
+    assert "inconnu" not in table
+    assert table.get("inconnu", "inconnu") == "inconnu"
+
+    # compiled once, then reopened from the cache
+    assert os.listdir(cache_dir) == [os.path.basename(table.path)]
+    assert load_lemma_table(tsv_path, lowercase_keys=True, cache_dir=cache_dir).path == table.path
+
+    # other lowercasing options compile a separate table
+    cased = load_lemma_table(tsv_path, cache_dir=cache_dir)
+    assert cased.path != table.path
+    assert cased.get("Chevaux") == "cheval"
+    table.close()
+
+
+def test_lemma_table_unwritable_cache_dir(tmp_path):
+    tsv_path = str(tmp_path / "tm-fr-all-v2.0.vocab.lemmatization.tsv.gz")
+    write_tsv(tsv_path)
+    # a directory below a regular file can never be created
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+
+    table = load_lemma_table(tsv_path, lowercase_keys=True, cache_dir=str(blocker / "lemmas"))
+
+    assert table == read_lemmatization_tsv(tsv_path, lowercase_keys=True)
+    assert sorted(os.listdir(tmp_path)) == sorted(["blocker", os.path.basename(tsv_path)])
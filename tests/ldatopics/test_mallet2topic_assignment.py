@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from impresso_pipelines.ldatopics.mallet2topic_assignment_jsonl import Mallet2TopicAssignment
+
+
+def reference_topics(distribution, min_p, precision, topic_id_format):
+    # per-row conversion as done before block conversion
+    return [
+        {"t": topic_id_format.format(t=t), "p": round(p, precision)}
+        for t, p in sorted(enumerate(distribution), key=lambda x: x[1], reverse=True)
+        if p >= min_p
+    ]
+
+
+def test_block_conversion_matches_rows(tmp_path):
+    rng = np.random.default_rng(0)
+    matrix = rng.dirichlet(np.full(100, 0.05), size=50)
+    matrix[0, 3] = matrix[0, 5] = 0.0625  # ties keep topic order
+    doctopics = tmp_path / "doctopics.tsv"
+    with open(doctopics, "w", encoding="utf-8") as f:
+        f.write("#doc name topic proportion ...\n")
+        for i, row in enumerate(matrix):
+            f.write(f"{i}\tdata/GDL-1900-01-02-a-i{i:04d}.txt\t" + "\t".join(map(repr, row)) + "\n")
+
+    converter = Mallet2TopicAssignment(
+        min_p=0.02,
+        lang="fr",
+        topic_model="tm-fr-all-v2.0",
+        numeric_topic_ids=False,
+        input_format_type="matrix",
+        topic_count=100,
+        output="<generator>",
+        no_jsonschema_validation=True,
+    )
+    results = list(converter.convert_doctopics_files([str(doctopics)]))
+
+    assert len(results) == 50
+    assert results[1]["ci_id"] == "GDL-1900-01-02-a-i0001"
+    for row, result in zip(matrix, results):
+        assert result["topics"] == reference_topics(
+            row.tolist(), 0.02, converter.precision, converter.topic_id_format
+        )
+
+    # blocks of any size give the same result
+    names, block = next(converter.read_matrix_blocks([str(doctopics)], block_size=7))
+    assert block.shape == (7, 100)
+    assert converter.convert_matrix(names, block) == results[:7]
+    assert converter.convert_distribution(names[0], block[0]) == results[0]
+
+
+def test_ragged_matrix_block_raises(tmp_path):
+    doctopics = tmp_path / "doctopics.tsv"
+    with open(doctopics, "w", encoding="utf-8") as f:
+        # 3 + 5 values would reshape to (2, 4) without a per-row check
+        f.write("0\tdata/GDL-1900-01-02-a-i0000.txt\t0.5\t0.3\t0.2\n")
+        f.write("1\tdata/GDL-1900-01-02-a-i0001.txt\t0.2\t0.2\t0.2\t0.2\t0.2\n")
+
+    converter = Mallet2TopicAssignment(
+        min_p=0.02,
+        lang="fr",
+        topic_model="tm-fr-all-v2.0",
+        numeric_topic_ids=False,
+        input_format_type="matrix",
+        topic_count=3,
+        output="<generator>",
+        no_jsonschema_validation=True,
+    )
+    with pytest.raises(ValueError, match="i0001"):
+        next(converter.read_matrix_blocks([str(doctopics)]))
@@ -491,3 +491,86 @@ def test_all_at_once_lb():
     assert result['uid'] == 'test_name_lb'
     assert result['min_relevance'] == 0.05
 
+
+
+def test_model_resolved_once():
+    lda_pipeline = LDATopicsPipeline()
+    text = "Un petit chien nommé Max vivait dans un village tranquille."
+
+    lda_pipeline(text, language='fr')
+    model = lda_pipeline.resolve_model('fr')
+    lda_pipeline(text, language='fr', diagnostics_topics=True)
+
+    # the per-language handle is memoized and reused for later documents
+    assert lda_pipeline.resolve_model('fr') is model
+    assert model.model_id == f"tm-fr-all-v{model.version}"
+    assert lda_pipeline.latest_model == model.version
+
+
+def test_in_process_matches_file_based():
+    text = """La vie dans un petit village est paisible et rythmée par les saisons.
+        Chaque matin, les habitants se saluent en se croisant dans les rues étroites,
+        et l’odeur du pain frais s’échappant de la boulangerie emplit l’air."""
+
+    in_process = LDATopicsPipeline()(text, language="fr", doc_name="doc-a")
+    file_based = LDATopicsPipeline(in_process=False)(text, language="fr", doc_name="doc-a")
+
+    # same structure and same topic assignments, apart from the timestamp
+    assert in_process.keys() == file_based.keys()
+    assert in_process['uid'] == file_based['uid']
+    assert in_process['topic_model_id'] == file_based['topic_model_id']
+    assert [t['uid'] for t in in_process['topics']] == [t['uid'] for t in file_based['topics']]
+
+
+def test_batch():
+    lda_pipeline = LDATopicsPipeline()
+    fr_text = "La vie dans un petit village est paisible et rythmée par les saisons."
+    de_text = "Ein kleiner Hund namens Max lebte in einem ruhigen Dorf."
+    docs = [
+        {"id": "doc-fr-1", "text": fr_text},
+        {"id": "doc-de-1", "text": de_text, "language": "de"},
+        {"text": fr_text, "language": "fr"},
+    ]
+
+    results = lda_pipeline.batch(docs, diagnostics_lemmatization=True)
+
+    # one result per document, in input order
+    assert [r['language'] for r in results] == ['fr', 'de', 'fr']
+    assert results[0]['uid'] == 'doc-fr-1'
+    assert results[1]['uid'] == 'doc-de-1'
+    assert isinstance(results[2]['uid'], str)
+
+    # same output as the single-document entry point
+    single = lda_pipeline(fr_text, language="fr", doc_name="doc-fr-1")
+    assert [t['uid'] for t in results[0]['topics']] == [t['uid'] for t in single['topics']]
+    assert 'diagnostics_lemmatization' in results[1]
+
+    assert lda_pipeline.batch([]) == []
+
+
+def test_batch_file_based():
+    fr_text = "La vie dans un petit village est paisible et rythmée par les saisons."
+    docs = [
+        {"id": "doc-fr-1", "text": fr_text, "language": "fr"},
+        {"id": "doc-fr-2", "text": "Les enfants vont à l’école à pied.", "language": "fr"},
+    ]
+
+    in_process = LDATopicsPipeline().batch(docs)
+    file_based = LDATopicsPipeline(in_process=False).batch(docs)
+
+    # batch honours in_process=False and yields the same topic assignments
+    assert [r['uid'] for r in file_based] == ['doc-fr-1', 'doc-fr-2']
+    for a, b in zip(in_process, file_based):
+        assert [t['uid'] for t in a['topics']] == [t['uid'] for t in b['topics']]
+
+
+def test_spacy_pipe_matches_call():
+    lda_pipeline = LDATopicsPipeline()
+    texts = [
+        "La vie dans un petit village est paisible et rythmée par les saisons.",
+        "Les enfants vont à l’école à pied.",
+    ]
+    spacy_pipeline = lda_pipeline.resolve_model('fr').spacy
+
+    # streaming lemmatization yields the same lemma lists as per-text calls
+    assert list(spacy_pipeline.pipe(texts, batch_size=1)) == [spacy_pipeline(t) for t in texts]
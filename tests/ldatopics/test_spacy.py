@@ -0,0 +1,27 @@
+import os
+import tarfile
+
+from impresso_pipelines.ldatopics import SPACY as spacy_module
+from impresso_pipelines.ldatopics.SPACY import SPACY
+
+
+def test_extracted_model_cache(tmp_path, monkeypatch):
+    # build a minimal model archive and place it in the tarball cache
+    model_dir = tmp_path / "src" / "fr_model" / "fr_model-1.0"
+    model_dir.mkdir(parents=True)
+    (model_dir / "config.cfg").write_text("[nlp]\n")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    with tarfile.open(cache_dir / "fr_model.tar.gz", "w:gz") as tar:
+        tar.add(tmp_path / "src" / "fr_model", arcname="fr_model")
+    monkeypatch.setattr(spacy_module, "SPACY_MODEL_CACHE_DIR", str(cache_dir))
+
+    spacy_pipeline = object.__new__(SPACY)
+    first = spacy_pipeline.download_and_extract_model("https://example.org/fr_model.tar.gz")
+    second = spacy_pipeline.download_and_extract_model("https://example.org/fr_model.tar.gz")
+
+    # extracted once, into a directory named after the archive digest
+    assert first == second
+    assert os.path.isfile(os.path.join(first, "config.cfg"))
+    assert os.listdir(cache_dir / "extracted") == [os.path.basename(first)]
+    assert os.path.basename(first) == SPACY.archive_digest(str(cache_dir / "fr_model.tar.gz"))
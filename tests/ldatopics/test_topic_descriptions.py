@@ -0,0 +1,25 @@
+import bz2
+import json
+import os
+
+from impresso_pipelines.ldatopics.topic_descriptions import build_topic_words, load_topic_words
+
+
+def test_topic_word_index(tmp_path):
+    descriptions_path = str(tmp_path / "tm-fr-all-v2.0.topic_model_topic_description.jsonl.bz2")
+    with bz2.open(descriptions_path, "wt", encoding="utf-8") as f:
+        word_probs = [{"word": f"w{i}", "prob": i / 100} for i in range(20)]
+        f.write(json.dumps({"id": "tm-fr-all-v2.0_tp00_fr", "word_probs": word_probs}) + "\n")
+        f.write(json.dumps({"id": "tm-fr-all-v2.0_tp01_fr"}) + "\n")
+    cache_dir = str(tmp_path / "index")
+
+    index = load_topic_words(descriptions_path, cache_dir=cache_dir)
+
+    # top-10 words by decreasing probability, as the diagnostics used to compute
+    assert index["tm-fr-all-v2.0_tp00_fr"] == [f"w{i}" for i in range(19, 9, -1)]
+    assert index["tm-fr-all-v2.0_tp01_fr"] == []
+    assert build_topic_words(descriptions_path, k=2)["tm-fr-all-v2.0_tp00_fr"] == ["w19", "w18"]
+
+    # persisted once and served from the cache afterwards
+    assert len(os.listdir(cache_dir)) == 1
+    assert load_topic_words(descriptions_path, cache_dir=cache_dir) == index
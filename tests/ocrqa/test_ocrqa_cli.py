@@ -0,0 +1,60 @@
+"""
+Tests for the impresso-ocrqa command-line runner.
+"""
+
+import bz2
+import json
+
+from impresso_pipelines.ocrqa.cli import main
+from impresso_pipelines.ocrqa.ocrqa_pipeline import OCRQAError, OCRQAPipeline
+
+SAMPLE_TEXTS = [
+    "Ein kleiner Hund namens Max lebte in einem ruhigen Dorf.",
+    "Un petit chien nommé Max vivait dans un village tranquille.",
+    "De Max huet gär am Gaart mat senge Frënn gespillt.",
+]
+
+
+def test_cli_scores_jsonl_in_input_order(tmp_path):
+    """Test the runner scores a bz2 JSONL file with workers, keeping input order."""
+    input_path = tmp_path / "items.jsonl.bz2"
+    output_path = tmp_path / "scores.jsonl"
+    items = [{"id": f"doc-{i}", "ft": SAMPLE_TEXTS[i % 3]} for i in range(30)]
+    with bz2.open(input_path, "wt", encoding="utf-8") as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    main([str(input_path), "-o", str(output_path), "--workers", "2", "--batch-size", "4", "--model-id"])
+
+    with open(output_path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["id"] for r in records] == [item["id"] for item in items]
+
+    expected = OCRQAPipeline().batch([item["ft"] for item in items], model_id=True)
+    assert [{k: v for k, v in r.items() if k != "id"} for r in records] == expected
+
+
+class _VersionedPipeline:
+    """Scores every language but 'lb', which has no BloomFilter of the requested version."""
+
+    def batch(self, texts, languages, **kwargs):
+        if "lb" in languages:
+            raise OCRQAError("Failed to download or load BloomFilter for lb v9.9.9")
+        return [{"language": language, "score": 1.0} for language in languages]
+
+
+def test_cli_writes_error_records_for_unscorable_items(monkeypatch):
+    """Test one unscorable item gets an error record instead of aborting the chunk."""
+    from impresso_pipelines.ocrqa import cli
+
+    monkeypatch.setattr(cli, "_worker_pipeline", _VersionedPipeline())
+    monkeypatch.setattr(cli, "_worker_options", {
+        "id_field": "id", "text_field": "ft", "language_field": "lg", "version": "9.9.9",
+        "diagnostics": False, "model_id": False, "token_score": False,
+    })
+    items = [{"id": "a", "ft": "x", "lg": "fr"}, {"id": "b", "ft": "y", "lg": "lb"}]
+
+    records = cli._score_items(items)
+
+    assert records[0] == {"id": "a", "language": "fr", "score": 1.0}
+    assert records[1]["id"] == "b" and "lb v9.9.9" in records[1]["error"]
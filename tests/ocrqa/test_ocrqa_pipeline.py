@@ -6,8 +6,11 @@ including basic functionality, diagnostics, version-specific behavior,
 and v2 normalization features.
 """
 
+import json
+import os
+
 import pytest
-from impresso_pipelines.ocrqa.ocrqa_pipeline import OCRQAPipeline, subtokens
+from impresso_pipelines.ocrqa.ocrqa_pipeline import OCRQAPipeline, normalize_text, subtokens
 
 
 # Test fixtures and constants
@@ -279,3 +282,155 @@ def _assert_decimal_precision(value: int | float, max_precision: int, descriptio
         decimals = len(value_str.split('.')[1])
         assert decimals <= max_precision, \
             f"{description} precision should be {max_precision}, but got {decimals} decimal places"
+
+
+def test_ocrqa_pipeline_batch(pipeline):
+    """Test batch scoring matches single-text scoring, in input order."""
+    texts = [SAMPLE_TEXT_DE, SAMPLE_TEXT_FR, SAMPLE_TEXT_LB, SAMPLE_TEXT_FR]
+    languages = [None, "fr", "lb", None]
+
+    results = pipeline.batch(texts, languages=languages, diagnostics=True)
+
+    assert len(results) == len(texts), "Batch should return one result per text"
+    assert [r['language'] for r in results] == ['de', 'fr', 'lb', 'fr']
+    for text, language, result in zip(texts, languages, results):
+        assert result == pipeline(text, language=language, diagnostics=True), \
+            "Batch result should equal the single-text result"
+
+    versioned = pipeline.batch([SAMPLE_TEXT_DE], version="1.0.5", model_id=True)
+    assert versioned[0]['model_id'] == 'ocrqa-wp_v1.0.5-de'
+    assert pipeline.batch([]) == []
+
+    with pytest.raises(ValueError):
+        pipeline.batch(texts, languages=["de"])
+
+
+def test_v2_tokenizer_possessive_split():
+    """Test the precompiled v2 tokenizer splits possessives in a single pass."""
+    from impresso_pipelines.ocrqa.ocrqa_pipeline import V2Tokenizer
+
+    tokenizer = V2Tokenizer()
+    assert tokenizer("it's l'auto ~~~ well-known") == ['it', "'s", "l'", 'auto', '~~~', 'well-known']
+    assert tokenizer("that's what's") == ['that', "'s", 'what', "'s"]
+    assert tokenizer("rock'n'roll qu'il") == ["rock'n'roll", "qu'il"]
+    assert tokenizer("x'y-z'w __ ##") == ["x'", 'y-z', "'w", '__', '##']
+    assert subtokens("It's OK!!", version="2.0.0") == ['it', "'s", 'ok', '!!']
+
+
+def test_ocrqa_pipeline_token_cache():
+    """Test the optional token cache gives identical results and reports hits."""
+    cached_pipeline = OCRQAPipeline(token_cache_size=1000)
+    texts = [SAMPLE_TEXT_DE, SAMPLE_TEXT_DE, SAMPLE_TEXT_FR]
+    languages = ["de", "de", "fr"]
+
+    results = cached_pipeline.batch(texts, languages=languages, diagnostics=True)
+    assert results == OCRQAPipeline().batch(texts, languages=languages, diagnostics=True)
+
+    stats = cached_pipeline.token_cache_stats()
+    assert set(stats) == {
+        results[0]['diagnostics']['model_id'],
+        results[2]['diagnostics']['model_id'],
+    }
+    de_stats = stats[results[0]['diagnostics']['model_id']]
+    assert de_stats['hits'] > 0, "Repeated text should be answered from the cache"
+    assert de_stats['hits'] + de_stats['misses'] > 0
+    assert 0 < de_stats['hit_rate'] <= 1
+    assert de_stats['size'] <= de_stats['maxsize'] == 1000
+
+
+def test_ocrqa_pipeline_window_scores(pipeline):
+    """Test window scores locate a garbled region without changing the document score."""
+    garbled = "Vn pctit chicn nornmé Mqx vivnit dnns vn villnge trnnqvillc. " * 3
+    text = SAMPLE_TEXT_FR + " " + garbled
+
+    result = pipeline(text, language="fr", granularity="window", window_size=20)
+    assert result['score'] == pipeline(text, language="fr")['score']
+
+    window_scores = result['window_scores']
+    token_count = len(subtokens(text, pipeline._resolve_latest_version("fr"), "fr"))
+    assert len(window_scores) == -(-token_count // 20)
+    assert all(0 <= score <= 1 for score in window_scores)
+    assert window_scores[0] > window_scores[-1], "The garbled end should score lower"
+
+    overlapping = pipeline(
+        text, language="fr", granularity="window", window_size=20, window_stride=5
+    )['window_scores']
+    assert overlapping[0] == window_scores[0]
+    assert len(overlapping) > len(window_scores)
+
+    with pytest.raises(ValueError):
+        pipeline(text, language="fr", granularity="line")
+    with pytest.raises(ValueError):
+        pipeline(text, language="fr", granularity="window", window_size=0)
+    with pytest.raises(ValueError):
+        pipeline(text, language="fr", granularity="window", window_stride=0)
+    with pytest.raises(ValueError):
+        pipeline.window_scores(["a", "b"], {"a"}, window_size=2, window_stride=0)
+
+
+def test_ocrqa_pipeline_token_score(pipeline):
+    """Test the frequency-weighted score counts token occurrences in the same pass."""
+    text = SAMPLE_TEXT_FR + " xqzt xqzt xqzt xqzt"
+    result = pipeline(text, language="fr", diagnostics=True, token_score=True)
+
+    tokens = subtokens(text, pipeline._resolve_latest_version("fr"), "fr")
+    known_tokens = set(result['diagnostics']['known_tokens'])
+    expected = round(sum(token in known_tokens for token in tokens) / len(tokens), 2)
+    assert result['token_score'] == expected
+    assert result['score'] == pipeline(text, language="fr")['score']
+    assert 'token_score' not in pipeline(text, language="fr")
+
+    batch_results = pipeline.batch([text], languages=["fr"], token_score=True)
+    assert batch_results[0]['token_score'] == expected
+
+
+def test_normalize_text_golden_corpus():
+    """Test normalization matches the golden outputs of the former implementation.
+
+    The golden file holds v1 and v2 outputs, with and without NFKC, of newspaper
+    samples, apostrophe/hyphen/digit edge cases and random strings, as produced
+    by normalize_text before its protection and translation steps were fused.
+    """
+    golden_path = os.path.join(os.path.dirname(__file__), "data", "normalization_golden.jsonl")
+    with open(golden_path, encoding="utf-8") as f:
+        cases = [json.loads(line) for line in f]
+
+    assert len(cases) > 500
+    for case in cases:
+        assert normalize_text(
+            case['text'], case['version'], unicode_normalize=case['unicode_normalize']
+        ) == case['expected'], case
+
+
+def test_ocrqa_pipeline_lazy_lang_model():
+    """Test the language model is only created for detection, or reused if given."""
+    from impresso_pipelines.langident.langident_pipeline import LangIdentPipeline
+
+    pipeline = OCRQAPipeline()
+    pipeline.batch([SAMPLE_TEXT_DE, SAMPLE_TEXT_FR], languages=["de", "fr"])
+    pipeline(SAMPLE_TEXT_LB, language="lb")
+    assert pipeline._lang_model is None, "No detection needed: model should not load"
+
+    assert pipeline(SAMPLE_TEXT_DE)['language'] == 'de'
+    assert isinstance(pipeline._lang_model, LangIdentPipeline)
+
+    lang_model = pipeline.lang_model
+    shared = OCRQAPipeline(lang_model=lang_model)
+    assert shared.lang_model is lang_model
+    assert shared(SAMPLE_TEXT_FR)['language'] == 'fr'
+
+
+def test_ocrqa_pipeline_warmup(pipeline):
+    """Test warm-up loads the requested BloomFilters and reports timings."""
+    timings = pipeline.warmup(["de", "fr"], touch_pages=True)
+    latest = {lang: pipeline._resolve_latest_version(lang) for lang in ("de", "fr")}
+    assert set(timings['filters']) == {f"ocrqa-wp_v{v}-{lang}" for lang, v in latest.items()}
+    assert timings['total'] >= max(timings['filters'].values()) >= 0
+    assert {f"{lang}_{v}" for lang, v in latest.items()} <= set(pipeline.bloomfilters)
+
+    timings = pipeline.warmup(["de"], versions=["1.0.5", "0.0.0"])
+    assert list(timings['filters']) == ['ocrqa-wp_v1.0.5-de']
+    assert pipeline(SAMPLE_TEXT_DE, language="de", version="1.0.5")['score'] > 0
+
+    with pytest.raises(ValueError):
+        pipeline.warmup(["xx"])
@@ -0,0 +1,109 @@
+"""
+Tests for BloomFilters preloaded once and shared with OCRQA worker processes.
+"""
+
+import multiprocessing
+import os
+import pickle
+
+import pytest
+from pybloomfilter import BloomFilter
+
+from impresso_pipelines.ocrqa.ocrqa_pipeline import OCRQAPipeline, SharedBloomFilters
+
+PROBES = 50_000
+
+fork_only = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods()
+    or not os.path.exists("/proc/self/smaps"),
+    reason="requires fork and /proc/self/smaps (Linux)",
+)
+
+
+def _mapping_memory_kb(path):
+    """Return the resident (Rss) and proportional (Pss) memory of a mapped file in kB."""
+    path = os.path.realpath(path)
+    rss = pss = 0
+    in_mapping = False
+    with open("/proc/self/smaps") as f:
+        for line in f:
+            fields = line.split()
+            if "-" in fields[0] and not fields[0].endswith(":"):
+                in_mapping = fields[-1] == path
+            elif in_mapping and fields[0] == "Rss:":
+                rss += int(fields[1])
+            elif in_mapping and fields[0] == "Pss:":
+                pss += int(fields[1])
+    return rss, pss
+
+
+def _probe_and_measure(shared, barrier, results):
+    bf = shared.get("fr", "2.0.0")
+    for i in range(PROBES):
+        _ = f"token-{i}" in bf
+    # Measure while all workers map the filter, then exit together
+    barrier.wait()
+    results.put(_mapping_memory_kb(shared.paths["fr_2.0.0"]))
+    barrier.wait()
+
+
+@pytest.fixture
+def shared(tmp_path):
+    path = str(tmp_path / "ocrqa-wp_v2.0.0-fr.bloom")
+    bf = BloomFilter(5_000_000, 0.001, path)
+    bf.update(["chien", "village", "tranquille"])
+    bf.close()
+    shared = SharedBloomFilters({"fr_2.0.0": path})
+    shared.open_all()
+    return shared
+
+
+def test_shared_bloomfilters_pickle_paths_only(shared):
+    """Test pickling sends the paths only and reopens the filters on use."""
+    data = pickle.dumps(shared)
+    assert len(data) < 1024
+
+    restored = pickle.loads(data)
+    assert restored.paths == shared.paths
+    bf = restored.get("fr", "2.0.0")
+    assert bf.read_only
+    assert "chien" in bf and "hund" not in bf
+    assert restored.get("de", "2.0.0") is None
+
+
+@fork_only
+def test_shared_bloomfilters_memory_flat_across_workers(shared):
+    """Test the filter pages are resident once however many workers probe them."""
+    file_kb = os.path.getsize(shared.paths["fr_2.0.0"]) // 1024
+    ctx = multiprocessing.get_context("fork")
+
+    for workers in (1, 2, 4):
+        barrier = ctx.Barrier(workers)
+        results = ctx.Queue()
+        processes = [
+            ctx.Process(target=_probe_and_measure, args=(shared, barrier, results))
+            for _ in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        measures = [results.get(timeout=60) for _ in processes]
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        # Every worker sees (almost) the whole filter resident...
+        assert all(rss >= 0.9 * file_kb for rss, _ in measures)
+        # ...but the pages are shared: their total cost does not grow with workers
+        assert sum(pss for _, pss in measures) <= 1.1 * file_kb
+
+
+def test_ocrqa_pipeline_with_shared_bloomfilters():
+    """Test worker pipelines score with BloomFilters preloaded by a parent pipeline."""
+    text = "Un petit chien nommé Max vivait dans un village tranquille."
+    parent = OCRQAPipeline()
+    shared = parent.preload_bloomfilters(["fr"])
+    assert list(shared.paths) == [f"fr_{parent._resolve_latest_version('fr')}"]
+
+    worker = OCRQAPipeline(shared_bloomfilters=pickle.loads(pickle.dumps(shared)))
+    assert worker(text, language="fr") == parent(text, language="fr")
+    assert all(bf.read_only for bf in worker.bloomfilters.values())
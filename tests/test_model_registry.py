@@ -0,0 +1,104 @@
+"""
+Tests for the shared model registry.
+
+These tests replace the Hugging Face Hub listing with a local stub, so they
+run without network access.
+"""
+
+import json
+import os
+
+import huggingface_hub
+import pytest
+
+from impresso_pipelines.model_registry import ModelRegistry, parse_version
+
+
+REPO_ID = "impresso-project/example-repo"
+REPO_FILES = [
+    "README.md",
+    "langident-v1.0.0.bin",
+    "langident-v1.10.0.bin",
+    "langident-v1.9.2.bin",
+]
+
+
+@pytest.fixture
+def hub_calls(monkeypatch):
+    """Replace list_repo_files with a stub that records its calls."""
+    calls = []
+    monkeypatch.delenv("HF_HUB_OFFLINE", raising=False)
+
+    def fake_list_repo_files(repo_id, revision="main"):
+        calls.append((repo_id, revision))
+        return list(REPO_FILES)
+
+    monkeypatch.setattr(huggingface_hub, "list_repo_files", fake_list_repo_files)
+    return calls
+
+
+def test_listing_is_resolved_once(tmp_path, hub_calls):
+    """Repeated lookups are served from memory without hub requests."""
+    registry = ModelRegistry(cache_dir=str(tmp_path), ttl=3600)
+
+    assert registry.list_repo_files(REPO_ID) == sorted(REPO_FILES)
+    assert registry.list_repo_files(REPO_ID) == sorted(REPO_FILES)
+    assert hub_calls == [(REPO_ID, "main")]
+
+
+def test_manifest_is_shared_across_registries(tmp_path, hub_calls):
+    """A new registry (e.g., a new worker) reuses the manifest on disk."""
+    ModelRegistry(cache_dir=str(tmp_path), ttl=3600).list_repo_files(REPO_ID)
+    offline_registry = ModelRegistry(cache_dir=str(tmp_path), ttl=3600, offline=True)
+
+    assert offline_registry.list_repo_files(REPO_ID) == sorted(REPO_FILES)
+    assert len(hub_calls) == 1
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_expired_manifest_is_refreshed(tmp_path, hub_calls):
+    """Manifests older than the TTL trigger a new hub listing."""
+    ModelRegistry(cache_dir=str(tmp_path), ttl=0).list_repo_files(REPO_ID)
+    ModelRegistry(cache_dir=str(tmp_path), ttl=0).list_repo_files(REPO_ID)
+
+    assert len(hub_calls) == 2
+
+
+def test_stale_manifest_used_when_hub_unreachable(tmp_path, hub_calls, monkeypatch):
+    """An expired manifest is still served if the hub cannot be reached."""
+    ModelRegistry(cache_dir=str(tmp_path), ttl=0).list_repo_files(REPO_ID)
+
+    def unreachable(repo_id, revision="main"):
+        raise ConnectionError("no network")
+
+    monkeypatch.setattr(huggingface_hub, "list_repo_files", unreachable)
+    registry = ModelRegistry(cache_dir=str(tmp_path), ttl=0)
+
+    assert registry.list_repo_files(REPO_ID) == sorted(REPO_FILES)
+
+
+def test_offline_without_manifest_raises(tmp_path, hub_calls):
+    """Offline mode never contacts the hub."""
+    registry = ModelRegistry(cache_dir=str(tmp_path), offline=True)
+
+    with pytest.raises(RuntimeError):
+        registry.list_repo_files(REPO_ID)
+    assert hub_calls == []
+
+
+def test_resolve_latest_is_persisted(tmp_path, hub_calls):
+    """The newest version is selected numerically and pinned in the manifest."""
+    registry = ModelRegistry(cache_dir=str(tmp_path), ttl=3600)
+    pattern = r"^langident-v(\d+\.\d+\.\d+)\.bin$"
+
+    assert registry.resolve_latest(REPO_ID, pattern) == "langident-v1.10.0.bin"
+    assert registry.resolve_latest(REPO_ID, r"^missing-v(\d+)$") is None
+
+    (manifest_file,) = tmp_path.iterdir()
+    manifest = json.loads(manifest_file.read_text())
+    assert manifest["latest"][pattern] == "langident-v1.10.0.bin"
+
+
+def test_parse_version():
+    """Versions compare numerically rather than lexically."""
+    assert parse_version("2.10.0") > parse_version("2.9.1")